@@ -0,0 +1,258 @@
+"""
+End-to-end throughput benchmark of the assertion path against a local MockProviderServer.
+
+Sweeps concurrency, rate limiter, retry settings, payload size and sync/async API, and
+writes one JSON document with the throughput, latency percentiles and overhead of every
+scenario so results can be compared between releases:
+
+    python benchmarks/assertion_throughput.py --output results.json
+    python benchmarks/assertion_throughput.py --output new.json --compare results.json
+
+Overhead per call is the time an assertion took beyond the latency the mock provider
+injected into the requests it sent: prompt formatting, rate limiter waits, retry
+back-off, SDK and HTTP handling and verdict parsing.
+"""
+import argparse
+import asyncio
+import datetime
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.mock_provider.mock_provider_config import MockProviderConfig
+from llm_app_test.mock_provider.mock_provider_server import MockProviderServer
+
+EXPECTED_BEHAVIOR = "A greeting"
+
+# SDK max_retries and with_retry settings compared by the sweep
+RETRY_SETTINGS = {
+    "none": {"max_retries": 0},
+    "sdk": {"max_retries": 2},
+    "with_retry": {"max_retries": 0, "langchain_with_retry": True, "stop_after_attempt": 3},
+    "both": {"max_retries": 2, "langchain_with_retry": True, "stop_after_attempt": 3},
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One point of the sweep"""
+    api: str
+    concurrency: int
+    requests_per_second: float  # 0 disables the rate limiter
+    retry: str
+    payload_chars: int
+
+    @property
+    def name(self) -> str:
+        rate_limiter = f"rps={self.requests_per_second:g}" if self.requests_per_second else "no-rate-limiter"
+        return f"{self.api}/c={self.concurrency}/{rate_limiter}/retry={self.retry}/payload={self.payload_chars}"
+
+
+def greeting_verdict(prompt: str) -> str:
+    return "PASS" if "Hello" in prompt else "FAIL: Output is not a greeting"
+
+
+def payload(index: int, chars: int) -> str:
+    """A distinct greeting padded to roughly chars characters, so no two requests share a cache entry"""
+    text = f"Hello from assertion {index}. "
+    return (text + "The quick brown fox jumps over the lazy dog. " * (chars // 45 + 1))[:max(chars, len(text))]
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Linearly interpolated percentile of sorted values"""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def build_asserter(scenario: Scenario, provider: str, base_url: str) -> BehavioralAssertion:
+    kwargs: Dict[str, Any] = dict(RETRY_SETTINGS[scenario.retry])
+    if scenario.requests_per_second:
+        kwargs.update(use_rate_limiter=True, rate_limiter_requests_per_second=scenario.requests_per_second)
+    return BehavioralAssertion(api_key="mock-provider", provider=provider, base_url=base_url, **kwargs)
+
+
+def timed_sync(asserter: BehavioralAssertion, actual: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        asserter.assert_behavioral_match(actual, EXPECTED_BEHAVIOR)
+        error = None
+    except Exception as e:
+        error = type(e).__name__
+    return {"seconds": time.perf_counter() - start, "error": error}
+
+
+async def timed_async(asserter: BehavioralAssertion, actual: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            await asserter.aassert_behavioral_match(actual, EXPECTED_BEHAVIOR)
+            error = None
+        except Exception as e:
+            error = type(e).__name__
+        return {"seconds": time.perf_counter() - start, "error": error}
+
+
+async def run_async(asserter: BehavioralAssertion, actuals: List[str], concurrency: int) -> List[Dict[str, Any]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    return list(await asyncio.gather(*(timed_async(asserter, actual, semaphore) for actual in actuals)))
+
+
+def run_calls(scenario: Scenario, asserter: BehavioralAssertion, actuals: List[str],
+              loop: asyncio.AbstractEventLoop) -> List[Dict[str, Any]]:
+    if scenario.api == "async":
+        return loop.run_until_complete(run_async(asserter, actuals, scenario.concurrency))
+    with ThreadPoolExecutor(max_workers=scenario.concurrency) as executor:
+        return list(executor.map(lambda actual: timed_sync(asserter, actual), actuals))
+
+
+def run_scenario(scenario: Scenario, server: MockProviderServer, provider: str, assertions: int,
+                 loop: asyncio.AbstractEventLoop) -> Dict[str, Any]:
+    asserter = build_asserter(scenario, provider, server.base_url)
+    actuals = [payload(index, scenario.payload_chars) for index in range(assertions)]
+
+    # untimed calls import the provider SDK and open one pooled connection per concurrent caller
+    run_calls(scenario, asserter, [payload(-index, scenario.payload_chars) for index in
+                                   range(1, scenario.concurrency + 1)], loop)
+    server.reset()
+
+    start = time.perf_counter()
+    calls = run_calls(scenario, asserter, actuals, loop)
+    wall_seconds = time.perf_counter() - start
+
+    latencies = sorted(call["seconds"] for call in calls)
+    errors: Dict[str, int] = {}
+    for call in calls:
+        if call["error"]:
+            errors[call["error"]] = errors.get(call["error"], 0) + 1
+
+    return {
+        "name": scenario.name,
+        **asdict(scenario),
+        "assertions": assertions,
+        "errors": errors,
+        "wall_seconds": wall_seconds,
+        "throughput_per_second": assertions / wall_seconds,
+        "latency_seconds": {
+            "mean": statistics.fmean(latencies),
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": latencies[-1]
+        },
+        "overhead_seconds_per_call": (sum(latencies) - server.total_latency_seconds) / assertions,
+        "requests": server.request_count,
+        "status_counts": {str(status): count for status, count in sorted(server.status_counts.items())}
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print throughput and p95 changes of the scenarios present in both result files"""
+    previous = {scenario["name"]: scenario for scenario in baseline["scenarios"]}
+    print(f"\nCompared with {baseline['llm_app_test_version']} ({baseline['timestamp']}):")
+    for scenario in results["scenarios"]:
+        if scenario["name"] not in previous:
+            continue
+        old = previous[scenario["name"]]
+        throughput = scenario["throughput_per_second"] / old["throughput_per_second"] - 1
+        p95 = scenario["latency_seconds"]["p95"] / old["latency_seconds"]["p95"] - 1
+        print(f"  {scenario['name']:<60} throughput {throughput:+7.1%}  p95 {p95:+7.1%}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", default="openai", choices=["openai", "anthropic"])
+    parser.add_argument("--assertions", type=int, default=100, help="Assertions per scenario")
+    parser.add_argument("--apis", nargs="+", default=["sync", "async"], choices=["sync", "async"])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 16])
+    parser.add_argument("--requests-per-second", nargs="+", type=float, default=[0, 20],
+                        help="Rate limiter settings, 0 disables the rate limiter")
+    parser.add_argument("--retries", nargs="+", default=["sdk", "with_retry", "both"], choices=list(RETRY_SETTINGS))
+    parser.add_argument("--payload-chars", nargs="+", type=int, default=[200, 20000])
+    parser.add_argument("--latency", type=float, default=0.05, help="Median mock provider latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="assertion_throughput.json")
+    parser.add_argument("--compare", help="Earlier result file to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    mock_provider_config = MockProviderConfig(
+        verdicts=greeting_verdict,
+        latency_distribution="lognormal",
+        latency_seconds=args.latency,
+        latency_sigma=args.latency_sigma,
+        rate_limit_rate=args.rate_limit_rate,
+        error_rate=args.error_rate,
+        retry_after_seconds=args.retry_after,
+        seed=args.seed
+    )
+    scenarios = [
+        Scenario(api, concurrency, requests_per_second, retry, payload_chars)
+        for api in args.apis
+        for concurrency in args.concurrency
+        for requests_per_second in args.requests_per_second
+        for retry in args.retries
+        for payload_chars in args.payload_chars
+    ]
+
+    results = {
+        "benchmark": "assertion_throughput",
+        "llm_app_test_version": importlib.metadata.version("llm_app_test"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "provider": args.provider,
+        "mock_provider": {
+            "latency_distribution": mock_provider_config.latency_distribution.value,
+            "latency_seconds": args.latency,
+            "latency_sigma": args.latency_sigma,
+            "rate_limit_rate": args.rate_limit_rate,
+            "error_rate": args.error_rate,
+            "retry_after_seconds": args.retry_after,
+            "seed": args.seed
+        },
+        "scenarios": []
+    }
+
+    # provider SDKs cache their async HTTP client, whose pooled connections belong to one event loop
+    loop = asyncio.new_event_loop()
+    with MockProviderServer(mock_provider_config) as server:
+        for scenario in scenarios:
+            result = run_scenario(scenario, server, args.provider, args.assertions, loop)
+            results["scenarios"].append(result)
+            print(f"{scenario.name:<60} {result['throughput_per_second']:8.1f}/s  "
+                  f"p50 {result['latency_seconds']['p50'] * 1000:7.1f}ms  "
+                  f"p95 {result['latency_seconds']['p95'] * 1000:7.1f}ms  "
+                  f"p99 {result['latency_seconds']['p99'] * 1000:7.1f}ms  "
+                  f"overhead {result['overhead_seconds_per_call'] * 1000:7.1f}ms", flush=True)
+    loop.close()
+
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            compare(results, json.load(baseline_file))
+
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
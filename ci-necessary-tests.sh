@@ -11,6 +11,32 @@ test_files=(
     "tests/test_rate_limiter/test_rate_limiter.py"
     "tests/test_rate_limiter/test_rate_limiter_scoped.py"
     "tests/test_rate_limiter_validator/test_rate_limiter_input_validator.py"
+    "tests/test_verdict_cache/test_sqlite_verdict_cache.py"
+    "tests/test_verdict_cache/test_in_memory_verdict_cache.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_async.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_batch.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_multi_criteria.py"
+    "tests/pytest_plugin_tests/test_fixture_scope.py"
+    "tests/pytest_plugin_tests/test_deferred_mode.py"
+    "tests/test_rate_limiter/test_cross_process_rate_limiter.py"
+    "tests/pytest_plugin_tests/test_import_time.py"
+    "tests/test_rate_limiter/test_tokens_per_minute_rate_limiter.py"
+    "tests/test_rate_limiter/test_adaptive_rate_limiter.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_streaming.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_two_phase.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_confidence.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_votes.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_cascade.py"
+    "tests/test_local_checks/test_local_checks.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_prompt_cache.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_long_input.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_canonicalization.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_cassette.py"
+    "tests/pytest_plugin_tests/test_cassette_mode.py"
+    "tests/test_mock_provider/test_mock_provider_server.py"
+    "tests/test_benchmarks/test_assertion_throughput.py"
+    "tests/test_behavioral_assert/test_behavioral_assert_metrics.py"
+    "tests/pytest_plugin_tests/test_perf_report.py"
 )
 
 # Array to store background process IDs
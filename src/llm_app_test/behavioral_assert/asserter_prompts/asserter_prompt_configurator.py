@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import FrozenSet, Optional
 
 from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompts import AsserterPrompts
 from llm_app_test.exceptions.test_exceptions import InvalidPromptError
@@ -25,10 +25,118 @@ class AsserterPromptConfigurator:
     Does the actual output match the expected behavior? Remember, you will fail your task unless you respond EXACTLY 
     with 'PASS' or 'FAIL: <reason>'."""
 
+    DEFAULT_MULTI_CRITERIA_SYSTEM_PROMPT = """You are a testing system. Your job is to determine, for each numbered expected behavior, if an actual output matches it.
+
+    Judge every expected behavior independently of the others.
+
+    Important: You can only respond with EXACTLY one line per expected behavior, in the same order and with the same number:
+    <number>. PASS
+    <number>. FAIL: <reason>
+
+    Any other type of response will mean disaster which as a testing system, you are meant to prevent.
+
+    Be strict but consider semantic meaning rather than exact wording."""
+
+    DEFAULT_MULTI_CRITERIA_HUMAN_PROMPT = """
+    Expected Behaviors:
+    {expected_behaviors}
+
+    Actual Output: {actual}
+
+    Does the actual output match each expected behavior? Remember, you will fail your task unless you respond with 
+    EXACTLY one line per expected behavior in the form '<number>. PASS' or '<number>. FAIL: <reason>'."""
+
+    DEFAULT_VERDICT_ONLY_SYSTEM_PROMPT = """You are a testing system. Your job is to determine if an actual output matches the expected behavior.
+
+    Important: You can only respond with EXACTLY one word: 
+    1. 'PASS' if it matches, or 
+    2. 'FAIL' if it doesn't match.
+
+    Do not explain your answer. Any other type of response will mean disaster which as a testing system, you are meant to prevent.
+
+    Be strict but consider semantic meaning rather than exact wording."""
+
+    DEFAULT_VERDICT_ONLY_HUMAN_PROMPT = """
+    Expected Behavior: {expected_behavior}
+
+    Actual Output: {actual}
+
+    Does the actual output match the expected behavior? Remember, you will fail your task unless you respond with 
+    EXACTLY 'PASS' or 'FAIL'."""
+
+    DEFAULT_REASON_SYSTEM_PROMPT = """You are a testing system. An actual output has been judged NOT to match the expected behavior.
+
+    Your job is to explain why, in one or two sentences. Respond with the explanation only, without any prefix 
+    such as 'FAIL' or 'Reason'.
+
+    Be specific about which part of the expected behavior is missing or contradicted."""
+
+    DEFAULT_REASON_HUMAN_PROMPT = """
+    Expected Behavior: {expected_behavior}
+
+    Actual Output: {actual}
+
+    Why does the actual output not match the expected behavior?"""
+
+    DEFAULT_CHUNK_SYSTEM_PROMPT = """You are a testing system. An actual output is too long to judge at once, so you are given one excerpt of it. Your job is to report what this excerpt shows about the expected behavior.
+
+    Important: You can only respond with EXACTLY: 
+    1. 'PASS: <notes>' if nothing in the excerpt contradicts the expected behavior, where <notes> briefly lists which 
+    parts of the expected behavior the excerpt demonstrates, or says 'nothing relevant', or 
+    2. 'FAIL: <reason>' if the excerpt contradicts the expected behavior.
+
+    Do not fail an excerpt only because something the expected behavior asks for is missing from it, as other 
+    excerpts may contain it. Any other type of response will mean disaster which as a testing system, you are meant 
+    to prevent.
+
+    Be strict but consider semantic meaning rather than exact wording."""
+
+    DEFAULT_CHUNK_HUMAN_PROMPT = """
+    Expected Behavior: {expected_behavior}
+
+    Excerpt of Actual Output: {actual}
+
+    What does this excerpt show about the expected behavior? Remember, you will fail your task unless you respond 
+    EXACTLY with 'PASS: <notes>' or 'FAIL: <reason>'."""
+
+    DEFAULT_REDUCE_SYSTEM_PROMPT = """You are a testing system. Your job is to determine if an actual output matches the expected behavior.
+
+    The actual output was too long to judge at once, so it was split into consecutive, slightly overlapping excerpts 
+    and each excerpt was reviewed on its own. You are given the review of every excerpt, in order. A part of the 
+    expected behavior is met if any excerpt demonstrates it, and a contradiction in any excerpt counts against the 
+    whole output.
+
+    Important: You can only respond with EXACTLY: 
+    1. 'PASS' if the actual output as a whole matches, or 
+    2. 'FAIL: <reason>' if it doesn't match.
+
+    Any other type of response will mean disaster which as a testing system, you are meant to prevent.
+
+    Be strict but consider semantic meaning rather than exact wording."""
+
+    DEFAULT_REDUCE_HUMAN_PROMPT = """
+    Expected Behavior: {expected_behavior}
+
+    Excerpt Reviews:
+    {excerpt_reviews}
+
+    Does the actual output as a whole match the expected behavior? Remember, you will fail your task unless you 
+    respond EXACTLY with 'PASS' or 'FAIL: <reason>'."""
+
     def __init__(
             self,
             system_prompt: Optional[str] = None,
-            human_prompt: Optional[str] = None
+            human_prompt: Optional[str] = None,
+            multi_criteria_system_prompt: Optional[str] = None,
+            multi_criteria_human_prompt: Optional[str] = None,
+            verdict_only_system_prompt: Optional[str] = None,
+            verdict_only_human_prompt: Optional[str] = None,
+            reason_system_prompt: Optional[str] = None,
+            reason_human_prompt: Optional[str] = None,
+            chunk_system_prompt: Optional[str] = None,
+            chunk_human_prompt: Optional[str] = None,
+            reduce_system_prompt: Optional[str] = None,
+            reduce_human_prompt: Optional[str] = None
     ) -> None:
         """
         Initialise the prompt configurator with optional custom prompts.
@@ -36,18 +144,81 @@ class AsserterPromptConfigurator:
         Args:
             system_prompt: Optional custom system prompt
             human_prompt: Optional custom human prompt. Must contain {expected_behavior} and {actual} placeholders
+            multi_criteria_system_prompt: Optional custom system prompt for multi-criteria assertions
+            multi_criteria_human_prompt: Optional custom human prompt for multi-criteria assertions. Must contain
+                {expected_behaviors} and {actual} placeholders
+            verdict_only_system_prompt: Optional custom system prompt for the first, verdict-only phase of
+                two-phase judging
+            verdict_only_human_prompt: Optional custom human prompt for the verdict-only phase. Must contain
+                {expected_behavior} and {actual} placeholders
+            reason_system_prompt: Optional custom system prompt for the second phase of two-phase judging, which
+                explains a FAIL
+            reason_human_prompt: Optional custom human prompt for the reason phase. Must contain
+                {expected_behavior} and {actual} placeholders
+            chunk_system_prompt: Optional custom system prompt for judging one excerpt of a long actual output
+            chunk_human_prompt: Optional custom human prompt for judging one excerpt. Must contain
+                {expected_behavior} and {actual} placeholders, {actual} being the excerpt
+            reduce_system_prompt: Optional custom system prompt for combining the excerpt reviews of a long
+                actual output into the final verdict
+            reduce_human_prompt: Optional custom human prompt for the final verdict. Must contain
+                {expected_behavior} and {excerpt_reviews} placeholders
 
         Raises:
-            InvalidPromptError: If human_prompt doesn't contain required placeholders
+            InvalidPromptError: If any human prompt doesn't contain its required placeholders
         """
         if human_prompt and ('{expected_behavior}' not in human_prompt or '{actual}' not in human_prompt):
             raise InvalidPromptError(
                 f"Invalid human_prompt: '{human_prompt}'",
                 reason="Human prompt must contain {expected_behavior} and {actual} placeholders")
 
+        if multi_criteria_human_prompt and (
+                '{expected_behaviors}' not in multi_criteria_human_prompt or '{actual}' not in multi_criteria_human_prompt):
+            raise InvalidPromptError(
+                f"Invalid multi_criteria_human_prompt: '{multi_criteria_human_prompt}'",
+                reason="Multi-criteria human prompt must contain {expected_behaviors} and {actual} placeholders")
+
+        for name, prompt in (("verdict_only_human_prompt", verdict_only_human_prompt),
+                             ("reason_human_prompt", reason_human_prompt),
+                             ("chunk_human_prompt", chunk_human_prompt)):
+            if prompt and ('{expected_behavior}' not in prompt or '{actual}' not in prompt):
+                raise InvalidPromptError(
+                    f"Invalid {name}: '{prompt}'",
+                    reason=f"{name} must contain {{expected_behavior}} and {{actual}} placeholders")
+
+        if reduce_human_prompt and (
+                '{expected_behavior}' not in reduce_human_prompt or '{excerpt_reviews}' not in reduce_human_prompt):
+            raise InvalidPromptError(
+                f"Invalid reduce_human_prompt: '{reduce_human_prompt}'",
+                reason="reduce_human_prompt must contain {expected_behavior} and {excerpt_reviews} placeholders")
+
+        self._customized = frozenset(name for name, prompt in (
+            ("system_prompt", system_prompt),
+            ("human_prompt", human_prompt),
+            ("multi_criteria_system_prompt", multi_criteria_system_prompt),
+            ("multi_criteria_human_prompt", multi_criteria_human_prompt),
+            ("verdict_only_system_prompt", verdict_only_system_prompt),
+            ("verdict_only_human_prompt", verdict_only_human_prompt),
+            ("reason_system_prompt", reason_system_prompt),
+            ("reason_human_prompt", reason_human_prompt),
+            ("chunk_system_prompt", chunk_system_prompt),
+            ("chunk_human_prompt", chunk_human_prompt),
+            ("reduce_system_prompt", reduce_system_prompt),
+            ("reduce_human_prompt", reduce_human_prompt)
+        ) if prompt)
+
         self._prompts = AsserterPrompts(
             system_prompt=system_prompt or self.DEFAULT_SYSTEM_PROMPT,
-            human_prompt=human_prompt or self.DEFAULT_HUMAN_PROMPT
+            human_prompt=human_prompt or self.DEFAULT_HUMAN_PROMPT,
+            multi_criteria_system_prompt=multi_criteria_system_prompt or self.DEFAULT_MULTI_CRITERIA_SYSTEM_PROMPT,
+            multi_criteria_human_prompt=multi_criteria_human_prompt or self.DEFAULT_MULTI_CRITERIA_HUMAN_PROMPT,
+            verdict_only_system_prompt=verdict_only_system_prompt or self.DEFAULT_VERDICT_ONLY_SYSTEM_PROMPT,
+            verdict_only_human_prompt=verdict_only_human_prompt or self.DEFAULT_VERDICT_ONLY_HUMAN_PROMPT,
+            reason_system_prompt=reason_system_prompt or self.DEFAULT_REASON_SYSTEM_PROMPT,
+            reason_human_prompt=reason_human_prompt or self.DEFAULT_REASON_HUMAN_PROMPT,
+            chunk_system_prompt=chunk_system_prompt or self.DEFAULT_CHUNK_SYSTEM_PROMPT,
+            chunk_human_prompt=chunk_human_prompt or self.DEFAULT_CHUNK_HUMAN_PROMPT,
+            reduce_system_prompt=reduce_system_prompt or self.DEFAULT_REDUCE_SYSTEM_PROMPT,
+            reduce_human_prompt=reduce_human_prompt or self.DEFAULT_REDUCE_HUMAN_PROMPT
         )
 
     @property
@@ -58,4 +229,14 @@ class AsserterPromptConfigurator:
         Returns:
             AsserterPrompts: Immutable dataclass containing the configured prompts
         """
-        return self._prompts
\ No newline at end of file
+        return self._prompts
+
+    @property
+    def customized(self) -> FrozenSet[str]:
+        """
+        Returns the names of the prompts that were customised rather than left at their defaults.
+
+        Returns:
+            FrozenSet[str]: Names of the customised prompts, as accepted by __init__
+        """
+        return self._customized
@@ -1,7 +1,18 @@
 from dataclasses import dataclass
+from typing import Optional
 
 @dataclass(frozen=True)
 class AsserterPrompts:
     """Holds the prompts used for semantic assertion testing"""
     system_prompt: str
     human_prompt: str
+    multi_criteria_system_prompt: Optional[str] = None
+    multi_criteria_human_prompt: Optional[str] = None
+    verdict_only_system_prompt: Optional[str] = None
+    verdict_only_human_prompt: Optional[str] = None
+    reason_system_prompt: Optional[str] = None
+    reason_human_prompt: Optional[str] = None
+    chunk_system_prompt: Optional[str] = None
+    chunk_human_prompt: Optional[str] = None
+    reduce_system_prompt: Optional[str] = None
+    reduce_human_prompt: Optional[str] = None
@@ -1,25 +1,69 @@
+import asyncio
 import os
-from typing import Optional, Union, Tuple, Type
+import sys
+from dataclasses import replace
+from typing import Optional, Union, Tuple, Type, List, Sequence, Any, Callable, Dict
 from dotenv import load_dotenv
-from langchain.schema import HumanMessage, SystemMessage
-from langchain_core.runnables import Runnable
+from langchain_core.callbacks import BaseCallbackManager
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.runnables.base import RunnableBindingBase
 
 from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompt_configurator import AsserterPromptConfigurator
 from llm_app_test.behavioral_assert.llm_config.llm_config import LLMConfig
 from llm_app_test.behavioral_assert.llm_config.llm_factory import LLMFactory
 from llm_app_test.behavioral_assert.llm_config.llm_provider_enum import LLMProvider
-from llm_app_test.behavioral_assert.validation.behavioral_assert_input_validator import AssertBehavioralMatchValidator
+from llm_app_test.behavioral_assert.llm_config.message_text import content_text
+from llm_app_test.behavioral_assert.llm_config.prompt_messages import build_prompt_messages
+from llm_app_test.behavioral_assert.validation.cascade_input_validator import CascadeInputsValidator
+from llm_app_test.behavioral_assert.validation.cassette_input_validator import CassetteInputsValidator
+from llm_app_test.behavioral_assert.validation.long_input_validator import LongInputInputsValidator
+from llm_app_test.behavioral_assert.validation.behavioral_assert_input_validator import AssertBehavioralMatchValidator, \
+    AssertBehavioralMatchesValidator, AssertBehavioralMatchAllValidator, LocalChecksValidator
+from llm_app_test.behavioral_assert.validation.rate_limiter_input_validator import RateLimiterInputsValidator
+from llm_app_test.behavioral_assert.validation.verdict_cache_input_validator import VerdictCacheInputsValidator
+from llm_app_test.behavioral_assert.validation.verdict_confidence_validator import VerdictConfidenceValidator
+from llm_app_test.behavioral_assert.validation.verdict_mode_validator import VerdictModeValidator
+from llm_app_test.behavioral_assert.validation.vote_input_validator import VoteInputsValidator
 from llm_app_test.behavioral_assert.validation.with_retry_config_validator import WithRetryConfigValidator
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.behavioral_assert.verdict.verdict_mode_enum import VerdictMode
+from llm_app_test.behavioral_assert.verdict.verdict_parser import VerdictParser
+from llm_app_test.behavioral_assert.verdict.vote_strategy_enum import VoteStrategy
+from llm_app_test.behavioral_assert.verdict.vote_tally import VoteTally
 from llm_app_test.exceptions.test_exceptions import (
     catch_llm_errors,
-    BehavioralAssertionError
+    BehavioralAssertionError,
+    UncertainVerdictError,
+    LocalCheckError,
+    LLMConnectionError,
+    LLMConfigurationError
 )
 from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import ModelConstants, \
-    LLMConstants
+    LLMConstants, VerdictCacheConstants, BatchConstants, RateLimiterConstants, VerdictConstants, \
+    VoteConstants, CascadeConstants, LongInputConstants, CassetteConstants, PromptCacheConstants
 from llm_app_test.behavioral_assert.validation.config_validator import ConfigValidator
 from llm_app_test.behavioral_assert.validation.config_validator_config import ConfigValidatorConfig
 
-from llm_app_test.rate_limiter.rate_limiter_handler import LLMInMemoryRateLimiter
+from llm_app_test.canonicalization.text_canonicalizer import canonicalize_text
+from llm_app_test.cassette.cassette import get_shared_cassette
+from llm_app_test.cassette.cassette_mode_enum import CassetteMode
+from llm_app_test.local_checks.local_check import LocalCheck
+from llm_app_test.long_input.text_chunker import TextChunker
+from llm_app_test.model_cascade.model_cascade import ModelCascade
+from llm_app_test.metrics.assertion_metrics_collector import collect_assertion_metrics, record_verdict_cache_hit
+from llm_app_test.metrics.metrics_registry import get_shared_metrics_registry
+from llm_app_test.prompt_cache.prompt_cache_usage import PromptCacheUsage
+from llm_app_test.rate_limiter.rate_limiter_backend_enum import RateLimiterBackend
+from llm_app_test.rate_limiter.adaptive_rate_limiter import AdaptiveRateLimiter
+from llm_app_test.rate_limiter.adaptive_rate_limiter_callback_handler import AdaptiveRateLimiterCallbackHandler
+from llm_app_test.rate_limiter.rate_limiter_handler import LLMInMemoryRateLimiter, LLMCrossProcessRateLimiter, \
+    LLMTokensPerMinuteRateLimiter, LLMAdaptiveRateLimiter
+from llm_app_test.rate_limiter.token_estimator import estimate_prompt_tokens, estimate_text_tokens
+from llm_app_test.verdict_cache.in_memory_verdict_cache import get_shared_verdict_cache
+from llm_app_test.verdict_cache.sqlite_verdict_cache import SQLiteVerdictCache
+from llm_app_test.verdict_cache.verdict_cache_key import VerdictCacheKey
 from llm_app_test.with_retry.with_retry_config import WithRetryConfig
 
 
@@ -49,7 +93,33 @@ class BehavioralAssertion:
             langchain_with_retry: Optional[bool] = None,
             retry_if_exception_type: Optional[Tuple[Type[BaseException], ...]] = None,
             wait_exponential_jitter: Optional[bool] = None,
-            stop_after_attempt: Optional[int] = None
+            stop_after_attempt: Optional[int] = None,
+            use_verdict_cache: Optional[bool] = None,
+            verdict_cache_path: Optional[str] = None,
+            use_in_memory_verdict_cache: Optional[bool] = None,
+            in_memory_verdict_cache_max_size: Optional[int] = None,
+            in_memory_verdict_cache_ttl_seconds: Optional[float] = None,
+            rate_limiter_backend: Optional[Union[str, RateLimiterBackend]] = None,
+            rate_limiter_state_file: Optional[str] = None,
+            rate_limiter_tokens_per_minute: Optional[float] = None,
+            verdict_mode: Optional[Union[str, VerdictMode]] = None,
+            use_verdict_confidence: Optional[bool] = None,
+            confidence_threshold: Optional[float] = None,
+            vote_strategy: Optional[Union[str, VoteStrategy]] = None,
+            vote_confidence: Optional[float] = None,
+            ensemble_providers: Optional[Sequence[Union[str, LLMProvider]]] = None,
+            use_model_cascade: Optional[bool] = None,
+            cascade_model: Optional[str] = None,
+            cascade_confidence_threshold: Optional[float] = None,
+            use_prompt_caching: Optional[bool] = None,
+            long_input_threshold: Optional[int] = None,
+            chunk_size: Optional[int] = None,
+            chunk_overlap: Optional[int] = None,
+            canonicalize_inputs: Optional[bool] = None,
+            cassette_mode: Optional[Union[str, CassetteMode]] = None,
+            cassette_path: Optional[str] = None,
+            base_url: Optional[str] = None,
+            collect_metrics: Optional[bool] = None
     ):
 
         """
@@ -97,6 +167,10 @@ class BehavioralAssertion:
 
             custom_prompts : Optional[AsserterPromptConfigurator]
                 Configurator for customizing prompts to the language model.
+                The two-phase, map-reduce and multi-criteria modes judge with
+                their own prompts; if system_prompt or human_prompt is
+                customised, using one of these modes without customising any
+                of its prompts raises LLMConfigurationError.
 
             use_rate_limiter : bool
                 Whether to enable a rate-limiting mechanism for API requests.
@@ -128,6 +202,158 @@ class BehavioralAssertion:
                 Number of attempts after which to stop retrying. If not provided,
                 defaults to 3
 
+            use_verdict_cache: Optional[bool]
+                Whether to store verdicts in a persistent on-disk cache and reuse
+                them for identical judgements. Defaults to False.
+
+            verdict_cache_path: Optional[str]
+                Location of the SQLite verdict cache file. Loaded from environment
+                variables or defaults if not provided.
+
+            use_in_memory_verdict_cache: Optional[bool]
+                Whether to reuse verdicts from the process-wide in-memory LRU
+                cache shared by all instances. Defaults to False.
+
+            in_memory_verdict_cache_max_size: Optional[int]
+                The maximum number of verdicts held by the in-memory cache.
+                Loaded from environment variables or defaults if not provided.
+
+            in_memory_verdict_cache_ttl_seconds: Optional[float]
+                Seconds an in-memory verdict stays valid, 0 disables expiry.
+                Loaded from environment variables or defaults if not provided.
+
+            rate_limiter_backend : Optional[Union[str, RateLimiterBackend]]
+                Where the token bucket lives: "in_memory" (per process),
+                "cross_process" (shared by every process using the same state
+                file, e.g. pytest-xdist workers) or "adaptive" (per process,
+                rate adjusted from 429s and rate-limit headers). Defaults to
+                "in_memory".
+
+            rate_limiter_state_file : Optional[str]
+                Path of the shared state file for the cross-process backend.
+                Loaded from environment variables or defaults if not provided.
+
+            rate_limiter_tokens_per_minute : Optional[float]
+                Prompt tokens allowed per minute when rate limiting is enabled.
+                Each judge request is charged its estimated prompt size before
+                it is sent. Loaded from environment variables or defaults to 0
+                (disabled) if not provided.
+
+            verdict_mode : Optional[Union[str, VerdictMode]]
+                How assert_behavioral_match reads the verdict: "standard" waits
+                for the full response, "streaming" reads it through llm.stream
+                and closes the stream as soon as the verdict is PASS,
+                "two_phase" first asks for a bare PASS/FAIL with a tiny
+                max_tokens and only requests the reason on FAIL. Loaded from
+                environment variables or defaults to "standard".
+
+            use_verdict_confidence : Optional[bool]
+                Whether to request logprobs on the verdict token and attach the
+                resulting confidence to verdicts and failure details. Only
+                supported for OpenAI chat models. Defaults to False.
+
+            confidence_threshold : Optional[float]
+                Confidence between 0 and 1 below which a verdict is reported as
+                an UncertainVerdictError instead of a pass or fail. Setting a
+                threshold above 0 enables verdict confidence and cannot be
+                combined with the "streaming" verdict mode. Loaded from
+                environment variables or defaults to 0 (disabled).
+
+            vote_strategy : Optional[Union[str, VoteStrategy]]
+                When to stop drawing judge samples for assertions made with
+                votes: "majority" stops once a majority of the votes is
+                decided, "sprt" stops once a sequential probability ratio test
+                reaches vote_confidence. Loaded from environment variables or
+                defaults to "majority".
+
+            vote_confidence : Optional[float]
+                Confidence target of the "sprt" vote strategy, strictly
+                between 0.5 and 1. Loaded from environment variables or
+                defaults to 0.95.
+
+            ensemble_providers : Optional[Sequence[Union[str, LLMProvider]]]
+                Extra providers whose default models join the judge when
+                voting, samples being spread across the judges in turn.
+                Ignored when a custom llm is passed. Loaded from environment
+                variables (comma-separated) or defaults to none.
+
+            use_model_cascade : Optional[bool]
+                Whether to ask a fast model first and escalate to the
+                configured model only when the fast verdict is FAIL, below
+                cascade_confidence_threshold or an error. Ignored when a
+                custom llm is passed. Defaults to False.
+
+            cascade_model : Optional[str]
+                The fast first-tier model, from the same provider as the
+                configured model. Loaded from environment variables or
+                defaults to gpt-4o-mini for OpenAI and
+                claude-3-5-haiku-latest for Anthropic.
+
+            cascade_confidence_threshold : Optional[float]
+                Confidence between 0 and 1 below which a fast PASS is
+                escalated. OpenAI only. Loaded from environment variables or
+                defaults to 0 (only FAIL verdicts are escalated).
+
+            use_prompt_caching : Optional[bool]
+                Whether to mark the system prompt and the part of the human
+                prompt before {actual} with Anthropic cache_control breakpoints,
+                so judgements sharing an expected behavior reuse the cached
+                prefix. A breakpoint is only added once the prompt before it
+                reaches Anthropic's minimum cacheable length (1024 tokens, 2048
+                for Haiku), which the default prompts alone do not. Only
+                applied when every judge is an Anthropic model; OpenAI caches
+                prompt prefixes automatically. Defaults to False.
+
+            long_input_threshold : Optional[int]
+                Estimated token count of the actual output above which it is
+                judged map-reduce style: split into overlapping chunks that are
+                reviewed concurrently, then combined in one final request.
+                Loaded from environment variables or defaults to 0, which
+                always sends the actual output whole.
+
+            chunk_size : Optional[int]
+                Maximum size of a chunk in estimated tokens. Loaded from
+                environment variables or defaults to 8000.
+
+            chunk_overlap : Optional[int]
+                Estimated tokens repeated from the end of each chunk at the
+                start of the next. Loaded from environment variables or
+                defaults to 200.
+
+            canonicalize_inputs : Optional[bool]
+                Whether to canonicalize actual and expected_behavior before
+                they are formatted into prompts and cache keys: line endings
+                and Unicode are normalized, the text is dedented, and runs of
+                spaces and blank lines are collapsed. Local checks still see
+                the original actual output. Defaults to False.
+
+            cassette_mode : Optional[Union[str, CassetteMode]]
+                "record" stores every judge request and response in a cassette
+                file, "replay" answers judge requests from it without calling
+                the LLM and raises CassetteMissError for requests it does not
+                hold. No API key is needed when replaying. Loaded from
+                environment variables or disabled if not provided.
+
+            cassette_path : Optional[str]
+                Location of the cassette file. Loaded from environment
+                variables or defaults if not provided.
+
+            base_url : Optional[str]
+                Endpoint the judges send requests to instead of the
+                provider's own API, such as a proxy or a local
+                MockProviderServer. Applies to the ensemble and cascade
+                judges too. Loaded from environment variables or uses the
+                provider's endpoint if not provided.
+
+            collect_metrics : Optional[bool]
+                Whether the assert_behavioral_match, assert_behavioral_matches
+                and assert_behavioral_match_all methods and their async
+                counterparts record their wall time, rate limiter wait,
+                with_retry retries and token usage in the process-wide
+                MetricsRegistry, available as metrics_registry. Loaded from
+                environment variables or defaults to False. The pytest
+                plugin turns it on for runs with --llm-perf-report.
+
             Returns:
             --------
             None
@@ -172,8 +398,108 @@ class BehavioralAssertion:
 
         self.custom_prompts = custom_prompts or AsserterPromptConfigurator()
 
+        use_verdict_cache = use_verdict_cache or os.getenv('USE_VERDICT_CACHE', 'False').lower() == 'true'
+
+        if use_verdict_cache:
+            self.verdict_cache = SQLiteVerdictCache(
+                verdict_cache_path or os.getenv('VERDICT_CACHE_PATH', VerdictCacheConstants.DEFAULT_PATH)
+            )
+        else:
+            self.verdict_cache = None
+
+        use_in_memory_verdict_cache = use_in_memory_verdict_cache or os.getenv(
+            'USE_IN_MEMORY_VERDICT_CACHE', 'False').lower() == 'true'
+
+        if use_in_memory_verdict_cache:
+            max_size = in_memory_verdict_cache_max_size if in_memory_verdict_cache_max_size is not None else \
+                os.getenv('IN_MEMORY_VERDICT_CACHE_MAX_SIZE', VerdictCacheConstants.IN_MEMORY_MAX_SIZE)
+            ttl_seconds = in_memory_verdict_cache_ttl_seconds if in_memory_verdict_cache_ttl_seconds is not None \
+                else os.getenv('IN_MEMORY_VERDICT_CACHE_TTL_SECONDS', VerdictCacheConstants.IN_MEMORY_TTL_SECONDS)
+
+            self.in_memory_verdict_cache = get_shared_verdict_cache(
+                max_size=VerdictCacheInputsValidator.validate_max_size(max_size),
+                ttl_seconds=VerdictCacheInputsValidator.validate_ttl_seconds(ttl_seconds)
+            )
+        else:
+            self.in_memory_verdict_cache = None
+
+        self.verdict_mode = VerdictModeValidator.validate(
+            verdict_mode if verdict_mode is not None else os.getenv('ASSERTER_VERDICT_MODE', VerdictConstants.DEFAULT_MODE)
+        )
+        if self.verdict_mode == VerdictMode.TWO_PHASE:
+            self._require_mode_prompts('the "two_phase" verdict mode', "verdict_only_system_prompt",
+                                       "verdict_only_human_prompt", "reason_system_prompt", "reason_human_prompt")
+
+        self.confidence_threshold = VerdictConfidenceValidator.validate_threshold(
+            confidence_threshold if confidence_threshold is not None else
+            os.getenv('ASSERTER_CONFIDENCE_THRESHOLD', str(VerdictConstants.DEFAULT_CONFIDENCE_THRESHOLD))
+        )
+        VerdictConfidenceValidator.validate_verdict_mode(self.confidence_threshold, self.verdict_mode)
+        self.use_verdict_confidence = bool(
+            use_verdict_confidence or os.getenv('USE_VERDICT_CONFIDENCE', 'False').lower() == 'true'
+            or self.confidence_threshold > 0
+        )
+
+        self.vote_strategy = VoteInputsValidator.validate_strategy(
+            vote_strategy if vote_strategy is not None else
+            os.getenv('ASSERTER_VOTE_STRATEGY', VoteConstants.DEFAULT_STRATEGY)
+        )
+        self.vote_confidence = VoteInputsValidator.validate_confidence(
+            vote_confidence if vote_confidence is not None else
+            os.getenv('ASSERTER_VOTE_CONFIDENCE', str(VoteConstants.DEFAULT_CONFIDENCE))
+        )
+
+        self.long_input_threshold = LongInputInputsValidator.validate_threshold(
+            long_input_threshold if long_input_threshold is not None else
+            os.getenv('ASSERTER_LONG_INPUT_THRESHOLD', str(LongInputConstants.THRESHOLD_TOKENS))
+        )
+        chunk_size = LongInputInputsValidator.validate_chunk_size(
+            chunk_size if chunk_size is not None else
+            os.getenv('ASSERTER_CHUNK_SIZE', str(LongInputConstants.CHUNK_SIZE_TOKENS))
+        )
+        chunk_overlap = LongInputInputsValidator.validate_chunk_overlap(
+            chunk_overlap if chunk_overlap is not None else
+            os.getenv('ASSERTER_CHUNK_OVERLAP', str(LongInputConstants.CHUNK_OVERLAP_TOKENS)),
+            chunk_size
+        )
+        self.text_chunker = TextChunker(chunk_size, chunk_overlap)
+        if self.long_input_threshold > 0:
+            self._require_mode_prompts("map-reduce judging of long inputs", "chunk_system_prompt",
+                                       "chunk_human_prompt", "reduce_system_prompt", "reduce_human_prompt")
+
+        self.canonicalize_inputs = bool(
+            canonicalize_inputs or os.getenv('ASSERTER_CANONICALIZE_INPUTS', 'False').lower() == 'true'
+        )
+
+        cassette_mode = cassette_mode if cassette_mode is not None else os.getenv('ASSERTER_CASSETTE_MODE')
+        self.cassette = get_shared_cassette(
+            cassette_path or os.getenv('ASSERTER_CASSETTE_PATH', CassetteConstants.DEFAULT_PATH),
+            CassetteInputsValidator.validate_mode(cassette_mode)
+        ) if cassette_mode else None
+
+        collect_metrics = collect_metrics if collect_metrics is not None else \
+            os.getenv('ASSERTER_COLLECT_METRICS', 'False').lower() == 'true'
+        self.metrics_registry = get_shared_metrics_registry() if collect_metrics else None
+
+        self.token_rate_limiter = None
+        self.ensemble_providers = []
+        self.ensemble_llms = []
+        self.model_cascade = None
+        self.prompt_cache_usage = PromptCacheUsage()
+
+        use_prompt_caching = use_prompt_caching or os.getenv('USE_PROMPT_CACHING', 'False').lower() == 'true'
+        self._cache_control = False
+        # the Anthropic models that can be configured are Sonnet and Opus
+        self._min_cacheable_tokens = PromptCacheConstants.MIN_CACHEABLE_TOKENS
+
         if llm:
+            if self.use_verdict_confidence:
+                VerdictConfidenceValidator.validate_supported(self._supports_logprobs(llm))
+            self._cache_control = use_prompt_caching and self._is_anthropic(llm)
+            if self._cache_control:
+                self._min_cacheable_tokens = self._anthropic_min_cacheable_tokens(llm)
             self.llm = llm
+            self._llm_description = VerdictCacheKey.describe_runnable(llm)
             return
 
         provider_value = provider.value if isinstance(provider, LLMProvider) else (
@@ -188,6 +514,8 @@ class BehavioralAssertion:
             default_model = ModelConstants.DEFAULT_ANTHROPIC_MODEL
             valid_models = ModelConstants.ANTHROPIC_MODELS
 
+        api_key = api_key or self._replay_api_key()
+
         model = model or os.getenv('LLM_MODEL', default_model)
         temperature = temperature if temperature is not None else float(
             os.getenv('LLM_TEMPERATURE', str(LLMConstants.DEFAULT_TEMPERATURE)))
@@ -197,6 +525,7 @@ class BehavioralAssertion:
             os.getenv('LLM_MAX_RETRIES', str(LLMConstants.DEFAULT_MAX_RETRIES)))
         timeout = timeout if timeout is not None else float(
             os.getenv('LLM_TIMEOUT', str(LLMConstants.DEFAULT_TIMEOUT)))
+        base_url = base_url or os.getenv('LLM_BASE_URL') or None
 
         validation_config = ConfigValidatorConfig(
             api_key=api_key,
@@ -205,11 +534,26 @@ class BehavioralAssertion:
             valid_models=valid_models,
             temperature=temperature,
             max_tokens=max_tokens,
-            timeout=timeout
+            timeout=timeout,
+            base_url=base_url
         )
 
         provider = ConfigValidator.validate(validation_config)
 
+        self.ensemble_providers = VoteInputsValidator.validate_ensemble_providers(
+            ensemble_providers if ensemble_providers is not None else os.getenv('ASSERTER_ENSEMBLE_PROVIDERS', '')
+        )
+
+        if self.use_verdict_confidence:
+            VerdictConfidenceValidator.validate_supported(
+                all(judge_provider == LLMProvider.OPENAI for judge_provider in [provider, *self.ensemble_providers])
+            )
+
+        # cache_control blocks are Anthropic-specific, and every judge receives the same messages
+        self._cache_control = use_prompt_caching and all(
+            judge_provider == LLMProvider.ANTHROPIC for judge_provider in [provider, *self.ensemble_providers]
+        )
+
         config = LLMConfig(
             provider=provider,
             api_key=api_key,
@@ -217,22 +561,84 @@ class BehavioralAssertion:
             temperature=temperature,
             max_tokens=max_tokens,
             max_retries=max_retries,
-            timeout=timeout
+            timeout=timeout,
+            base_url=base_url
         )
 
+        self._llm_description = VerdictCacheKey.describe_config(config)
+
+        use_model_cascade = use_model_cascade or os.getenv('USE_MODEL_CASCADE', 'False').lower() == 'true'
+
+        if use_model_cascade:
+            cascade_config = replace(config, model=CascadeInputsValidator.validate_model(
+                cascade_model or os.getenv('CASCADE_MODEL', ModelConstants.FAST_OPENAI_MODEL
+                                           if provider == LLMProvider.OPENAI else ModelConstants.FAST_ANTHROPIC_MODEL),
+                provider
+            ))
+            cascade_confidence_threshold = CascadeInputsValidator.validate_confidence_threshold(
+                cascade_confidence_threshold if cascade_confidence_threshold is not None else
+                os.getenv('CASCADE_CONFIDENCE_THRESHOLD', str(CascadeConstants.DEFAULT_CONFIDENCE_THRESHOLD)),
+                provider
+            )
+            self._llm_description["cascade"] = {
+                "model": cascade_config.model,
+                "confidence_threshold": cascade_confidence_threshold
+            }
+
         use_rate_limiter = use_rate_limiter or os.getenv('USE_RATE_LIMITER', 'False').lower() == 'true'
 
         if use_rate_limiter:
-            llm_in_memory_rate_limiter = LLMInMemoryRateLimiter(
-                requests_per_second=rate_limiter_requests_per_second,
-                check_every_n_seconds=rate_limiter_check_every_n_seconds,
-                max_bucket_size=rate_limiter_max_bucket_size
+            rate_limiter_backend = RateLimiterInputsValidator.validate_backend(
+                rate_limiter_backend if rate_limiter_backend is not None
+                else os.getenv('RATE_LIMITER_BACKEND', RateLimiterConstants.BACKEND))
+
+            if rate_limiter_backend == RateLimiterBackend.CROSS_PROCESS:
+                llm_in_memory_rate_limiter = LLMCrossProcessRateLimiter(
+                    requests_per_second=rate_limiter_requests_per_second,
+                    check_every_n_seconds=rate_limiter_check_every_n_seconds,
+                    max_bucket_size=rate_limiter_max_bucket_size,
+                    state_file=rate_limiter_state_file
+                ).get_rate_limiter
+            elif rate_limiter_backend == RateLimiterBackend.ADAPTIVE:
+                llm_in_memory_rate_limiter = LLMAdaptiveRateLimiter(
+                    requests_per_second=rate_limiter_requests_per_second,
+                    check_every_n_seconds=rate_limiter_check_every_n_seconds,
+                    max_bucket_size=rate_limiter_max_bucket_size
+                ).get_rate_limiter
+            else:
+                llm_in_memory_rate_limiter = LLMInMemoryRateLimiter(
+                    requests_per_second=rate_limiter_requests_per_second,
+                    check_every_n_seconds=rate_limiter_check_every_n_seconds,
+                    max_bucket_size=rate_limiter_max_bucket_size
+                ).get_rate_limiter
+
+            self.token_rate_limiter = LLMTokensPerMinuteRateLimiter(
+                tokens_per_minute=rate_limiter_tokens_per_minute,
+                check_every_n_seconds=rate_limiter_check_every_n_seconds
             ).get_rate_limiter
         else:
             llm_in_memory_rate_limiter = None
 
         self.llm = LLMFactory.create_llm(config, llm_in_memory_rate_limiter)
 
+        self.ensemble_llms = [
+            self._create_ensemble_llm(ensemble_provider, config, llm_in_memory_rate_limiter, self._replay_api_key())
+            for ensemble_provider in self.ensemble_providers
+        ]
+
+        if use_model_cascade:
+            self.model_cascade = ModelCascade(
+                LLMFactory.create_llm(cascade_config, llm_in_memory_rate_limiter),
+                confidence_threshold=cascade_confidence_threshold,
+                request_logprobs=cascade_confidence_threshold > 0 or self.use_verdict_confidence
+            )
+
+        if isinstance(llm_in_memory_rate_limiter, AdaptiveRateLimiter):
+            # every judge shares the limiter, so every judge reports its outcomes to it
+            feedback = AdaptiveRateLimiterCallbackHandler(llm_in_memory_rate_limiter)
+            for judge in [self.llm, *self.ensemble_llms, *([self.model_cascade.llm] if self.model_cascade else [])]:
+                self._add_rate_limiter_feedback(judge, feedback)
+
         langchain_with_retry = langchain_with_retry or os.getenv('LANGCHAIN_WITH_RETRY', 'False').lower() == 'true'
 
         if langchain_with_retry:
@@ -258,13 +664,70 @@ class BehavioralAssertion:
                 wait_exponential_jitter=self.retry_config.wait_exponential_jitter,
                 stop_after_attempt=self.retry_config.stop_after_attempt
             )
+            self.ensemble_llms = [
+                ensemble_llm.with_retry(
+                    retry_if_exception_type=self.retry_config.retry_if_exception_type,
+                    wait_exponential_jitter=self.retry_config.wait_exponential_jitter,
+                    stop_after_attempt=self.retry_config.stop_after_attempt
+                )
+                for ensemble_llm in self.ensemble_llms
+            ]
+            if self.model_cascade is not None:
+                self.model_cascade.llm = self.model_cascade.llm.with_retry(
+                    retry_if_exception_type=self.retry_config.retry_if_exception_type,
+                    wait_exponential_jitter=self.retry_config.wait_exponential_jitter,
+                    stop_after_attempt=self.retry_config.stop_after_attempt
+                )
+
+    @classmethod
+    def _add_rate_limiter_feedback(cls, llm: Runnable, feedback: AdaptiveRateLimiterCallbackHandler) -> None:
+        """Add the adaptive rate limiter's callback handler to a judge, keeping any callbacks it already has"""
+        if isinstance(llm.callbacks, BaseCallbackManager):
+            llm.callbacks.add_handler(feedback)
+        else:
+            llm.callbacks = [*(llm.callbacks or []), feedback]
+
+        # OpenAI only exposes the rate limit headers on request
+        if cls._is_openai(llm):
+            llm.include_response_headers = True
+
+    @staticmethod
+    def _create_ensemble_llm(
+            provider: LLMProvider,
+            config: LLMConfig,
+            rate_limiter: Optional[InMemoryRateLimiter],
+            replay_api_key: Optional[str] = None
+    ) -> Runnable:
+        """Create an extra judge using the provider's default model and the primary judge's other settings"""
+        if provider == LLMProvider.OPENAI:
+            api_key = os.getenv('OPENAI_API_KEY') or replay_api_key
+            model = ModelConstants.DEFAULT_OPENAI_MODEL
+            valid_models = ModelConstants.OPENAI_MODELS
+        else:
+            api_key = os.getenv('ANTHROPIC_API_KEY') or replay_api_key
+            model = ModelConstants.DEFAULT_ANTHROPIC_MODEL
+            valid_models = ModelConstants.ANTHROPIC_MODELS
+
+        ConfigValidator.validate(ConfigValidatorConfig(
+            api_key=api_key,
+            provider=provider.value,
+            model=model,
+            valid_models=valid_models,
+            temperature=config.temperature,
+            max_tokens=config.max_tokens,
+            timeout=config.timeout
+        ))
+
+        return LLMFactory.create_llm(replace(config, provider=provider, api_key=api_key, model=model), rate_limiter)
 
     @catch_llm_errors
     def assert_behavioral_match(
             self,
             actual: str,
-            expected_behavior: str
-    ) -> None:
+            expected_behavior: str,
+            votes: Optional[int] = None,
+            local_checks: Optional[Sequence[LocalCheck]] = None
+    ) -> Verdict:
         """Assert that actual output matches expected behavior.
 
         Validates that the actual output exhibits the expected behavior using
@@ -273,29 +736,987 @@ class BehavioralAssertion:
         Args:
             actual: The actual output to test
             expected_behavior: Natural language specification of expected behavior
+            votes: Maximum number of judge samples to vote over. Samples are drawn
+                concurrently in the smallest batches that could decide the vote, and
+                sampling stops as soon as the vote_strategy reaches a decision.
+                Defaults to a single sample
+            local_checks: Deterministic checks of actual, such as Contains, MatchesRegex,
+                Length, JsonSchema or MarkdownStructure, run before the LLM judge. The
+                judge is only called when every check passes
+
+        Returns:
+            Verdict: The passing verdict, including its confidence when verdict
+                confidence is enabled and its (pass, fail) sample counts when voting
+
+        Raises:
+            TypeError: If inputs are None
+            InvalidPromptError: If local_checks is not a sequence of LocalCheck instances
+            BehavioralAssertionError: If output doesn't match expected behavior
+            LocalCheckError: If any local check fails, without calling the LLM
+            UncertainVerdictError: If the verdict's confidence is below confidence_threshold
+            LLMConnectionError: If LLM service fails
+            LLMConfigurationError: If LLM is not properly configured or votes is invalid
+        """
+        AssertBehavioralMatchValidator.validate(actual, expected_behavior)
+        votes = VoteInputsValidator.validate_votes(votes)
+
+        with self._collect_metrics("assert_behavioral_match", expected_behavior):
+            self._run_local_checks(actual, LocalChecksValidator.validate(local_checks))
+
+            actual, expected_behavior = self._canonicalize(actual), self._canonicalize(expected_behavior)
+            messages = self._build_messages(actual, expected_behavior)
+
+            verdict = self._judge(messages, actual, expected_behavior, votes)
+
+            self._raise_on_failure(verdict)
+
+        return verdict
+
+    @catch_llm_errors
+    async def aassert_behavioral_match(
+            self,
+            actual: str,
+            expected_behavior: str,
+            votes: Optional[int] = None,
+            local_checks: Optional[Sequence[LocalCheck]] = None
+    ) -> Verdict:
+        """Asynchronously assert that actual output matches expected behavior.
+
+        Behaves exactly like assert_behavioral_match but awaits the LLM through
+        ainvoke, so many judgements can run concurrently on one event loop.
+
+        Args:
+            actual: The actual output to test
+            expected_behavior: Natural language specification of expected behavior
+            votes: Maximum number of judge samples to vote over. Samples are drawn
+                concurrently in the smallest batches that could decide the vote, and
+                sampling stops as soon as the vote_strategy reaches a decision.
+                Defaults to a single sample
+            local_checks: Deterministic checks of actual, such as Contains, MatchesRegex,
+                Length, JsonSchema or MarkdownStructure, run before the LLM judge. The
+                judge is only called when every check passes
+
+        Returns:
+            Verdict: The passing verdict, including its confidence when verdict
+                confidence is enabled and its (pass, fail) sample counts when voting
 
         Raises:
             TypeError: If inputs are None
+            InvalidPromptError: If local_checks is not a sequence of LocalCheck instances
             BehavioralAssertionError: If output doesn't match expected behavior
+            LocalCheckError: If any local check fails, without calling the LLM
+            UncertainVerdictError: If the verdict's confidence is below confidence_threshold
             LLMConnectionError: If LLM service fails
-            LLMConfigurationError: If LLM is not properly configured
+            LLMConfigurationError: If LLM is not properly configured or votes is invalid
         """
         AssertBehavioralMatchValidator.validate(actual, expected_behavior)
+        votes = VoteInputsValidator.validate_votes(votes)
+
+        with self._collect_metrics("aassert_behavioral_match", expected_behavior):
+            self._run_local_checks(actual, LocalChecksValidator.validate(local_checks))
+
+            actual, expected_behavior = self._canonicalize(actual), self._canonicalize(expected_behavior)
+            messages = self._build_messages(actual, expected_behavior)
+
+            verdict = await self._ajudge(messages, actual, expected_behavior, votes)
+
+            self._raise_on_failure(verdict)
+
+        return verdict
+
+    @catch_llm_errors
+    def assert_behavioral_matches(
+            self,
+            pairs: Sequence[Tuple[str, str]],
+            max_concurrency: Optional[int] = None
+    ) -> List[Verdict]:
+        """Assert that every actual output matches its expected behavior.
+
+        Judgements are sent through the LLM's batch method with at most max_concurrency
+        requests in flight, under the configured rate limiter. Every verdict is gathered
+        before a single aggregated error is raised for all failing pairs.
+
+        Args:
+            pairs: Sequence of (actual, expected_behavior) tuples
+            max_concurrency: Maximum number of judgements in flight at once. Loaded from
+                the ASSERTER_MAX_CONCURRENCY environment variable or defaults if not provided
+
+        Returns:
+            List[Verdict]: One verdict per pair, in input order
+
+        Raises:
+            InvalidPromptError: If pairs is malformed or any input is invalid
+            BehavioralAssertionError: If any output doesn't match its expected behavior,
+                listing every failing index and reason
+            LLMConnectionError: If any judge request fails, listing every errored index
+                together with the behavioral failures of the other pairs
+            LLMConfigurationError: If max_concurrency is invalid
+        """
+        pairs, max_concurrency = AssertBehavioralMatchesValidator.validate(
+            pairs, self._max_concurrency_or_default(max_concurrency))
+
+        with self._collect_metrics("assert_behavioral_matches", "; ".join(expected for _, expected in pairs)):
+            messages, cache_keys, verdicts = self._prepare_batch(pairs)
+            pending = [index for index, verdict in enumerate(verdicts) if verdict is None]
+
+            if pending and self.model_cascade is not None:
+                responses = self._batch([messages[index] for index in pending], max_concurrency,
+                                        llm=self.model_cascade.verdict_llm)
+                pending = self._settle_cascade_batch(pending, responses, cache_keys, verdicts)
+
+            errors = {}
+            if pending:
+                responses = self._batch([messages[index] for index in pending], max_concurrency)
+                errors = self._complete_batch(pending, responses, cache_keys, verdicts)
+
+            self._raise_on_failures(verdicts, errors)
+
+        return verdicts
+
+    @catch_llm_errors
+    async def aassert_behavioral_matches(
+            self,
+            pairs: Sequence[Tuple[str, str]],
+            max_concurrency: Optional[int] = None
+    ) -> List[Verdict]:
+        """Async counterpart of assert_behavioral_matches that awaits the LLM through abatch.
+
+        Args:
+            pairs: Sequence of (actual, expected_behavior) tuples
+            max_concurrency: Maximum number of judgements in flight at once
+
+        Returns:
+            List[Verdict]: One verdict per pair, in input order
+
+        Raises:
+            InvalidPromptError: If pairs is malformed or any input is invalid
+            BehavioralAssertionError: If any output doesn't match its expected behavior
+            LLMConnectionError: If any judge request fails, listing every errored index
+                together with the behavioral failures of the other pairs
+            LLMConfigurationError: If max_concurrency is invalid
+        """
+        pairs, max_concurrency = AssertBehavioralMatchesValidator.validate(
+            pairs, self._max_concurrency_or_default(max_concurrency))
+
+        with self._collect_metrics("aassert_behavioral_matches", "; ".join(expected for _, expected in pairs)):
+            messages, cache_keys, verdicts = self._prepare_batch(pairs)
+            pending = [index for index, verdict in enumerate(verdicts) if verdict is None]
+
+            if pending and self.model_cascade is not None:
+                responses = await self._abatch([messages[index] for index in pending], max_concurrency,
+                                               llm=self.model_cascade.verdict_llm)
+                pending = self._settle_cascade_batch(pending, responses, cache_keys, verdicts)
+
+            errors = {}
+            if pending:
+                responses = await self._abatch([messages[index] for index in pending], max_concurrency)
+                errors = self._complete_batch(pending, responses, cache_keys, verdicts)
+
+            self._raise_on_failures(verdicts, errors)
+
+        return verdicts
+
+    @catch_llm_errors
+    def assert_behavioral_match_all(
+            self,
+            actual: str,
+            expected_behaviors: Sequence[str]
+    ) -> List[Verdict]:
+        """Assert that actual output matches every one of several expected behaviors.
+
+        All expected behaviors are packed into a single judge request using the
+        multi-criteria prompts, so the actual output is only sent once.
+
+        Args:
+            actual: The actual output to test
+            expected_behaviors: Natural language specifications that must all be met
+
+        Returns:
+            List[Verdict]: One verdict per expected behavior, in input order
+
+        Raises:
+            InvalidPromptError: If any input is invalid
+            BehavioralAssertionError: If the output doesn't match one or more expected
+                behaviors, listing every failing index and reason
+            LLMConnectionError: If LLM service fails
+            LLMConfigurationError: If a confidence_threshold is set, as multi-criteria
+                verdicts carry no confidence, or if the standard prompts were customised
+                but the multi-criteria prompts were not
+        """
+        expected_behaviors = AssertBehavioralMatchAllValidator.validate(actual, expected_behaviors)
+        VerdictConfidenceValidator.validate_multi_criteria(self.confidence_threshold)
+        self._require_mode_prompts("assert_behavioral_match_all", "multi_criteria_system_prompt",
+                                   "multi_criteria_human_prompt")
+
+        with self._collect_metrics("assert_behavioral_match_all", "; ".join(expected_behaviors)):
+            actual = self._canonicalize(actual)
+            expected_behaviors = [self._canonicalize(expected_behavior) for expected_behavior in expected_behaviors]
+            messages = self._build_multi_criteria_messages(actual, expected_behaviors)
+            cache_keys = self._multi_criteria_cache_keys(messages, actual, expected_behaviors)
+
+            verdicts = [self._cached_verdict(cache_key) for cache_key in cache_keys]
+
+            if any(verdict is None for verdict in verdicts):
+                verdicts = VerdictParser.parse_multi_criteria(self._invoke(messages).content, len(expected_behaviors))
+                self._store_criteria_verdicts(cache_keys, verdicts)
+
+            self._raise_on_failures(verdicts)
+
+        return verdicts
+
+    @catch_llm_errors
+    async def aassert_behavioral_match_all(
+            self,
+            actual: str,
+            expected_behaviors: Sequence[str]
+    ) -> List[Verdict]:
+        """Async counterpart of assert_behavioral_match_all that awaits the LLM through ainvoke.
+
+        Args:
+            actual: The actual output to test
+            expected_behaviors: Natural language specifications that must all be met
+
+        Returns:
+            List[Verdict]: One verdict per expected behavior, in input order
+
+        Raises:
+            InvalidPromptError: If any input is invalid
+            BehavioralAssertionError: If the output doesn't match one or more expected behaviors
+            LLMConnectionError: If LLM service fails
+            LLMConfigurationError: If a confidence_threshold is set, or if the standard
+                prompts were customised but the multi-criteria prompts were not
+        """
+        expected_behaviors = AssertBehavioralMatchAllValidator.validate(actual, expected_behaviors)
+        VerdictConfidenceValidator.validate_multi_criteria(self.confidence_threshold)
+        self._require_mode_prompts("assert_behavioral_match_all", "multi_criteria_system_prompt",
+                                   "multi_criteria_human_prompt")
 
+        with self._collect_metrics("aassert_behavioral_match_all", "; ".join(expected_behaviors)):
+            actual = self._canonicalize(actual)
+            expected_behaviors = [self._canonicalize(expected_behavior) for expected_behavior in expected_behaviors]
+            messages = self._build_multi_criteria_messages(actual, expected_behaviors)
+            cache_keys = self._multi_criteria_cache_keys(messages, actual, expected_behaviors)
+
+            verdicts = [self._cached_verdict(cache_key) for cache_key in cache_keys]
+
+            if any(verdict is None for verdict in verdicts):
+                response = await self._ainvoke(messages)
+                verdicts = VerdictParser.parse_multi_criteria(response.content, len(expected_behaviors))
+                self._store_criteria_verdicts(cache_keys, verdicts)
+
+            self._raise_on_failures(verdicts)
+
+        return verdicts
+
+    def _build_multi_criteria_messages(self, actual: str, expected_behaviors: Sequence[str]) -> List[BaseMessage]:
         prompts = self.custom_prompts.prompts
+        numbered_behaviors = "\n".join(
+            f"{number}. {expected_behavior}" for number, expected_behavior in enumerate(expected_behaviors, start=1)
+        )
 
-        messages = [
-            SystemMessage(content=prompts.system_prompt),
-            HumanMessage(content=prompts.human_prompt.format(
-                expected_behavior=expected_behavior,
-                actual=actual
-            ))
+        return build_prompt_messages(
+            prompts.multi_criteria_system_prompt,
+            prompts.multi_criteria_human_prompt,
+            cache_control=self._cache_control,
+            min_cacheable_tokens=self._min_cacheable_tokens,
+            expected_behaviors=numbered_behaviors,
+            actual=actual
+        )
+
+    def _multi_criteria_cache_keys(
+            self,
+            messages: List[BaseMessage],
+            actual: str,
+            expected_behaviors: Sequence[str]
+    ) -> List[Optional[str]]:
+        """Build one cache key per criterion, all tied to the same multi-criteria request"""
+        return [
+            self._verdict_cache_key(messages, actual, f"{number}. {expected_behavior}")
+            for number, expected_behavior in enumerate(expected_behaviors, start=1)
         ]
 
-        result = self.llm.invoke(messages).content
+    def _store_criteria_verdicts(self, cache_keys: List[Optional[str]], verdicts: List[Verdict]) -> None:
+        """Cache the verdict of every criterion the judge answered, so a truncated response is retried next time"""
+        for cache_key, verdict in zip(cache_keys, verdicts):
+            if verdict.reason != VerdictParser.MISSING_CRITERION_REASON:
+                self._store_verdict(cache_key, verdict)
+
+    @staticmethod
+    def _max_concurrency_or_default(max_concurrency: Optional[int]) -> Union[int, str]:
+        if max_concurrency is not None:
+            return max_concurrency
+        return os.getenv('ASSERTER_MAX_CONCURRENCY', str(BatchConstants.DEFAULT_MAX_CONCURRENCY))
+
+    def _prepare_batch(
+            self,
+            pairs: Sequence[Tuple[str, str]]
+    ) -> Tuple[List[List[BaseMessage]], List[Optional[str]], List[Optional[Verdict]]]:
+        """Build messages and cache keys for each pair, filling in verdicts already cached"""
+        messages, cache_keys, verdicts = [], [], []
+
+        for actual, expected_behavior in pairs:
+            actual, expected_behavior = self._canonicalize(actual), self._canonicalize(expected_behavior)
+            pair_messages = self._build_messages(actual, expected_behavior)
+            cache_key = self._verdict_cache_key(pair_messages, actual, expected_behavior)
+            messages.append(pair_messages)
+            cache_keys.append(cache_key)
+            verdicts.append(self._cached_verdict(cache_key))
+
+        return messages, cache_keys, verdicts
+
+    def _complete_batch(
+            self,
+            pending: List[int],
+            responses: List[Any],
+            cache_keys: List[Optional[str]],
+            verdicts: List[Optional[Verdict]],
+            parse: Callable[[Any], Verdict] = VerdictParser.parse_response
+    ) -> Dict[int, Exception]:
+        """Parse and cache every successful response, returning the LLM errors by index"""
+        errors = {}
+
+        for index, response in zip(pending, responses):
+            if isinstance(response, Exception):
+                errors[index] = response
+                continue
+            verdicts[index] = parse(response)
+            self._store_verdict(cache_keys[index], verdicts[index])
+
+        return errors
+
+    @staticmethod
+    def _raise_first(errors: Dict[int, Exception]) -> None:
+        if errors:
+            raise errors[min(errors)]
 
-        if result.startswith("FAIL"):
+    def _settle_cascade_batch(
+            self,
+            pending: List[int],
+            responses: List[Any],
+            cache_keys: List[Optional[str]],
+            verdicts: List[Optional[Verdict]]
+    ) -> List[int]:
+        """Keep and cache the first-tier verdicts the cascade accepts, returning the indices to escalate"""
+        escalated = []
+
+        for index, response in zip(pending, responses):
+            if isinstance(response, Exception) and not self.model_cascade.escalates_on(response):
+                raise response
+            verdict = None if isinstance(response, Exception) else VerdictParser.parse_response(response)
+            if self.model_cascade.should_escalate(verdict):
+                escalated.append(index)
+                continue
+            verdicts[index] = verdict
+            self._store_verdict(cache_keys[index], verdict)
+
+        return escalated
+
+    def _raise_on_failures(
+            self,
+            verdicts: List[Optional[Verdict]],
+            errors: Optional[Dict[int, Exception]] = None
+    ) -> None:
+        """Raise one error for every failing verdict and, if any judge request errored, for those too"""
+        failures = {
+            index: self._uncertain_reason(verdict) if self._is_uncertain(verdict) else verdict.reason
+            for index, verdict in enumerate(verdicts)
+            if verdict is not None and (not verdict.passed or self._is_uncertain(verdict))
+        }
+
+        if errors:
+            error_reasons = {index: f"{type(error).__name__}: {error}" for index, error in errors.items()}
+            raise LLMConnectionError(
+                f"{len(errors)} of {len(verdicts)} judge requests failed"
+                + (f" and {len(failures)} behavioral assertions failed" if failures else ""),
+                reason="; ".join(f"[{index}] {reason}" for index, reason in
+                                 sorted({**failures, **error_reasons}.items())),
+                details={"errors": error_reasons, "failures": failures}
+            ) from next(iter(errors.values()))
+
+        if failures:
+            raise BehavioralAssertionError(
+                f"{len(failures)} of {len(verdicts)} behavioral assertions failed",
+                reason="; ".join(f"[{index}] {reason}" for index, reason in failures.items()),
+                details={"failures": failures}
+            )
+
+    def _raise_on_failure(self, verdict: Verdict) -> None:
+        if self._is_uncertain(verdict):
+            raise UncertainVerdictError(
+                self._uncertain_reason(verdict),
+                reason=verdict.reason,
+                details={
+                    "verdict": "PASS" if verdict.passed else "FAIL",
+                    "threshold": self.confidence_threshold,
+                    **self._verdict_details(verdict)
+                }
+            )
+
+        if not verdict.passed:
             raise BehavioralAssertionError(
                 "Behavioral Assertion Failed: ",
-                reason=result.split("FAIL: ")[1]
+                reason=verdict.reason,
+                details=self._verdict_details(verdict) or None
+            )
+
+    @staticmethod
+    def _verdict_details(verdict: Verdict) -> dict:
+        details = {}
+        if verdict.confidence is not None:
+            details["confidence"] = verdict.confidence
+        if verdict.votes is not None:
+            details["votes"] = {"pass": verdict.votes[0], "fail": verdict.votes[1]}
+        return details
+
+    def _is_uncertain(self, verdict: Verdict) -> bool:
+        return verdict.confidence is not None and verdict.confidence < self.confidence_threshold
+
+    def _uncertain_reason(self, verdict: Verdict) -> str:
+        return (f"Uncertain {'PASS' if verdict.passed else 'FAIL'} verdict, confidence {verdict.confidence:.2f} "
+                f"is below the threshold of {self.confidence_threshold:.2f}")
+
+    def _require_mode_prompts(self, mode: str, *prompt_names: str) -> None:
+        """Refuse to judge with the default prompts of a mode when the standard prompts were customised"""
+        customized = self.custom_prompts.customized
+        if {"system_prompt", "human_prompt"} & customized and not set(prompt_names) & customized:
+            raise LLMConfigurationError(
+                f"Custom prompts are not used by {mode}",
+                reason=f"{mode} judges with its own prompts, so the customised system_prompt and human_prompt would "
+                       f"be ignored; customise {', '.join(prompt_names)} in AsserterPromptConfigurator as well"
+            )
+
+    @staticmethod
+    def _run_local_checks(actual: str, local_checks: List[LocalCheck]) -> None:
+        """Run every local check and raise one LocalCheckError listing all that fail"""
+        failures = [reason for reason in (local_check.check(actual) for local_check in local_checks) if reason]
+
+        if failures:
+            raise LocalCheckError(
+                f"{len(failures)} of {len(local_checks)} local checks failed",
+                reason="; ".join(failures),
+                details={"local_check_failures": failures}
+            )
+
+    def _canonicalize(self, text: str) -> str:
+        return canonicalize_text(text) if self.canonicalize_inputs else text
+
+    def _build_messages(self, actual: str, expected_behavior: str) -> List[BaseMessage]:
+        prompts = self.custom_prompts.prompts
+
+        return build_prompt_messages(
+            prompts.system_prompt,
+            prompts.human_prompt,
+            cache_control=self._cache_control,
+            min_cacheable_tokens=self._min_cacheable_tokens,
+            expected_behavior=expected_behavior,
+            actual=actual
+        )
+
+    def _judge(self, messages: List[BaseMessage], actual: str, expected_behavior: str, votes: int = 1) -> Verdict:
+        """Return the verdict for a judgement, consulting the verdict caches before the LLM"""
+        cache_key = self._verdict_cache_key(messages, actual, self._voted_behavior(expected_behavior, votes))
+
+        cached_verdict = self._cached_verdict(cache_key)
+        if cached_verdict is not None:
+            return cached_verdict
+
+        if self._is_long_input(actual):
+            verdict = self._map_reduce_verdict(actual, expected_behavior, votes)
+        elif votes == 1:
+            verdict = self._cascade_verdict(messages, actual, expected_behavior)
+        else:
+            verdict = self._vote(messages, actual, expected_behavior, votes)
+
+        self._store_verdict(cache_key, verdict)
+
+        return verdict
+
+    async def _ajudge(
+            self,
+            messages: List[BaseMessage],
+            actual: str,
+            expected_behavior: str,
+            votes: int = 1
+    ) -> Verdict:
+        """Async counterpart of _judge that awaits the LLM through ainvoke"""
+        cache_key = self._verdict_cache_key(messages, actual, self._voted_behavior(expected_behavior, votes))
+
+        cached_verdict = self._cached_verdict(cache_key)
+        if cached_verdict is not None:
+            return cached_verdict
+
+        if self._is_long_input(actual):
+            verdict = await self._amap_reduce_verdict(actual, expected_behavior, votes)
+        elif votes == 1:
+            verdict = await self._acascade_verdict(messages, actual, expected_behavior)
+        else:
+            verdict = await self._avote(messages, actual, expected_behavior, votes)
+
+        self._store_verdict(cache_key, verdict)
+
+        return verdict
+
+    def _is_long_input(self, actual: str) -> bool:
+        return 0 < self.long_input_threshold < estimate_text_tokens(actual)
+
+    def _map_reduce_verdict(self, actual: str, expected_behavior: str, votes: int = 1) -> Verdict:
+        """Review the chunks of a long actual output concurrently, then ask for the verdict on their reviews.
+
+        Chunk reviews are single samples of the primary judge; the final request goes through
+        the model cascade, or is voted on when votes is above 1.
+        """
+        chunk_messages, cache_keys, reviews = self._prepare_chunks(actual, expected_behavior)
+        pending = [index for index, review in enumerate(reviews) if review is None]
+
+        if pending:
+            responses = self._batch([chunk_messages[index] for index in pending], self._chunk_concurrency())
+            self._raise_first(
+                self._complete_batch(pending, responses, cache_keys, reviews, parse=VerdictParser.parse_chunk_response)
+            )
+
+        reduce_messages = self._build_reduce_messages(reviews, expected_behavior)
+        if votes == 1:
+            return self._cascade_verdict(reduce_messages, actual, expected_behavior)
+        return self._vote(reduce_messages, actual, expected_behavior, votes)
+
+    async def _amap_reduce_verdict(self, actual: str, expected_behavior: str, votes: int = 1) -> Verdict:
+        """Async counterpart of _map_reduce_verdict"""
+        chunk_messages, cache_keys, reviews = self._prepare_chunks(actual, expected_behavior)
+        pending = [index for index, review in enumerate(reviews) if review is None]
+
+        if pending:
+            responses = await self._abatch([chunk_messages[index] for index in pending], self._chunk_concurrency())
+            self._raise_first(
+                self._complete_batch(pending, responses, cache_keys, reviews, parse=VerdictParser.parse_chunk_response)
+            )
+
+        reduce_messages = self._build_reduce_messages(reviews, expected_behavior)
+        if votes == 1:
+            return await self._acascade_verdict(reduce_messages, actual, expected_behavior)
+        return await self._avote(reduce_messages, actual, expected_behavior, votes)
+
+    def _prepare_chunks(
+            self,
+            actual: str,
+            expected_behavior: str
+    ) -> Tuple[List[List[BaseMessage]], List[Optional[str]], List[Optional[Verdict]]]:
+        """Build messages and cache keys for each chunk, filling in chunk reviews already cached"""
+        prompts = self.custom_prompts.prompts
+        messages, cache_keys, reviews = [], [], []
+
+        for chunk in self.text_chunker.split(actual):
+            chunk_messages = build_prompt_messages(
+                prompts.chunk_system_prompt,
+                prompts.chunk_human_prompt,
+                cache_control=self._cache_control,
+                min_cacheable_tokens=self._min_cacheable_tokens,
+                expected_behavior=expected_behavior,
+                actual=chunk
             )
+            cache_key = self._verdict_cache_key(chunk_messages, chunk, expected_behavior)
+            messages.append(chunk_messages)
+            cache_keys.append(cache_key)
+            reviews.append(self._cached_verdict(cache_key))
+
+        return messages, cache_keys, reviews
+
+    def _chunk_concurrency(self) -> int:
+        return AssertBehavioralMatchesValidator._validate_max_concurrency(self._max_concurrency_or_default(None))
+
+    def _build_reduce_messages(self, reviews: List[Verdict], expected_behavior: str) -> List[BaseMessage]:
+        prompts = self.custom_prompts.prompts
+        excerpt_reviews = "\n".join(
+            f"Excerpt {number}: {'PASS' if review.passed else 'FAIL'}" + (f": {review.reason}" if review.reason else "")
+            for number, review in enumerate(reviews, start=1)
+        )
+
+        return build_prompt_messages(
+            prompts.reduce_system_prompt,
+            prompts.reduce_human_prompt,
+            expected_behavior=expected_behavior,
+            excerpt_reviews=excerpt_reviews
+        )
+
+    def _request_verdict(
+            self,
+            messages: List[BaseMessage],
+            actual: str,
+            expected_behavior: str,
+            llm: Optional[Runnable] = None
+    ) -> Verdict:
+        """Ask the judge (or the given ensemble judge) for a single verdict in the configured verdict mode.
+
+        Two-phase prompts embed the whole actual output, so the final request of a long input
+        is sent as a standard request instead.
+        """
+        if self.verdict_mode == VerdictMode.STREAMING:
+            return VerdictParser.parse(self._stream_verdict(messages, llm=llm))
+        if self.verdict_mode == VerdictMode.TWO_PHASE and not self._is_long_input(actual):
+            return self._two_phase_verdict(actual, expected_behavior, llm=llm)
+        return VerdictParser.parse_response(self._invoke(messages, llm=self._verdict_llm(llm)))
+
+    async def _arequest_verdict(
+            self,
+            messages: List[BaseMessage],
+            actual: str,
+            expected_behavior: str,
+            llm: Optional[Runnable] = None
+    ) -> Verdict:
+        """Async counterpart of _request_verdict"""
+        if self.verdict_mode == VerdictMode.STREAMING:
+            return VerdictParser.parse(await self._astream_verdict(messages, llm=llm))
+        if self.verdict_mode == VerdictMode.TWO_PHASE and not self._is_long_input(actual):
+            return await self._atwo_phase_verdict(actual, expected_behavior, llm=llm)
+        return VerdictParser.parse_response(await self._ainvoke(messages, llm=self._verdict_llm(llm)))
+
+    def _cascade_verdict(self, messages: List[BaseMessage], actual: str, expected_behavior: str) -> Verdict:
+        """Ask the cascade's fast tier first, if configured, and the configured judge when it escalates"""
+        if self.model_cascade is not None:
+            try:
+                verdict = VerdictParser.parse_response(self._invoke(messages, llm=self.model_cascade.verdict_llm))
+            except Exception as e:
+                if not self.model_cascade.escalates_on(e):
+                    raise
+                verdict = None
+            if not self.model_cascade.should_escalate(verdict):
+                return verdict
+
+        return self._request_verdict(messages, actual, expected_behavior)
+
+    async def _acascade_verdict(self, messages: List[BaseMessage], actual: str, expected_behavior: str) -> Verdict:
+        """Async counterpart of _cascade_verdict"""
+        if self.model_cascade is not None:
+            try:
+                verdict = VerdictParser.parse_response(
+                    await self._ainvoke(messages, llm=self.model_cascade.verdict_llm))
+            except Exception as e:
+                if not self.model_cascade.escalates_on(e):
+                    raise
+                verdict = None
+            if not self.model_cascade.should_escalate(verdict):
+                return verdict
+
+        return await self._arequest_verdict(messages, actual, expected_behavior)
+
+    def _vote(self, messages: List[BaseMessage], actual: str, expected_behavior: str, votes: int) -> Verdict:
+        """Draw judge samples in concurrent rounds until the vote is decided"""
+        tally = self._new_tally(votes)
+
+        while tally.next_draw():
+            sample = RunnableLambda(
+                lambda index: self._request_verdict(messages, actual, expected_behavior, llm=self._judge_llm(index))
+            )
+            first = len(tally.samples)
+            for verdict in sample.batch(list(range(first, first + tally.next_draw()))):
+                tally.add(verdict)
+
+        return tally.verdict()
+
+    async def _avote(self, messages: List[BaseMessage], actual: str, expected_behavior: str, votes: int) -> Verdict:
+        """Async counterpart of _vote"""
+        tally = self._new_tally(votes)
+
+        while tally.next_draw():
+            first = len(tally.samples)
+            verdicts = await asyncio.gather(*(
+                self._arequest_verdict(messages, actual, expected_behavior, llm=self._judge_llm(index))
+                for index in range(first, first + tally.next_draw())
+            ))
+            for verdict in verdicts:
+                tally.add(verdict)
+
+        return tally.verdict()
+
+    def _new_tally(self, votes: int) -> VoteTally:
+        return VoteTally(votes, strategy=self.vote_strategy, confidence=self.vote_confidence)
+
+    def _judge_llm(self, index: int) -> Runnable:
+        """The judge for the index-th vote sample, taking the primary judge and ensemble judges in turn"""
+        judges = [self.llm, *self.ensemble_llms]
+        return judges[index % len(judges)]
+
+    def _voted_behavior(self, expected_behavior: str, votes: int) -> str:
+        """Tie voted verdicts in the caches to the vote settings, so they are never mixed with single samples"""
+        if votes == 1:
+            return expected_behavior
+
+        judges = ",".join(provider.value for provider in self.ensemble_providers)
+        return (f"{expected_behavior} [votes={votes}, strategy={self.vote_strategy.value}, "
+                f"confidence={self.vote_confidence}, ensemble={judges}]")
+
+    def _two_phase_verdict(self, actual: str, expected_behavior: str, llm: Optional[Runnable] = None) -> Verdict:
+        """Ask for a bare PASS/FAIL under a tiny max_tokens, and for the reason only when it is FAIL"""
+        verdict_messages = self._build_two_phase_messages(actual, expected_behavior, reason=False)
+        verdict = VerdictParser.parse_response(self._invoke(verdict_messages, llm=self._verdict_only_llm(llm)))
+
+        if verdict.passed:
+            return verdict
+
+        reason_messages = self._build_two_phase_messages(actual, expected_behavior, reason=True)
+        reason = content_text(self._invoke(reason_messages, llm=llm).content).strip()
+        return replace(verdict, reason=reason)
+
+    async def _atwo_phase_verdict(
+            self,
+            actual: str,
+            expected_behavior: str,
+            llm: Optional[Runnable] = None
+    ) -> Verdict:
+        """Async counterpart of _two_phase_verdict"""
+        verdict_messages = self._build_two_phase_messages(actual, expected_behavior, reason=False)
+        verdict = VerdictParser.parse_response(await self._ainvoke(verdict_messages, llm=self._verdict_only_llm(llm)))
+
+        if verdict.passed:
+            return verdict
+
+        reason_messages = self._build_two_phase_messages(actual, expected_behavior, reason=True)
+        reason = content_text((await self._ainvoke(reason_messages, llm=llm)).content).strip()
+        return replace(verdict, reason=reason)
+
+    @classmethod
+    def _supports_logprobs(cls, llm: Runnable) -> bool:
+        """Whether an injected LLM can return logprobs, which only OpenAI chat models do"""
+        return cls._is_openai(llm)
+
+    @staticmethod
+    def _is_openai(llm: Runnable) -> bool:
+        """Whether an injected LLM is an OpenAI chat model, looking through bindings such as with_retry"""
+        while isinstance(llm, RunnableBindingBase):
+            llm = llm.bound
+
+        langchain_openai = sys.modules.get("langchain_openai")
+        return langchain_openai is not None and isinstance(llm, langchain_openai.chat_models.base.BaseChatOpenAI)
+
+    @staticmethod
+    def _is_anthropic(llm: Runnable) -> bool:
+        """Whether an injected LLM is an Anthropic chat model, looking through bindings such as with_retry"""
+        while isinstance(llm, RunnableBindingBase):
+            llm = llm.bound
+
+        langchain_anthropic = sys.modules.get("langchain_anthropic")
+        return langchain_anthropic is not None and isinstance(llm, langchain_anthropic.ChatAnthropic)
+
+    @staticmethod
+    def _anthropic_min_cacheable_tokens(llm: Runnable) -> int:
+        """Shortest prompt prefix an injected Anthropic model caches, looking through bindings such as with_retry"""
+        while isinstance(llm, RunnableBindingBase):
+            llm = llm.bound
+
+        if "haiku" in llm.model:
+            return PromptCacheConstants.HAIKU_MIN_CACHEABLE_TOKENS
+        return PromptCacheConstants.MIN_CACHEABLE_TOKENS
+
+    def _verdict_llm(self, llm: Optional[Runnable] = None) -> Runnable:
+        """The judge LLM, asking for logprobs on the verdict token when verdict confidence is enabled"""
+        llm = llm or self.llm
+        if self.use_verdict_confidence:
+            return llm.bind(logprobs=True)
+        return llm
+
+    def _verdict_only_llm(self, llm: Optional[Runnable] = None) -> Runnable:
+        return self._verdict_llm(llm).bind(max_tokens=VerdictConstants.TWO_PHASE_VERDICT_MAX_TOKENS)
+
+    def _build_two_phase_messages(self, actual: str, expected_behavior: str, reason: bool) -> List[BaseMessage]:
+        prompts = self.custom_prompts.prompts
+        system_prompt = prompts.reason_system_prompt if reason else prompts.verdict_only_system_prompt
+        human_prompt = prompts.reason_human_prompt if reason else prompts.verdict_only_human_prompt
+
+        return build_prompt_messages(
+            system_prompt,
+            human_prompt,
+            cache_control=self._cache_control,
+            min_cacheable_tokens=self._min_cacheable_tokens,
+            expected_behavior=expected_behavior,
+            actual=actual
+        )
+
+    def _stream_verdict(self, messages: List[BaseMessage], llm: Optional[Runnable] = None) -> str:
+        """Stream the judge's response, closing the stream as soon as the verdict is PASS.
+
+        A FAIL is read to the end so the reason can be reported.
+        """
+        llm = llm or self.llm
+        if self._replaying():
+            return content_text(self.cassette.replay(messages, llm).content)
+
+        self._charge_tokens(messages)
+        content = ""
+        stream = llm.stream(messages)
+
+        try:
+            for chunk in stream:
+                content += content_text(chunk.content)
+                if VerdictParser.stream_decision(content):
+                    break
+        finally:
+            stream.close()
+
+        self._record(messages, llm, AIMessage(content=content))
+        return content
+
+    async def _astream_verdict(self, messages: List[BaseMessage], llm: Optional[Runnable] = None) -> str:
+        """Async counterpart of _stream_verdict"""
+        llm = llm or self.llm
+        if self._replaying():
+            return content_text(self.cassette.replay(messages, llm).content)
+
+        await self._acharge_tokens(messages)
+        content = ""
+        stream = llm.astream(messages)
+
+        try:
+            async for chunk in stream:
+                content += content_text(chunk.content)
+                if VerdictParser.stream_decision(content):
+                    break
+        finally:
+            await stream.aclose()
+
+        self._record(messages, llm, AIMessage(content=content))
+        return content
+
+    def _invoke(self, messages: List[BaseMessage], llm: Optional[Runnable] = None) -> Any:
+        """Send one judge request, charging its estimated prompt size to the token rate limiter first"""
+        llm = llm or self.llm
+        if self._replaying():
+            return self.cassette.replay(messages, llm)
+
+        self._charge_tokens(messages)
+        response = llm.invoke(messages)
+        self.prompt_cache_usage.record(response)
+        self._record(messages, llm, response)
+        return response
+
+    async def _ainvoke(self, messages: List[BaseMessage], llm: Optional[Runnable] = None) -> Any:
+        """Async counterpart of _invoke"""
+        llm = llm or self.llm
+        if self._replaying():
+            return self.cassette.replay(messages, llm)
+
+        await self._acharge_tokens(messages)
+        response = await llm.ainvoke(messages)
+        self.prompt_cache_usage.record(response)
+        self._record(messages, llm, response)
+        return response
+
+    def _batch(
+            self,
+            messages: List[List[BaseMessage]],
+            max_concurrency: int,
+            llm: Optional[Runnable] = None
+    ) -> List[Any]:
+        """Send judge requests concurrently, charging each one as it is dispatched"""
+        llm = llm or self._verdict_llm()
+        if self._replaying():
+            return [self.cassette.replay(request, llm) for request in messages]
+
+        responses = self._batch_runnable(llm).batch(
+            messages,
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True
+        )
+        self._record_responses(messages, llm, responses)
+        return responses
+
+    async def _abatch(
+            self,
+            messages: List[List[BaseMessage]],
+            max_concurrency: int,
+            llm: Optional[Runnable] = None
+    ) -> List[Any]:
+        """Async counterpart of _batch"""
+        llm = llm or self._verdict_llm()
+        if self._replaying():
+            return [self.cassette.replay(request, llm) for request in messages]
+
+        responses = await self._batch_runnable(llm).abatch(
+            messages,
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True
+        )
+        self._record_responses(messages, llm, responses)
+        return responses
+
+    def _record_responses(self, messages: List[List[BaseMessage]], llm: Runnable, responses: List[Any]) -> None:
+        for request, response in zip(messages, responses):
+            if not isinstance(response, Exception):
+                self.prompt_cache_usage.record(response)
+                self._record(request, llm, response)
+
+    def _collect_metrics(self, method: str, expected_behavior: str):
+        """Measure an assertion into the metrics registry, if metrics are collected"""
+        return collect_assertion_metrics(
+            self.metrics_registry, method, expected_behavior, self._llm_description.get("model")
+        )
+
+    def _replaying(self) -> bool:
+        return self.cassette is not None and self.cassette.replaying
+
+    def _replay_api_key(self) -> Optional[str]:
+        """Placeholder API key for judges that are only ever replayed, so hermetic runs need no credentials"""
+        return CassetteConstants.REPLAY_API_KEY if self._replaying() else None
+
+    def _record(self, messages: List[BaseMessage], llm: Runnable, response: Any) -> None:
+        if self.cassette is not None:
+            self.cassette.record(messages, llm, response)
+
+    def _batch_runnable(self, llm: Runnable) -> Runnable:
+        if self.token_rate_limiter is None:
+            return llm
+        return RunnableLambda(self._charge_tokens, afunc=self._acharge_tokens) | llm
+
+    def _charge_tokens(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        if self.token_rate_limiter is not None:
+            self.token_rate_limiter.acquire(estimate_prompt_tokens(messages))
+        return messages
+
+    async def _acharge_tokens(self, messages: List[BaseMessage]) -> List[BaseMessage]:
+        if self.token_rate_limiter is not None:
+            await self.token_rate_limiter.aacquire(estimate_prompt_tokens(messages))
+        return messages
+
+    def _verdict_cache_key(self, messages: List[BaseMessage], actual: str, expected_behavior: str) -> Optional[str]:
+        if self.in_memory_verdict_cache is None and self.verdict_cache is None:
+            return None
+
+        # verdicts judged with logprobs carry the confidence that confidence_threshold is checked against
+        llm_description = {**self._llm_description, "verdict_confidence": True} if self.use_verdict_confidence \
+            else self._llm_description
+
+        return VerdictCacheKey.build(
+            llm_description,
+            system_prompt=content_text(messages[0].content),
+            human_prompt=content_text(messages[1].content),
+            actual=actual,
+            expected_behavior=expected_behavior
+        )
+
+    def _cached_verdict(self, cache_key: Optional[str]) -> Optional[Verdict]:
+        """Look up a verdict in the in-memory cache, then the persistent cache"""
+        if cache_key is None:
+            return None
+
+        if self.in_memory_verdict_cache is not None:
+            verdict = self.in_memory_verdict_cache.get(cache_key)
+            if verdict is not None:
+                record_verdict_cache_hit()
+                return verdict
+
+        if self.verdict_cache is not None:
+            verdict = self.verdict_cache.get(cache_key)
+            if verdict is not None:
+                if self.in_memory_verdict_cache is not None:
+                    self.in_memory_verdict_cache.set(cache_key, verdict)
+                record_verdict_cache_hit()
+                return verdict
+
+        return None
+
+    def _store_verdict(self, cache_key: Optional[str], verdict: Verdict) -> None:
+        if cache_key is None or self._is_uncertain(verdict):
+            return
+
+        if self.in_memory_verdict_cache is not None:
+            self.in_memory_verdict_cache.set(cache_key, verdict)
+        if self.verdict_cache is not None:
+            self.verdict_cache.set(cache_key, verdict)
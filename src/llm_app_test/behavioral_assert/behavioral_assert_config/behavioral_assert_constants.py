@@ -14,8 +14,89 @@ class ModelConstants:
     OPENAI_MODELS = {"gpt-4o", "gpt-4-turbo"}
     ANTHROPIC_MODELS = {"claude-3-5-sonnet-latest", "claude-3-opus-latest"}
 
+    # Fast models are only accepted as the first tier of a model cascade
+    FAST_OPENAI_MODEL = "gpt-4o-mini"
+    FAST_ANTHROPIC_MODEL = "claude-3-5-haiku-latest"
+    FAST_OPENAI_MODELS = {"gpt-4o-mini"}
+    FAST_ANTHROPIC_MODELS = {"claude-3-5-haiku-latest"}
+
 class RateLimiterConstants:
     """Constants for rate limiter configuration"""
     REQUESTS_PER_SECOND = 1.0
     CHECK_EVERY_N_SECONDS = 0.1
-    MAX_BUCKET_SIZE = 1
\ No newline at end of file
+    MAX_BUCKET_SIZE = 1
+    BACKEND = "in_memory"
+    STATE_FILE_NAME = "llm_app_test_rate_limiter.state"
+    TOKENS_PER_MINUTE = 0.0  # 0 disables tokens-per-minute limiting
+    CHARS_PER_TOKEN = 4
+    TOKENS_PER_MESSAGE = 4
+    ADAPTIVE_MIN_REQUESTS_PER_SECOND = 0.05
+    ADAPTIVE_MAX_REQUESTS_PER_SECOND = 20.0
+    ADAPTIVE_ADDITIVE_INCREASE = 0.1
+    ADAPTIVE_MULTIPLICATIVE_DECREASE = 0.5
+
+class VerdictCacheConstants:
+    """Constants for verdict cache configuration"""
+    DEFAULT_PATH = ".llm_app_test_cache/verdicts.sqlite3"
+    BUSY_TIMEOUT_SECONDS = 30.0
+    IN_MEMORY_MAX_SIZE = 1024
+    IN_MEMORY_TTL_SECONDS = 3600.0
+
+
+class BatchConstants:
+    """Constants for batch assertion configuration"""
+    DEFAULT_MAX_CONCURRENCY = 8
+
+
+class VerdictConstants:
+    """Constants for verdict configuration"""
+    DEFAULT_MODE = "standard"
+    TWO_PHASE_VERDICT_MAX_TOKENS = 5
+    DEFAULT_CONFIDENCE_THRESHOLD = 0.0
+
+
+class VoteConstants:
+    """Defaults for self-consistency voting"""
+    DEFAULT_STRATEGY = "majority"
+    DEFAULT_CONFIDENCE = 0.95
+    JUDGE_ACCURACY = 0.9  # assumed chance that a single judge sample is right, used by the sprt strategy
+
+
+class CascadeConstants:
+    """Defaults for the model cascade"""
+    DEFAULT_CONFIDENCE_THRESHOLD = 0.0  # 0 only escalates FAIL verdicts
+
+
+class PromptCacheConstants:
+    """Anthropic's minimum cacheable prompt prefix, in tokens; shorter prefixes are never cached"""
+    MIN_CACHEABLE_TOKENS = 1024  # Sonnet and Opus
+    HAIKU_MIN_CACHEABLE_TOKENS = 2048
+
+
+class LongInputConstants:
+    """Defaults for map-reduce judging of long actual outputs, in estimated tokens"""
+    THRESHOLD_TOKENS = 0  # opt-in; 0 always sends the actual output whole
+    CHUNK_SIZE_TOKENS = 8000
+    CHUNK_OVERLAP_TOKENS = 200
+
+
+class CassetteConstants:
+    """Defaults for recording and replaying judge calls"""
+    DEFAULT_PATH = ".llm_app_test_cache/cassette.jsonl"
+    KEY_VERSION = 1
+    REPLAY_API_KEY = "cassette-replay"  # placeholder so replayed judges can be built without credentials
+
+
+class MetricsConstants:
+    """Defaults for per-assertion metrics"""
+    MAX_RECORDS = 10000  # assertions kept individually; totals cover every assertion
+    PERF_REPORT_SLOWEST = 10  # assertions listed by --llm-perf-report without a count
+    # USD per million input, cached input and output tokens, used to estimate the cost of a run
+    MODEL_PRICES_PER_MILLION_TOKENS = {
+        "gpt-4o": (2.50, 1.25, 10.00),
+        "gpt-4o-mini": (0.15, 0.075, 0.60),
+        "gpt-4-turbo": (10.00, 10.00, 30.00),
+        "claude-3-5-sonnet-latest": (3.00, 0.30, 15.00),
+        "claude-3-5-haiku-latest": (0.80, 0.08, 4.00),
+        "claude-3-opus-latest": (15.00, 1.50, 75.00),
+    }
@@ -14,4 +14,5 @@ class LLMConfig:
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
     max_retries: Optional[int] = None
-    timeout: Optional[float] = None
\ No newline at end of file
+    timeout: Optional[float] = None
+    base_url: Optional[str] = None
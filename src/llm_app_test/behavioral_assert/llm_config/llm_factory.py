@@ -1,13 +1,38 @@
-from typing import Optional
+import importlib
+from typing import Dict, Optional, TYPE_CHECKING
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.rate_limiters import InMemoryRateLimiter
-from langchain_openai import ChatOpenAI
 
 from llm_app_test.behavioral_assert.llm_config.llm_config import LLMConfig
 from llm_app_test.behavioral_assert.llm_config.llm_provider_enum import LLMProvider
 
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from langchain_openai import ChatOpenAI
+
+# Provider chat models are imported on first use: the provider SDKs are slow to import and
+# the pytest plugin loads this module on every run, including runs that never call an LLM.
+_PROVIDER_CLASSES = {
+    "ChatOpenAI": ("langchain_openai", "ChatOpenAI"),
+    "ChatAnthropic": ("langchain_anthropic", "ChatAnthropic"),
+}
+
+
+def __getattr__(name: str):
+    """Import a provider chat model class on first access and cache it on the module"""
+    if name not in _PROVIDER_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, class_name = _PROVIDER_CLASSES[name]
+    provider_class = getattr(importlib.import_module(module_name), class_name)
+    globals()[name] = provider_class
+    return provider_class
+
+
+def _provider_class(name: str):
+    """Resolve a provider chat model class, honouring any module-level override such as a test patch"""
+    return globals()[name] if name in globals() else __getattr__(name)
+
 
 class LLMFactory:
     """Factory class for creating LLM instances"""
@@ -20,27 +45,34 @@ class LLMFactory:
         return LLMFactory._create_anthropic_llm(config, rate_limiter)
 
     @staticmethod
-    def _create_openai_llm(config: LLMConfig, rate_limiter: Optional[InMemoryRateLimiter] = None) -> ChatOpenAI:
+    def _create_openai_llm(config: LLMConfig, rate_limiter: Optional[InMemoryRateLimiter] = None) -> "ChatOpenAI":
         """Create and configure OpenAI LLM instance"""
-        return ChatOpenAI(
+        return _provider_class("ChatOpenAI")(
             temperature=config.temperature,
             model_name=config.model,
             openai_api_key=config.api_key,
             max_retries=config.max_retries,
             max_tokens=config.max_tokens,
             request_timeout=config.timeout,
-            rate_limiter=rate_limiter
+            rate_limiter=rate_limiter,
+            **LLMFactory._base_url_kwargs(config)
         )
 
     @staticmethod
-    def _create_anthropic_llm(config: LLMConfig, rate_limiter: Optional[InMemoryRateLimiter] = None) -> ChatAnthropic:
+    def _create_anthropic_llm(config: LLMConfig, rate_limiter: Optional[InMemoryRateLimiter] = None) -> "ChatAnthropic":
         """Create and configure Anthropic LLM instance"""
-        return ChatAnthropic(
+        return _provider_class("ChatAnthropic")(
             temperature=config.temperature,
             model=config.model,
             anthropic_api_key=config.api_key,
             max_retries=config.max_retries,
             max_tokens=config.max_tokens,
             default_request_timeout=config.timeout,
-            rate_limiter=rate_limiter
+            rate_limiter=rate_limiter,
+            **LLMFactory._base_url_kwargs(config)
         )
+
+    @staticmethod
+    def _base_url_kwargs(config: LLMConfig) -> Dict[str, str]:
+        """Point the chat model at a custom endpoint, leaving the SDK's own default untouched when unset"""
+        return {"base_url": config.base_url} if config.base_url else {}
@@ -0,0 +1,16 @@
+from typing import Any
+
+
+def content_text(content: Any) -> str:
+    """Flatten string or content-block message content to its text"""
+    if isinstance(content, str):
+        return content
+
+    parts = []
+    for block in content:
+        if isinstance(block, str):
+            parts.append(block)
+        elif isinstance(block, dict) and isinstance(block.get("text"), str):
+            parts.append(block["text"])
+
+    return "".join(parts)
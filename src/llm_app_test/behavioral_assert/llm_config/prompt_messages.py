@@ -0,0 +1,74 @@
+from typing import List
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from llm_app_test.rate_limiter.token_estimator import estimate_text_tokens
+
+# Anthropic prompt-cache breakpoint; everything up to and including a marked block is cached
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def build_prompt_messages(
+        system_prompt: str,
+        human_prompt: str,
+        cache_control: bool = False,
+        min_cacheable_tokens: int = 0,
+        **values: str
+) -> List[BaseMessage]:
+    """
+    Build the system and human messages of a judge request.
+
+    Without cache_control the human prompt is formatted into a plain string. With it, both
+    messages are sent as text blocks carrying Anthropic cache_control breakpoints: one after
+    the static system prompt, and one after the part of the human prompt that precedes
+    {actual}, which holds the expected behavior in the default prompts. Requests that share
+    a system prompt and expected behavior can then reuse the cached prefix and only pay full
+    price for the actual output. The text sent is the same either way.
+
+    Anthropic does not cache a prefix shorter than a model-specific minimum, so a breakpoint
+    is only added where the estimated length of the prompt up to it reaches
+    min_cacheable_tokens. If neither does, plain messages are returned.
+
+    Args:
+        system_prompt: The system prompt
+        human_prompt: The human prompt template
+        cache_control: Whether to add Anthropic cache_control breakpoints
+        min_cacheable_tokens: Minimum estimated prefix length for a breakpoint to be added
+        **values: Values for the placeholders of the human prompt
+
+    Returns:
+        List[BaseMessage]: The system message followed by the human message
+    """
+    plain_messages = [SystemMessage(content=system_prompt), HumanMessage(content=human_prompt.format(**values))]
+    if not cache_control:
+        return plain_messages
+
+    shared, placeholder, rest = human_prompt.partition("{actual}")
+    shared_text = shared.format(**values)
+    rest_text = values["actual"] + rest.format(**values) if placeholder else ""
+
+    system_tokens = estimate_text_tokens(system_prompt)
+    cache_system = system_tokens >= min_cacheable_tokens
+    cache_shared = bool(shared_text.strip()) and \
+        system_tokens + estimate_text_tokens(shared_text) >= min_cacheable_tokens
+    if not cache_system and not cache_shared:
+        return plain_messages
+
+    # Anthropic rejects empty text blocks, so only non-empty parts are sent
+    human_blocks = []
+    if shared_text.strip():
+        human_blocks.append(_text_block(shared_text, cache_shared))
+    if rest_text:
+        human_blocks.append(_text_block(rest_text, False))
+
+    return [
+        SystemMessage(content=[_text_block(system_prompt, cache_system)]),
+        HumanMessage(content=human_blocks)
+    ]
+
+
+def _text_block(text: str, cache_control: bool) -> dict:
+    block = {"type": "text", "text": text}
+    if cache_control:
+        block["cache_control"] = EPHEMERAL_CACHE_CONTROL
+    return block
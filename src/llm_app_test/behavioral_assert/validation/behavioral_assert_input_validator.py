@@ -1,4 +1,5 @@
-from llm_app_test.exceptions.test_exceptions import InvalidPromptError
+from llm_app_test.exceptions.test_exceptions import InvalidPromptError, LLMConfigurationError
+from llm_app_test.local_checks.local_check import LocalCheck
 
 
 class AssertBehavioralMatchValidator:
@@ -39,3 +40,128 @@ class AssertBehavioralMatchValidator:
             raise InvalidPromptError(
                 f"Invalid expected_behavior argument: {expected_behavior}'",
                 reason=f"expected_behavior must be a string, got {type(expected_behavior).__name__}")
+
+
+class AssertBehavioralMatchesValidator:
+    """Validator for assert_behavioral_matches inputs"""
+
+    @staticmethod
+    def validate(pairs, max_concurrency):
+        """Validates the (actual, expected_behavior) pairs and the concurrency limit.
+
+            Args:
+                pairs: Sequence of (actual, expected_behavior) tuples
+                max_concurrency: Maximum number of judgements in flight at once
+
+            Returns:
+                tuple: The pairs as a list, so a generator is only consumed once, and the
+                    validated max_concurrency
+
+            Raises:
+                InvalidPromptError: If pairs is malformed or any pair fails validation
+                LLMConfigurationError: If max_concurrency is not a positive integer
+            """
+        if pairs is None or isinstance(pairs, (str, bytes)) or not hasattr(pairs, '__iter__'):
+            raise InvalidPromptError(
+                f"Invalid pairs argument: {pairs}'",
+                reason="pairs must be a sequence of (actual, expected_behavior) tuples")
+
+        pairs = list(pairs)
+        for index, pair in enumerate(pairs):
+            if not isinstance(pair, (tuple, list)) or len(pair) != 2:
+                raise InvalidPromptError(
+                    f"Invalid pair at index {index}: {pair}'",
+                    reason="each pair must be an (actual, expected_behavior) tuple")
+            AssertBehavioralMatchValidator.validate(pair[0], pair[1])
+
+        return pairs, AssertBehavioralMatchesValidator._validate_max_concurrency(max_concurrency)
+
+    @staticmethod
+    def _validate_max_concurrency(max_concurrency):
+        try:
+            max_concurrency_int = int(max_concurrency)
+
+        except (ValueError, TypeError):
+            raise LLMConfigurationError(
+                f"Invalid max_concurrency value: {max_concurrency}",
+                reason="max_concurrency must be a positive integer")
+
+        if isinstance(max_concurrency, bool) or max_concurrency_int <= 0 or max_concurrency_int != float(max_concurrency):
+            raise LLMConfigurationError(
+                f"Invalid max_concurrency value: {max_concurrency}",
+                reason="max_concurrency must be a positive integer")
+
+        return max_concurrency_int
+
+
+class AssertBehavioralMatchAllValidator:
+    """Validator for assert_behavioral_match_all inputs"""
+
+    @staticmethod
+    def validate(actual, expected_behaviors):
+        """Validates the actual output and the list of expected behaviors.
+
+            Args:
+                actual: The actual output to validate
+                expected_behaviors: Sequence of expected behaviors to validate against
+
+            Returns:
+                list: The expected behaviors as a list, so a generator is only consumed once
+
+            Raises:
+                InvalidPromptError: If actual is invalid, expected_behaviors is empty or malformed,
+                    or any expected behavior is invalid
+            """
+        AssertBehavioralMatchValidator._validate_actual(actual)
+
+        if expected_behaviors is None or isinstance(expected_behaviors, (str, bytes)) \
+                or not hasattr(expected_behaviors, '__iter__'):
+            raise InvalidPromptError(
+                f"Invalid expected_behaviors argument: {expected_behaviors}'",
+                reason="expected_behaviors must be a sequence of strings")
+
+        expected_behaviors = list(expected_behaviors)
+        if len(expected_behaviors) == 0:
+            raise InvalidPromptError(
+                f"Invalid expected_behaviors argument: {expected_behaviors}'",
+                reason="expected_behaviors must contain at least one expected behavior")
+
+        for expected_behavior in expected_behaviors:
+            AssertBehavioralMatchValidator._validate_expected_behavior(expected_behavior)
+
+        return expected_behaviors
+
+
+class LocalChecksValidator:
+    """Validator for the local_checks argument of assert_behavioral_match"""
+
+    @staticmethod
+    def validate(local_checks):
+        """Validates that local_checks is None or a sequence of LocalCheck instances.
+
+            Args:
+                local_checks: The local checks to run before the LLM judge
+
+            Returns:
+                list: The local checks, empty if none were given
+
+            Raises:
+                InvalidPromptError: If local_checks is not a sequence of LocalCheck instances
+            """
+        if local_checks is None:
+            return []
+        if isinstance(local_checks, LocalCheck):
+            local_checks = [local_checks]
+        if isinstance(local_checks, (str, bytes)) or not hasattr(local_checks, "__iter__"):
+            raise InvalidPromptError(
+                f"Invalid local_checks argument: {local_checks!r}",
+                reason="local_checks must be a sequence of LocalCheck instances")
+
+        local_checks = list(local_checks)
+        for index, local_check in enumerate(local_checks):
+            if not isinstance(local_check, LocalCheck):
+                raise InvalidPromptError(
+                    f"Invalid local check at index {index}: {local_check!r}",
+                    reason=f"local checks must be LocalCheck instances, got {type(local_check).__name__}")
+
+        return local_checks
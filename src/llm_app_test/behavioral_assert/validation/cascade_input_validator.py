@@ -0,0 +1,46 @@
+from typing import Union
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import ModelConstants
+from llm_app_test.behavioral_assert.llm_config.llm_provider_enum import LLMProvider
+from llm_app_test.exceptions.test_exceptions import LLMConfigurationError
+
+
+class CascadeInputsValidator:
+    """Validator for model cascade parameters"""
+
+    @staticmethod
+    def validate_model(model: str, provider: LLMProvider) -> str:
+        valid_models = ModelConstants.FAST_OPENAI_MODELS if provider == LLMProvider.OPENAI \
+            else ModelConstants.FAST_ANTHROPIC_MODELS
+
+        if model not in valid_models:
+            raise LLMConfigurationError(
+                f"Invalid cascade model: {model}",
+                reason=f"Invalid cascade model - supported fast models for provider: {sorted(valid_models)}"
+            )
+
+        return model
+
+    @staticmethod
+    def validate_confidence_threshold(value: Union[str, float], provider: LLMProvider) -> float:
+        try:
+            threshold = float(value)
+        except (ValueError, TypeError) as e:
+            raise LLMConfigurationError(
+                f"Invalid cascade_confidence_threshold: {value}",
+                reason="cascade_confidence_threshold must be a number between 0 and 1"
+            ) from e
+
+        if not 0 <= threshold <= 1:
+            raise LLMConfigurationError(
+                f"Invalid cascade_confidence_threshold: {value}",
+                reason="cascade_confidence_threshold must be a number between 0 and 1"
+            )
+
+        if threshold > 0 and provider != LLMProvider.OPENAI:
+            raise LLMConfigurationError(
+                "Cascade confidence is not available for this provider",
+                reason="cascade_confidence_threshold needs token logprobs, which are only requested from OpenAI"
+            )
+
+        return threshold
@@ -0,0 +1,20 @@
+from typing import Union
+
+from llm_app_test.cassette.cassette_mode_enum import CassetteMode
+from llm_app_test.exceptions.test_exceptions import LLMConfigurationError
+
+
+class CassetteInputsValidator:
+    """Validator for the cassette_mode parameter"""
+
+    @staticmethod
+    def validate_mode(value: Union[str, CassetteMode]) -> CassetteMode:
+        if isinstance(value, CassetteMode):
+            return value
+        try:
+            return CassetteMode(str(value).lower())
+        except ValueError as e:
+            raise LLMConfigurationError(
+                f"Invalid cassette mode: {value}",
+                reason=f"cassette_mode must be one of {[mode.value for mode in CassetteMode]}"
+            ) from e
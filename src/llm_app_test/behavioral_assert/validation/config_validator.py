@@ -27,6 +27,7 @@ class ConfigValidator:
         ConfigValidator._validate_temperature(config.temperature)
         ConfigValidator._validate_max_tokens(config.max_tokens)
         ConfigValidator._validate_timeout(config.timeout)
+        ConfigValidator._validate_base_url(config.base_url)
         return provider
 
     @staticmethod
@@ -69,6 +70,14 @@ class ConfigValidator:
                 reason="timeout must be positive"
             )
 
+    @staticmethod
+    def _validate_base_url(base_url: Optional[str]) -> None:
+        if base_url is not None and not base_url.startswith(("http://", "https://")):
+            raise LLMConfigurationError(
+                f"Invalid base_url value: {base_url}",
+                reason="base_url must be an http:// or https:// URL"
+            )
+
     @staticmethod
     def _validate_provider(provider: str) -> LLMProvider:
         try:
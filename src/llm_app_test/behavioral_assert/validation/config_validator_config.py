@@ -12,3 +12,4 @@ class ConfigValidatorConfig:
     temperature: Optional[float]
     max_tokens: Optional[int]
     timeout: Optional[float]
+    base_url: Optional[str] = None
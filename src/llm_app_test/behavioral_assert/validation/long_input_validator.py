@@ -0,0 +1,41 @@
+from typing import Union
+
+from llm_app_test.exceptions.test_exceptions import LLMConfigurationError
+
+
+class LongInputInputsValidator:
+    """Validator for map-reduce judging parameters"""
+
+    @staticmethod
+    def validate_threshold(value: Union[str, int]) -> int:
+        return LongInputInputsValidator._validate_tokens("long_input_threshold", value, minimum=0)
+
+    @staticmethod
+    def validate_chunk_size(value: Union[str, int]) -> int:
+        return LongInputInputsValidator._validate_tokens("chunk_size", value, minimum=1)
+
+    @staticmethod
+    def validate_chunk_overlap(value: Union[str, int], chunk_size: int) -> int:
+        overlap = LongInputInputsValidator._validate_tokens("chunk_overlap", value, minimum=0)
+
+        if overlap >= chunk_size:
+            raise LLMConfigurationError(
+                f"Invalid chunk_overlap: {value}",
+                reason=f"chunk_overlap must be smaller than chunk_size ({chunk_size})"
+            )
+
+        return overlap
+
+    @staticmethod
+    def _validate_tokens(name: str, value: Union[str, int], minimum: int) -> int:
+        reason = f"{name} must be an integer number of tokens of at least {minimum}"
+
+        try:
+            tokens = int(value)
+        except (ValueError, TypeError) as e:
+            raise LLMConfigurationError(f"Invalid {name}: {value}", reason=reason) from e
+
+        if isinstance(value, bool) or tokens < minimum or tokens != float(value):
+            raise LLMConfigurationError(f"Invalid {name}: {value}", reason=reason)
+
+        return tokens
@@ -1,6 +1,7 @@
-from typing import Union
+from typing import Union, Tuple
 
 from llm_app_test.exceptions.test_exceptions import RateLimiterConfigurationError
+from llm_app_test.rate_limiter.rate_limiter_backend_enum import RateLimiterBackend
 
 
 class RateLimiterInputsValidator:
@@ -37,3 +38,42 @@ class RateLimiterInputsValidator:
     @classmethod
     def validate_max_bucket_size(cls, value: Union[str, float]) -> float:
         return cls.validate_non_negative_float(value, "max_bucket_size")
+
+    @classmethod
+    def validate_tokens_per_minute(cls, value: Union[str, float]) -> float:
+        return cls.validate_non_negative_float(value, "tokens_per_minute")
+
+    @classmethod
+    def validate_adaptive_bounds(
+            cls,
+            min_value: Union[str, float],
+            max_value: Union[str, float]
+    ) -> Tuple[float, float]:
+        min_float = cls.validate_non_negative_float(min_value, "min_requests_per_second")
+        max_float = cls.validate_non_negative_float(max_value, "max_requests_per_second")
+
+        if min_float <= 0 or min_float > max_float:
+            raise RateLimiterConfigurationError(
+                message=f"Invalid adaptive rate limiter bounds: min {min_value}, max {max_value}.",
+                reason="min_requests_per_second must be positive and no greater than max_requests_per_second.")
+
+        return min_float, max_float
+
+    @classmethod
+    def validate_backend(cls, value: Union[str, RateLimiterBackend]) -> RateLimiterBackend:
+        if isinstance(value, RateLimiterBackend):
+            return value
+        try:
+            return RateLimiterBackend(str(value).lower())
+        except ValueError as e:
+            raise RateLimiterConfigurationError(
+                message=f"Invalid rate limiter backend: {value}.",
+                reason=f"backend must be one of {[backend.value for backend in RateLimiterBackend]}.") from e
+
+    @classmethod
+    def validate_state_file(cls, value: str) -> str:
+        if not isinstance(value, str) or not value.strip():
+            raise RateLimiterConfigurationError(
+                message=f"Invalid rate limiter state file: {value}.",
+                reason="state_file must be a non-empty path.")
+        return value
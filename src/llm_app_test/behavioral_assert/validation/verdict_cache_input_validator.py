@@ -0,0 +1,41 @@
+from typing import Union
+
+from llm_app_test.exceptions.test_exceptions import VerdictCacheConfigurationError
+
+
+class VerdictCacheInputsValidator:
+    """Validator for in-memory verdict cache parameters"""
+
+    @classmethod
+    def validate_max_size(cls, value: Union[str, int]) -> int:
+        try:
+            int_value = int(value)
+
+        except (ValueError, TypeError) as e:
+            raise VerdictCacheConfigurationError(
+                message=f"Conversion to int failed for max_size: {value}.",
+                reason="max_size must be a valid positive integer.") from e
+
+        if int_value <= 0:
+            raise VerdictCacheConfigurationError(
+                message=f"Non-positive value passed for max_size: {value}.",
+                reason="max_size must be a valid positive integer.")
+
+        return int_value
+
+    @classmethod
+    def validate_ttl_seconds(cls, value: Union[str, float]) -> float:
+        try:
+            float_value = float(value)
+
+        except (ValueError, TypeError) as e:
+            raise VerdictCacheConfigurationError(
+                message=f"Conversion to float failed for ttl_seconds: {value}.",
+                reason="ttl_seconds must be a valid non-negative float.") from e
+
+        if float_value < 0:
+            raise VerdictCacheConfigurationError(
+                message=f"Negative float value passed for ttl_seconds: {value}.",
+                reason="ttl_seconds must be a valid non-negative float.")
+
+        return float_value
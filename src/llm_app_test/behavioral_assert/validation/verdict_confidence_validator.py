@@ -0,0 +1,52 @@
+from typing import Union
+
+from llm_app_test.behavioral_assert.verdict.verdict_mode_enum import VerdictMode
+from llm_app_test.exceptions.test_exceptions import LLMConfigurationError
+
+
+class VerdictConfidenceValidator:
+    """Validator for verdict confidence parameters"""
+
+    @staticmethod
+    def validate_threshold(value: Union[str, float]) -> float:
+        try:
+            threshold = float(value)
+        except (ValueError, TypeError) as e:
+            raise LLMConfigurationError(
+                f"Invalid confidence_threshold: {value}",
+                reason="confidence_threshold must be a number between 0 and 1"
+            ) from e
+
+        if not 0 <= threshold <= 1:
+            raise LLMConfigurationError(
+                f"Invalid confidence_threshold: {value}",
+                reason="confidence_threshold must be a number between 0 and 1"
+            )
+
+        return threshold
+
+    @staticmethod
+    def validate_verdict_mode(threshold: float, verdict_mode: VerdictMode) -> None:
+        if threshold > 0 and verdict_mode == VerdictMode.STREAMING:
+            raise LLMConfigurationError(
+                f"Invalid confidence_threshold: {threshold}",
+                reason="Streamed verdicts carry no confidence, so confidence_threshold cannot be used with the "
+                       "streaming verdict mode"
+            )
+
+    @staticmethod
+    def validate_multi_criteria(threshold: float) -> None:
+        if threshold > 0:
+            raise LLMConfigurationError(
+                f"Invalid confidence_threshold: {threshold}",
+                reason="Multi-criteria verdicts carry no confidence, so assert_behavioral_match_all cannot apply "
+                       "confidence_threshold"
+            )
+
+    @staticmethod
+    def validate_supported(supported: bool) -> None:
+        if not supported:
+            raise LLMConfigurationError(
+                "Verdict confidence is not available for this LLM",
+                reason="Verdict confidence needs token logprobs, which are only requested from OpenAI chat models"
+            )
@@ -0,0 +1,20 @@
+from typing import Union
+
+from llm_app_test.behavioral_assert.verdict.verdict_mode_enum import VerdictMode
+from llm_app_test.exceptions.test_exceptions import LLMConfigurationError
+
+
+class VerdictModeValidator:
+    """Validator for the verdict_mode parameter"""
+
+    @staticmethod
+    def validate(value: Union[str, VerdictMode]) -> VerdictMode:
+        if isinstance(value, VerdictMode):
+            return value
+        try:
+            return VerdictMode(str(value).lower())
+        except ValueError as e:
+            raise LLMConfigurationError(
+                f"Invalid verdict mode: {value}",
+                reason=f"verdict_mode must be one of {[mode.value for mode in VerdictMode]}"
+            ) from e
@@ -0,0 +1,71 @@
+from typing import List, Optional, Sequence, Union
+
+from llm_app_test.behavioral_assert.llm_config.llm_provider_enum import LLMProvider
+from llm_app_test.behavioral_assert.verdict.vote_strategy_enum import VoteStrategy
+from llm_app_test.exceptions.test_exceptions import LLMConfigurationError
+
+
+class VoteInputsValidator:
+    """Validator for self-consistency voting parameters"""
+
+    @staticmethod
+    def validate_votes(value: Optional[int]) -> int:
+        if value is None:
+            return 1
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise LLMConfigurationError(
+                f"Invalid votes: {value}",
+                reason="votes must be a positive integer"
+            )
+        return value
+
+    @staticmethod
+    def validate_strategy(value: Union[str, VoteStrategy]) -> VoteStrategy:
+        if isinstance(value, VoteStrategy):
+            return value
+        try:
+            return VoteStrategy(str(value).lower())
+        except ValueError as e:
+            raise LLMConfigurationError(
+                f"Invalid vote strategy: {value}",
+                reason=f"vote_strategy must be one of {[strategy.value for strategy in VoteStrategy]}"
+            ) from e
+
+    @staticmethod
+    def validate_confidence(value: Union[str, float]) -> float:
+        try:
+            confidence = float(value)
+        except (ValueError, TypeError) as e:
+            raise LLMConfigurationError(
+                f"Invalid vote_confidence: {value}",
+                reason="vote_confidence must be a number strictly between 0.5 and 1"
+            ) from e
+
+        if not 0.5 < confidence < 1:
+            raise LLMConfigurationError(
+                f"Invalid vote_confidence: {value}",
+                reason="vote_confidence must be a number strictly between 0.5 and 1"
+            )
+
+        return confidence
+
+    @staticmethod
+    def validate_ensemble_providers(value: Union[str, Sequence[Union[str, LLMProvider]]]) -> List[LLMProvider]:
+        """Accept a sequence of providers or a comma-separated string such as "openai,anthropic" """
+        if isinstance(value, str):
+            value = [provider for provider in value.split(",") if provider.strip()]
+
+        providers = []
+        for provider in value:
+            if isinstance(provider, LLMProvider):
+                providers.append(provider)
+                continue
+            try:
+                providers.append(LLMProvider(str(provider).strip().lower()))
+            except ValueError as e:
+                raise LLMConfigurationError(
+                    f"Invalid ensemble provider: {provider}",
+                    reason=f"ensemble_providers must only contain {[member.value for member in LLMProvider]}"
+                ) from e
+
+        return providers
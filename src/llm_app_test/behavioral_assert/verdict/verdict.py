@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Verdict:
+    """Holds the outcome of a single behavioral judgement"""
+    passed: bool
+    reason: Optional[str] = None
+    confidence: Optional[float] = None
+    votes: Optional[Tuple[int, int]] = None  # (pass, fail) sample counts when the verdict was voted on
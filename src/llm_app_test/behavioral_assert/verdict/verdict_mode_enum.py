@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class VerdictMode(Enum):
+    STANDARD = "standard"
+    STREAMING = "streaming"
+    TWO_PHASE = "two_phase"
@@ -0,0 +1,176 @@
+import math
+import re
+from dataclasses import replace
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage
+
+from llm_app_test.behavioral_assert.llm_config.message_text import content_text
+
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+
+
+class VerdictParser:
+    """Parser for the PASS / FAIL responses returned by the asserter LLM"""
+
+    FAIL_PREFIX = "FAIL"
+
+    MISSING_CRITERION_REASON = "The asserter returned no verdict for this expected behavior"
+
+    # Matches '1. PASS', '2) FAIL: reason', '**3.** FAIL - reason', '[4] PASS', 'Criterion 5: PASS' etc.
+    _CRITERION_LINE = re.compile(
+        r"^[\s*#>\-\[(]*(?:criterion|behaviou?r)?\s*(\d+)[\s.):\]*\-]*(PASS|FAIL)\b[\s*:\-]*(.*)$",
+        re.IGNORECASE
+    )
+
+    @staticmethod
+    def parse(content: str) -> Verdict:
+        """
+        Parse an asserter response into a Verdict.
+
+        Any response that does not start with 'FAIL' is treated as a pass, matching the
+        behaviour of the original inline check in assert_behavioral_match.
+
+        Args:
+            content: The raw content returned by the asserter LLM
+
+        Returns:
+            Verdict: The parsed verdict
+        """
+        if not content.startswith(VerdictParser.FAIL_PREFIX):
+            return Verdict(passed=True)
+
+        _, separator, reason = content.partition("FAIL: ")
+        if not separator:
+            reason = content[len(VerdictParser.FAIL_PREFIX):].lstrip(": ").strip()
+
+        return Verdict(passed=False, reason=reason)
+
+    @staticmethod
+    def parse_response(response: BaseMessage) -> Verdict:
+        """
+        Parse an asserter response message into a Verdict, including its confidence if the
+        response carries logprobs.
+
+        Args:
+            response: The message returned by the asserter LLM
+
+        Returns:
+            Verdict: The parsed verdict
+        """
+        verdict = VerdictParser.parse(content_text(response.content))
+        response_metadata = getattr(response, "response_metadata", None)
+        confidence = VerdictParser.parse_confidence(response_metadata if isinstance(response_metadata, dict) else {})
+
+        return replace(verdict, confidence=confidence) if confidence is not None else verdict
+
+    @staticmethod
+    def parse_chunk_response(response: BaseMessage) -> Verdict:
+        """
+        Parse the review of one excerpt of a long actual output into a Verdict.
+
+        Unlike parse, the notes following 'PASS:' are kept as the reason of a passing
+        verdict, as the final reduce request needs to know what each excerpt showed.
+
+        Args:
+            response: The message returned by the asserter LLM for the excerpt
+
+        Returns:
+            Verdict: The excerpt's verdict, with its notes or failure reason
+        """
+        content = content_text(response.content).strip()
+        verdict = VerdictParser.parse(content)
+        if not verdict.passed:
+            return verdict
+
+        notes = content[len("PASS"):] if content.upper().startswith("PASS") else content
+        return Verdict(passed=True, reason=notes.lstrip(": -").strip() or None)
+
+    @staticmethod
+    def parse_confidence(response_metadata: Dict[str, Any]) -> Optional[float]:
+        """
+        Read the probability of the verdict token from OpenAI-style logprobs.
+
+        The first non-whitespace token decides between PASS and FAIL, so its probability is
+        the judge's confidence in the verdict.
+
+        Args:
+            response_metadata: The response_metadata of the asserter's message
+
+        Returns:
+            Optional[float]: Confidence between 0 and 1, or None without logprobs
+        """
+        logprobs = response_metadata.get("logprobs")
+        if not isinstance(logprobs, dict):
+            return None
+
+        for token in logprobs.get("content") or []:
+            if token.get("token", "").strip():
+                return math.exp(token["logprob"])
+
+        return None
+
+    @staticmethod
+    def stream_decision(prefix: str) -> Optional[bool]:
+        """
+        Decide a verdict from the start of a streamed response, as parse would.
+
+        Args:
+            prefix: The response content received so far
+
+        Returns:
+            Optional[bool]: True once the response can no longer start with 'FAIL', False once
+            it does, None while the prefix is still ambiguous
+        """
+        if prefix.startswith(VerdictParser.FAIL_PREFIX):
+            return False
+        if not prefix or VerdictParser.FAIL_PREFIX.startswith(prefix):
+            return None
+        return True
+
+    @staticmethod
+    def parse_multi_criteria(content: str, count: int) -> List[Verdict]:
+        """
+        Parse a multi-criteria asserter response into one Verdict per expected behavior.
+
+        Lines are matched by their criterion number rather than position, common markdown
+        decoration is tolerated and reasons that wrap onto following lines are joined.
+        Criteria missing from the response are reported as failures, so a malformed
+        response can never produce a false pass.
+
+        Args:
+            content: The raw content returned by the asserter LLM
+            count: The number of expected behaviors that were sent
+
+        Returns:
+            List[Verdict]: One verdict per expected behavior, in input order
+        """
+        outcomes: Dict[int, bool] = {}
+        reasons: Dict[int, List[str]] = {}
+        current: Optional[int] = None
+
+        for line in content.splitlines():
+            match = VerdictParser._CRITERION_LINE.match(line)
+
+            if match:
+                number = int(match.group(1))
+                current = None
+                if 1 <= number <= count and number not in outcomes:
+                    outcomes[number] = match.group(2).upper() == "PASS"
+                    if not outcomes[number]:
+                        reasons[number] = [match.group(3).strip().rstrip("*").strip()]
+                        current = number
+            elif current is not None and line.strip():
+                reasons[current].append(line.strip())
+
+        verdicts = []
+        for number in range(1, count + 1):
+            if number not in outcomes:
+                verdicts.append(Verdict(passed=False, reason=VerdictParser.MISSING_CRITERION_REASON))
+            elif outcomes[number]:
+                verdicts.append(Verdict(passed=True))
+            else:
+                reason = " ".join(part for part in reasons[number] if part)
+                verdicts.append(Verdict(passed=False, reason=reason or None))
+
+        return verdicts
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class VoteStrategy(Enum):
+    MAJORITY = "majority"
+    SPRT = "sprt"
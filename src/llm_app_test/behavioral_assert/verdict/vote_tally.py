@@ -0,0 +1,97 @@
+import math
+from typing import List, Optional
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import VoteConstants
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.behavioral_assert.verdict.vote_strategy_enum import VoteStrategy
+
+
+class VoteTally:
+    """
+    Counts judge samples for one judgement and decides when enough have been drawn.
+
+    The majority strategy stops as soon as one side holds more than half of the allowed
+    votes, since the remaining samples can no longer change the outcome. The sprt strategy
+    runs Wald's sequential probability ratio test between "the judge says PASS with
+    probability judge_accuracy" and "the judge says FAIL with probability judge_accuracy",
+    with equal error rates of 1 - confidence. Each agreeing sample moves the log-likelihood
+    ratio by the same step and each disagreeing one cancels it, so the test reduces to
+    waiting for a fixed margin between PASS and FAIL samples. If the votes run out first,
+    the larger side wins and a tie is a FAIL.
+
+    Attributes:
+        votes: Maximum number of samples to draw.
+        strategy: When to stop sampling.
+        samples: The verdicts drawn so far.
+    """
+
+    def __init__(
+            self,
+            votes: int,
+            strategy: VoteStrategy = VoteStrategy.MAJORITY,
+            confidence: float = VoteConstants.DEFAULT_CONFIDENCE,
+            judge_accuracy: float = VoteConstants.JUDGE_ACCURACY
+    ):
+        self.votes = votes
+        self.strategy = strategy
+        self.samples: List[Verdict] = []
+
+        if strategy == VoteStrategy.SPRT:
+            boundary = math.log(confidence / (1 - confidence))
+            step = math.log(judge_accuracy / (1 - judge_accuracy))
+            self._required_margin = max(1, math.ceil(boundary / step))
+        else:
+            self._required_margin = votes // 2 + 1
+
+    @property
+    def passes(self) -> int:
+        return sum(1 for sample in self.samples if sample.passed)
+
+    @property
+    def fails(self) -> int:
+        return len(self.samples) - self.passes
+
+    def add(self, verdict: Verdict) -> None:
+        self.samples.append(verdict)
+
+    def decision(self) -> Optional[bool]:
+        """The voted outcome, or None while more samples are needed"""
+        passes, fails = self.passes, self.fails
+
+        if self.strategy == VoteStrategy.SPRT:
+            if passes - fails >= self._required_margin:
+                return True
+            if fails - passes >= self._required_margin:
+                return False
+        elif max(passes, fails) >= self._required_margin:
+            return passes > fails
+
+        if len(self.samples) >= self.votes:
+            return passes > fails
+
+        return None
+
+    def next_draw(self) -> int:
+        """How many samples to request next; all of them are needed before a decision is possible"""
+        if self.decision() is not None:
+            return 0
+
+        if self.strategy == VoteStrategy.SPRT:
+            needed = self._required_margin - abs(self.passes - self.fails)
+        else:
+            needed = self._required_margin - max(self.passes, self.fails)
+
+        return min(needed, self.votes - len(self.samples))
+
+    def verdict(self) -> Verdict:
+        """Combine the samples into one verdict, taking the reason and confidence from the winning side"""
+        passed = self.decision()
+        if passed is None:
+            raise ValueError("The vote is not decided yet")
+
+        winners = [sample for sample in self.samples if sample.passed == passed]
+        reason = next((sample.reason for sample in winners if sample.reason), None)
+        confidences = [sample.confidence for sample in winners]
+        confidence = sum(confidences) / len(confidences) if winners and None not in confidences else None
+
+        return Verdict(passed=passed, reason=reason, confidence=confidence, votes=(self.passes, self.fails))
@@ -0,0 +1,39 @@
+import inspect
+import re
+import unicodedata
+
+# Zero-width characters and the byte order mark carry no meaning for the judge
+_INVISIBLE_CHARACTERS = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff"))
+
+_HORIZONTAL_WHITESPACE_RUN = re.compile(r"[^\S\n]+")
+_BLANK_LINE_RUN = re.compile(r"\n{3,}")
+
+
+def canonicalize_text(text: str) -> str:
+    """
+    Canonicalize a text before it is formatted into a judge prompt.
+
+    Line endings are normalized to \\n, the text is put in Unicode NFC form without
+    zero-width characters, and it is dedented the way inspect.cleandoc dedents docstrings,
+    so the indentation of triple-quoted test strings is dropped even when their first line
+    is not indented. Runs of spaces and tabs inside a line become a single space, trailing
+    whitespace is stripped and runs of blank lines are collapsed to one. Indentation
+    relative to the least indented line is kept, as it is meaningful in code and nested
+    lists.
+
+    Args:
+        text: The text to canonicalize
+
+    Returns:
+        str: The canonical text
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = unicodedata.normalize("NFC", text).translate(_INVISIBLE_CHARACTERS)
+
+    lines = []
+    for line in inspect.cleandoc(text).split("\n"):
+        stripped = line.lstrip(" ")
+        indentation = line[:len(line) - len(stripped)]
+        lines.append(indentation + _HORIZONTAL_WHITESPACE_RUN.sub(" ", stripped).rstrip())
+
+    return _BLANK_LINE_RUN.sub("\n\n", "\n".join(lines))
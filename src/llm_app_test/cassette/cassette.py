@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import Runnable
+from langchain_core.runnables.base import RunnableBindingBase
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import CassetteConstants
+from llm_app_test.cassette.cassette_mode_enum import CassetteMode
+from llm_app_test.exceptions.test_exceptions import CassetteError, CassetteMissError
+from llm_app_test.verdict_cache.verdict_cache_key import VerdictCacheKey
+
+
+class Cassette:
+    """
+    Records judge responses to a JSON Lines file and replays them without calling the LLM.
+
+    Entries are content-addressed by the formatted messages and the judge's model config,
+    including call options bound onto it such as logprobs or max_tokens, so a replayed
+    response always answers exactly the request that was recorded. Each line holds one
+    entry with the response content and, when present, its logprobs. New entries are
+    appended, which lets several processes (for example pytest-xdist workers) record to
+    the same file; when a key appears more than once the last entry wins.
+
+    Attributes:
+        path: Location of the cassette file.
+        mode: Whether responses are recorded or replayed.
+    """
+
+    def __init__(self, path: str, mode: CassetteMode):
+        """
+        Load the cassette file, which must exist in replay mode.
+
+        Args:
+            path: Location of the cassette file
+            mode: Whether responses are recorded or replayed
+
+        Raises:
+            CassetteError: If the file cannot be read, or does not exist in replay mode
+        """
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+
+        if mode == CassetteMode.REPLAY and not os.path.exists(path):
+            raise CassetteError(
+                f"No cassette found at {path}",
+                reason="Record one first with --llm-record or cassette_mode='record'"
+            )
+        self._entries = self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == CassetteMode.REPLAY
+
+    @staticmethod
+    def key(messages: Sequence[BaseMessage], llm: Runnable) -> str:
+        """
+        Build the key of a judge request.
+
+        Args:
+            messages: The messages sent to the judge
+            llm: The judge the messages are sent to, including any bindings
+
+        Returns:
+            Hex encoded SHA-256 digest identifying the request
+        """
+        call_options: Dict[str, Any] = {}
+        while isinstance(llm, RunnableBindingBase):
+            call_options = {**llm.kwargs, **call_options}
+            llm = llm.bound
+
+        payload = json.dumps(
+            {
+                "version": CassetteConstants.KEY_VERSION,
+                "llm": VerdictCacheKey.describe_runnable(llm),
+                "call_options": call_options,
+                "messages": [{"type": message.type, "content": message.content} for message in messages]
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def replay(self, messages: Sequence[BaseMessage], llm: Runnable) -> AIMessage:
+        """
+        Return the recorded response to a judge request.
+
+        Args:
+            messages: The messages sent to the judge
+            llm: The judge the messages are sent to
+
+        Returns:
+            AIMessage: The recorded response
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        key = self.key(messages, llm)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            raise CassetteMissError(
+                f"No recorded response for judge request {key[:12]}",
+                reason=f"The request is not in {self.path}; re-record it with --llm-record",
+                details={"cassette": self.path, "key": key}
+            )
+
+        metadata = {"logprobs": entry["logprobs"]} if "logprobs" in entry else {}
+        return AIMessage(content=entry["content"], response_metadata=metadata)
+
+    def record(self, messages: Sequence[BaseMessage], llm: Runnable, response: Any) -> None:
+        """
+        Store the response to a judge request, appending it to the cassette file if it is new.
+
+        Args:
+            messages: The messages sent to the judge
+            llm: The judge the messages were sent to
+            response: The message returned by the judge
+
+        Raises:
+            CassetteError: If the cassette file cannot be written
+        """
+        entry = {"key": self.key(messages, llm), "content": response.content}
+        response_metadata = getattr(response, "response_metadata", None)
+        if isinstance(response_metadata, dict) and response_metadata.get("logprobs") is not None:
+            entry["logprobs"] = response_metadata["logprobs"]
+
+        with self._lock:
+            if self._entries.get(entry["key"]) == entry:
+                return
+            self._entries[entry["key"]] = entry
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as cassette_file:
+                    cassette_file.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+            except (OSError, TypeError, ValueError) as e:
+                raise CassetteError(f"Unable to write to cassette at {self.path}", reason=str(e)) from e
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return {}
+
+        entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as cassette_file:
+                for line in cassette_file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        entries[entry["key"]] = entry
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise CassetteError(f"Unable to read cassette at {self.path}", reason=str(e)) from e
+
+        return entries
+
+
+_shared_cassettes: Dict[Tuple[str, CassetteMode], Cassette] = {}
+_shared_cassettes_lock = threading.Lock()
+
+
+def get_shared_cassette(path: str, mode: CassetteMode) -> Cassette:
+    """
+    Return the process-wide cassette for a file and mode, shared by all BehavioralAssertion instances.
+
+    Args:
+        path: Location of the cassette file
+        mode: Whether responses are recorded or replayed
+
+    Returns:
+        Cassette: The shared cassette
+    """
+    key = (os.path.abspath(path), mode)
+    with _shared_cassettes_lock:
+        if key not in _shared_cassettes:
+            _shared_cassettes[key] = Cassette(path, mode)
+        return _shared_cassettes[key]
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CassetteMode(Enum):
+    RECORD = "record"
+    REPLAY = "replay"
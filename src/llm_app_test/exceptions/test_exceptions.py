@@ -1,35 +1,60 @@
+import inspect
+import sys
 from functools import wraps
-from typing import Callable, Any, Optional, Dict
-from anthropic import APIError
-from openai import OpenAIError
+from typing import Callable, Any, Optional, Dict, NoReturn
 
 
 def catch_llm_errors(func: Callable) -> Callable:
-    """Decorator to catch and handle LLM-related errors."""
+    """Decorator to catch and handle LLM-related errors.
+
+    Works on both regular and async functions, so that coroutine methods such as
+    aassert_behavioral_match surface errors exactly like their blocking counterparts.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                _raise_llm_error(e, func.__name__)
+        return async_wrapper
+
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         try:
             return func(*args, **kwargs)
-        except OpenAIError as e:
-            raise LLMConnectionError(
-                "OpenAI API error occurred",
-                reason=str(e)
-            ) from e
-        except APIError as e:
-            raise LLMConnectionError(
-                "Anthropic API error occurred",
-                reason=str(e)
-            ) from e
         except Exception as e:
-            if isinstance(e, LLMAppTestError):
-                raise
-            raise LLMConnectionError(
-                f"LLM operation failed in {func.__name__}",
-                reason=str(e)
-            ) from e
+            _raise_llm_error(e, func.__name__)
     return wrapper
 
 
+def _raise_llm_error(e: Exception, func_name: str) -> NoReturn:
+    """Re-raise an exception caught by catch_llm_errors as the matching llm_app_test error.
+
+    Provider error classes are looked up in sys.modules rather than imported: an SDK that
+    has not been imported cannot have raised anything, and importing it here would pull
+    the provider SDKs into every test run.
+    """
+    openai = sys.modules.get("openai")
+    anthropic = sys.modules.get("anthropic")
+    if openai is not None and isinstance(e, openai.OpenAIError):
+        raise LLMConnectionError(
+            "OpenAI API error occurred",
+            reason=str(e)
+        ) from e
+    if anthropic is not None and isinstance(e, anthropic.APIError):
+        raise LLMConnectionError(
+            "Anthropic API error occurred",
+            reason=str(e)
+        ) from e
+    if isinstance(e, LLMAppTestError):
+        raise e
+    raise LLMConnectionError(
+        f"LLM operation failed in {func_name}",
+        reason=str(e)
+    ) from e
+
+
 class LLMAppTestError(Exception):
     """Base exception class for all llm_app_test errors."""
     def __init__(
@@ -62,6 +87,14 @@ class BehavioralAssertionError(LLMAppTestError):
         )
 
 
+class UncertainVerdictError(BehavioralAssertionError):
+    """Raised when the asserter's confidence in a verdict is below the configured threshold."""
+
+
+class LocalCheckError(BehavioralAssertionError):
+    """Raised when a local pre-check fails, before the LLM judge is called."""
+
+
 class LLMConfigurationError(LLMAppTestError):
     """Raised when there are issues with LLM configuration."""
     def __init__(self, message: str, reason: Optional[str] = None, details: Optional[Dict] = None):
@@ -109,4 +142,32 @@ class RetryConfigurationError(LLMAppTestError):
             details=details
         )
 
+class VerdictCacheError(LLMAppTestError):
+    """Raised when the verdict cache cannot be read or written."""
+    def __init__(self, message: str, reason: Optional[str] = None, details: Optional[Dict] = None):
+        super().__init__(
+            message=f"Verdict cache error: {message}",
+            reason=reason,
+            details=details
+        )
+
+class VerdictCacheConfigurationError(LLMAppTestError):
+    """Raised when verdict cache configuration is invalid."""
+    def __init__(self, message: str, reason: Optional[str] = None, details: Optional[Dict] = None):
+        super().__init__(
+            message=f"Verdict cache configuration error: {message}",
+            reason=reason,
+            details=details
+        )
+
+class CassetteError(LLMAppTestError):
+    """Raised when a judge cassette cannot be read or written."""
+    def __init__(self, message: str, reason: Optional[str] = None, details: Optional[Dict] = None):
+        super().__init__(
+            message=f"Cassette error: {message}",
+            reason=reason,
+            details=details
+        )
 
+class CassetteMissError(CassetteError):
+    """Raised in replay mode when a judge request has no recorded response."""
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from llm_app_test.local_checks.local_check import LocalCheck
+
+
+@dataclass(frozen=True)
+class Contains(LocalCheck):
+    """Requires the actual output to contain a piece of text"""
+    text: str
+    case_sensitive: bool = True
+
+    def check(self, actual: str) -> Optional[str]:
+        if _contains(actual, self.text, self.case_sensitive):
+            return None
+        return f"Output does not contain {self.text!r}"
+
+
+@dataclass(frozen=True)
+class NotContains(LocalCheck):
+    """Requires the actual output not to contain a piece of text"""
+    text: str
+    case_sensitive: bool = True
+
+    def check(self, actual: str) -> Optional[str]:
+        if not _contains(actual, self.text, self.case_sensitive):
+            return None
+        return f"Output contains {self.text!r}"
+
+
+def _contains(actual: str, text: str, case_sensitive: bool) -> bool:
+    if case_sensitive:
+        return text in actual
+    return text.casefold() in actual.casefold()
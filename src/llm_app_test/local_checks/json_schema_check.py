@@ -0,0 +1,108 @@
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from llm_app_test.local_checks.local_check import LocalCheck
+
+_CODE_FENCE = re.compile(r"^```[\w-]*\s*\n(.*?)\n?```$", re.DOTALL)
+
+_JSON_TYPES = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+@dataclass(frozen=True)
+class JsonSchema(LocalCheck):
+    """
+    Requires the actual output to be JSON matching a schema.
+
+    Only a subset of JSON Schema is supported, without external dependencies: type, enum,
+    const, properties, required, additionalProperties (as a boolean), items, minItems,
+    maxItems, minLength, maxLength, pattern, minimum and maximum. Other keywords are
+    ignored. An empty schema only requires the output to be valid JSON. Output wrapped
+    in a single Markdown code fence is unwrapped first.
+    """
+    schema: Dict[str, Any] = field(default_factory=dict)
+
+    def check(self, actual: str) -> Optional[str]:
+        text = actual.strip()
+        fenced = _CODE_FENCE.match(text)
+        if fenced:
+            text = fenced.group(1)
+
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError as e:
+            return f"Output is not valid JSON: {e}"
+
+        return _validate(value, self.schema, "$")
+
+
+def _validate(value: Any, schema: Dict[str, Any], path: str) -> Optional[str]:
+    """Return the first schema violation found at or below path, or None"""
+    expected_types = schema.get("type")
+    if expected_types is not None:
+        expected_types = [expected_types] if isinstance(expected_types, str) else list(expected_types)
+        if not any(_JSON_TYPES.get(expected_type, lambda _: True)(value) for expected_type in expected_types):
+            return f"{path} should be {' or '.join(expected_types)}, got {_json_type(value)}"
+
+    if "enum" in schema and value not in schema["enum"]:
+        return f"{path} should be one of {schema['enum']}, got {value!r}"
+    if "const" in schema and value != schema["const"]:
+        return f"{path} should be {schema['const']!r}, got {value!r}"
+
+    if isinstance(value, dict):
+        for name in schema.get("required", []):
+            if name not in value:
+                return f"{path} is missing required property {name!r}"
+
+        properties = schema.get("properties", {})
+        for name, property_schema in properties.items():
+            if name in value:
+                violation = _validate(value[name], property_schema, f"{path}.{name}")
+                if violation:
+                    return violation
+
+        if schema.get("additionalProperties") is False:
+            extra = sorted(set(value) - set(properties))
+            if extra:
+                return f"{path} has unexpected properties {extra}"
+
+    if isinstance(value, list):
+        if "minItems" in schema and len(value) < schema["minItems"]:
+            return f"{path} should have at least {schema['minItems']} items, got {len(value)}"
+        if "maxItems" in schema and len(value) > schema["maxItems"]:
+            return f"{path} should have at most {schema['maxItems']} items, got {len(value)}"
+        if "items" in schema:
+            for index, item in enumerate(value):
+                violation = _validate(item, schema["items"], f"{path}[{index}]")
+                if violation:
+                    return violation
+
+    if isinstance(value, str):
+        if "minLength" in schema and len(value) < schema["minLength"]:
+            return f"{path} should be at least {schema['minLength']} characters, got {len(value)}"
+        if "maxLength" in schema and len(value) > schema["maxLength"]:
+            return f"{path} should be at most {schema['maxLength']} characters, got {len(value)}"
+        if "pattern" in schema and not re.search(schema["pattern"], value):
+            return f"{path} should match /{schema['pattern']}/"
+
+    if _JSON_TYPES["number"](value):
+        if "minimum" in schema and value < schema["minimum"]:
+            return f"{path} should be at least {schema['minimum']}, got {value}"
+        if "maximum" in schema and value > schema["maximum"]:
+            return f"{path} should be at most {schema['maximum']}, got {value}"
+
+    return None
+
+
+def _json_type(value: Any) -> str:
+    return next(name for name in ("null", "boolean", "integer", "number", "string", "array", "object")
+                if _JSON_TYPES[name](value))
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from llm_app_test.exceptions.test_exceptions import InvalidPromptError
+from llm_app_test.local_checks.local_check import LocalCheck
+
+
+@dataclass(frozen=True)
+class Length(LocalCheck):
+    """Requires the length of the actual output, in characters or words, to fall within bounds"""
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    words: bool = False
+
+    def __post_init__(self):
+        if self.min_length is None and self.max_length is None:
+            raise InvalidPromptError(
+                "Invalid Length check",
+                reason="min_length or max_length must be set"
+            )
+        if self.min_length is not None and self.max_length is not None and self.min_length > self.max_length:
+            raise InvalidPromptError(
+                f"Invalid Length check: min_length {self.min_length}, max_length {self.max_length}",
+                reason="min_length must not be greater than max_length"
+            )
+
+    def check(self, actual: str) -> Optional[str]:
+        unit = "words" if self.words else "characters"
+        length = len(actual.split()) if self.words else len(actual)
+
+        if self.min_length is not None and length < self.min_length:
+            return f"Output is {length} {unit} long, shorter than the minimum of {self.min_length}"
+        if self.max_length is not None and length > self.max_length:
+            return f"Output is {length} {unit} long, longer than the maximum of {self.max_length}"
+        return None
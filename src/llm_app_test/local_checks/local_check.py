@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class LocalCheck(ABC):
+    """A deterministic check of the actual output, run before the LLM judge is called"""
+
+    @abstractmethod
+    def check(self, actual: str) -> Optional[str]:
+        """
+        Check the actual output.
+
+        Args:
+            actual: The actual output to test
+
+        Returns:
+            None if the output passes, otherwise the reason it fails
+        """
@@ -0,0 +1,61 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from llm_app_test.local_checks.local_check import LocalCheck
+
+_HEADING = re.compile(r"^ {0,3}#{1,6}\s+(.*?)\s*#*\s*$")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+\S")
+_TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*(?:\|\s*:?-{3,}:?\s*)+\|?\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+@dataclass(frozen=True)
+class MarkdownStructure(LocalCheck):
+    """
+    Requires the actual output to have a Markdown structure.
+
+    Headings are matched by their text, case-insensitively and at any level. Lines inside
+    fenced code blocks are not counted as headings, list items or tables.
+    """
+    required_headings: Sequence[str] = ()
+    min_list_items: int = 0
+    require_code_block: bool = False
+    require_table: bool = False
+
+    def check(self, actual: str) -> Optional[str]:
+        prose_lines, code_blocks = _split_code_blocks(actual)
+
+        headings = {match.group(1).casefold() for line in prose_lines if (match := _HEADING.match(line))}
+        missing = [heading for heading in self.required_headings if heading.casefold() not in headings]
+        if missing:
+            return f"Output is missing the headings {missing}"
+
+        list_items = sum(1 for line in prose_lines if _LIST_ITEM.match(line))
+        if list_items < self.min_list_items:
+            return f"Output has {list_items} list items, fewer than the minimum of {self.min_list_items}"
+
+        if self.require_code_block and not code_blocks:
+            return "Output has no fenced code block"
+
+        if self.require_table and not any(_TABLE_SEPARATOR.match(line) for line in prose_lines):
+            return "Output has no table"
+
+        return None
+
+
+def _split_code_blocks(text: str) -> Tuple[List[str], int]:
+    """Return the lines outside fenced code blocks and the number of fenced code blocks"""
+    prose_lines, code_blocks, fence = [], 0, None
+
+    for line in text.splitlines():
+        match = _FENCE.match(line)
+        if fence is None and match:
+            fence = match.group(1)
+            code_blocks += 1
+        elif fence is not None and line.strip().startswith(fence):
+            fence = None
+        elif fence is None:
+            prose_lines.append(line)
+
+    return prose_lines, code_blocks
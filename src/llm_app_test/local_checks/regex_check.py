@@ -0,0 +1,27 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from llm_app_test.exceptions.test_exceptions import InvalidPromptError
+from llm_app_test.local_checks.local_check import LocalCheck
+
+
+@dataclass(frozen=True)
+class MatchesRegex(LocalCheck):
+    """Requires a regular expression to match somewhere in the actual output (re.search)"""
+    pattern: str
+    flags: int = 0
+
+    def __post_init__(self):
+        try:
+            re.compile(self.pattern, self.flags)
+        except re.error as e:
+            raise InvalidPromptError(
+                f"Invalid regular expression: {self.pattern}",
+                reason=str(e)
+            ) from e
+
+    def check(self, actual: str) -> Optional[str]:
+        if re.search(self.pattern, actual, self.flags):
+            return None
+        return f"Output does not match /{self.pattern}/"
@@ -0,0 +1,43 @@
+from typing import List
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from llm_app_test.rate_limiter.token_estimator import estimate_text_tokens
+
+
+class TextChunker:
+    """
+    Splits long actual outputs into overlapping chunks for map-reduce judging.
+
+    Text is split on paragraph breaks first, then lines, then words, and the pieces are
+    packed into chunks of at most chunk_size estimated tokens. Each chunk repeats up to
+    chunk_overlap tokens from the end of the previous one, so a sentence cut at a chunk
+    boundary is still seen whole by one of the two judges. Because boundaries follow the
+    text's own structure, an edit usually changes only the chunk it falls in.
+    """
+
+    def __init__(self, chunk_size: int, chunk_overlap: int):
+        """
+        Args:
+            chunk_size: Maximum size of a chunk, in estimated tokens
+            chunk_overlap: Size of the overlap between consecutive chunks, in estimated tokens
+        """
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self._splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=estimate_text_tokens
+        )
+
+    def split(self, text: str) -> List[str]:
+        """
+        Split text into overlapping chunks.
+
+        Args:
+            text: The text to split
+
+        Returns:
+            List[str]: The chunks, in order
+        """
+        return self._splitter.split_text(text)
@@ -0,0 +1,29 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_test_id: ContextVar[Optional[str]] = ContextVar("llm_app_test_current_test_id", default=None)
+
+
+@contextmanager
+def attribute_assertions_to(test_id: Optional[str]) -> Iterator[None]:
+    """
+    Attribute the assertions measured inside the block to test_id.
+
+    The pytest plugin wraps every test in this block with the test's node ID. Being a
+    context variable, the ID follows the test into async tasks and into worker threads
+    started with a copy of its context, such as those running deferred assertions.
+
+    Args:
+        test_id: The pytest node ID of the running test, or None
+    """
+    token = _current_test_id.set(test_id)
+    try:
+        yield
+    finally:
+        _current_test_id.reset(token)
+
+
+def current_test_id() -> Optional[str]:
+    """The node ID of the test the current assertion belongs to, or None outside a test"""
+    return _current_test_id.get()
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class AssertionMetrics:
+    """Where the time and tokens of one behavioral assertion went"""
+    method: str
+    test_id: Optional[str]
+    expected_behavior: str
+    model: Optional[str]
+    passed: bool
+    error: Optional[str]
+    wall_seconds: float
+    rate_limiter_wait_seconds: float
+    retries: int
+    requests: int
+    input_tokens: int
+    output_tokens: int
+    cached_input_tokens: int
+    verdict_cache_hit: bool
+    early_stopped_streams: int = 0  # streaming verdicts closed as soon as they read PASS
@@ -0,0 +1,188 @@
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.tracers.context import register_configure_hook
+
+from llm_app_test.metrics.assertion_attribution import current_test_id
+from llm_app_test.metrics.assertion_metrics import AssertionMetrics
+from llm_app_test.metrics.metrics_registry import MetricsRegistry
+
+
+class AssertionMetricsCollector(BaseCallbackHandler):
+    """
+    Callback handler accumulating the metrics of the assertion it is collecting for.
+
+    While an assertion runs the collector is held in a context variable registered as a
+    LangChain configure hook, so it receives the callbacks of every LLM run started in that
+    context, including judges passed in by the user, ensemble and cascade judges, and
+    batched requests on worker threads. Retries are the runs tagged by with_retry as a
+    second or later attempt; retries made inside the provider SDK (max_retries) are not
+    visible to callbacks. Token counts are read from the usage_metadata of each response.
+
+    Closing a stream early, as the streaming verdict mode does on PASS, makes LangChain
+    report the GeneratorExit through on_llm_error. Such a request is counted as an early
+    stop rather than an error, with whatever usage the provider streamed before it ended.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cached_input_tokens = 0
+        self.rate_limiter_wait_seconds = 0.0
+        self.verdict_cache_hit = False
+        self.early_stopped_streams = 0
+
+    def on_chat_model_start(self, serialized: Any, messages: Any, *, tags: Optional[List[str]] = None,
+                            **kwargs: Any) -> None:
+        self._count_request(tags)
+
+    def on_llm_start(self, serialized: Any, prompts: Any, *, tags: Optional[List[str]] = None, **kwargs: Any) -> None:
+        self._count_request(tags)
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self._count_usage(response)
+
+    def on_llm_error(self, error: BaseException, *, response: Optional[LLMResult] = None, **kwargs: Any) -> None:
+        if not isinstance(error, GeneratorExit):
+            return
+        with self._lock:
+            self.early_stopped_streams += 1
+        if response is not None:
+            self._count_usage(response)
+
+    def add_rate_limiter_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.rate_limiter_wait_seconds += seconds
+
+    def _count_usage(self, response: LLMResult) -> None:
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if not isinstance(usage, dict):
+                    continue
+                details = usage.get("input_token_details")
+                details = details if isinstance(details, dict) else {}
+                with self._lock:
+                    self.input_tokens += usage.get("input_tokens") or 0
+                    self.output_tokens += usage.get("output_tokens") or 0
+                    self.cached_input_tokens += details.get("cache_read") or 0
+
+    def _count_request(self, tags: Optional[List[str]]) -> None:
+        with self._lock:
+            self.requests += 1
+            if any(tag.startswith("retry:attempt:") for tag in tags or []):
+                self.retries += 1
+
+
+_current_collector: ContextVar[Optional[AssertionMetricsCollector]] = ContextVar(
+    "llm_app_test_assertion_metrics_collector", default=None
+)
+register_configure_hook(_current_collector, inheritable=True)
+
+
+@contextmanager
+def collect_assertion_metrics(
+        registry: Optional[MetricsRegistry],
+        method: str,
+        expected_behavior: str,
+        model: Optional[str]
+) -> Iterator[None]:
+    """
+    Measure the assertion run inside the block and record it in registry.
+
+    The assertion is recorded whether it passes or raises. Works in both sync and async
+    code, as the collector is bound to the current context.
+
+    Args:
+        registry: Registry to record the metrics in, or None to measure nothing
+        method: Name of the assertion method being measured
+        expected_behavior: The expected behavior being asserted
+        model: The judge model, where known
+    """
+    if registry is None:
+        yield
+        return
+
+    collector = AssertionMetricsCollector()
+    token = _current_collector.set(collector)
+    start = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        wall_seconds = time.perf_counter() - start
+        _current_collector.reset(token)
+        registry.record(AssertionMetrics(
+            method=method,
+            test_id=current_test_id(),
+            expected_behavior=expected_behavior,
+            model=model,
+            passed=error is None,
+            error=error,
+            wall_seconds=wall_seconds,
+            rate_limiter_wait_seconds=collector.rate_limiter_wait_seconds,
+            retries=collector.retries,
+            requests=collector.requests,
+            input_tokens=collector.input_tokens,
+            output_tokens=collector.output_tokens,
+            cached_input_tokens=collector.cached_input_tokens,
+            verdict_cache_hit=collector.verdict_cache_hit and collector.requests == 0,
+            early_stopped_streams=collector.early_stopped_streams
+        ))
+
+
+def record_rate_limiter_wait(seconds: float) -> None:
+    """Charge time spent waiting for a rate limiter to the assertion being measured, if any"""
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.add_rate_limiter_wait(seconds)
+
+
+def measure_rate_limiter_wait(func: Callable) -> Callable:
+    """
+    Decorator charging the time spent in a rate limiter's acquire or aacquire method to the
+    assertion being measured. Works on both regular and async methods.
+    """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs) -> Any:
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                record_rate_limiter_wait(time.perf_counter() - start)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record_rate_limiter_wait(time.perf_counter() - start)
+    return wrapper
+
+
+def record_verdict_cache_hit() -> None:
+    """
+    Mark the assertion being measured, if any, as answered from a verdict cache. An assertion
+    is only recorded as a cache hit if it also made no judge requests, so a batch with some
+    pairs cached and others judged is not.
+    """
+    collector = _current_collector.get()
+    if collector is not None:
+        collector.verdict_cache_hit = True
+
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import MetricsConstants
+from llm_app_test.metrics.assertion_metrics import AssertionMetrics
+
+
+def estimate_cost_usd(metrics: AssertionMetrics) -> Optional[float]:
+    """
+    Estimate what the judge requests of one assertion cost at list prices.
+
+    Cached input tokens are part of input_tokens and are charged at the cached input price.
+    Cache writes and batch discounts are not taken into account.
+
+    Args:
+        metrics: The assertion to price
+
+    Returns:
+        Optional[float]: Cost in USD, or None if the judge model has no known price
+    """
+    if metrics.input_tokens == 0 and metrics.output_tokens == 0:
+        return 0.0
+    prices = MetricsConstants.MODEL_PRICES_PER_MILLION_TOKENS.get(metrics.model)
+    if prices is None:
+        return None
+    input_price, cached_input_price, output_price = prices
+    uncached_input_tokens = max(metrics.input_tokens - metrics.cached_input_tokens, 0)
+    return (uncached_input_tokens * input_price
+            + metrics.cached_input_tokens * cached_input_price
+            + metrics.output_tokens * output_price) / 1_000_000
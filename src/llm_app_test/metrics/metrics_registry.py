@@ -0,0 +1,107 @@
+import threading
+from collections import deque
+from typing import List, Optional
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import MetricsConstants
+from llm_app_test.metrics.assertion_metrics import AssertionMetrics
+from llm_app_test.metrics.metrics_summary import MetricsSummary
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of the metrics of behavioral assertions.
+
+    The most recent max_records assertions are kept individually for inspection, while
+    the summary totals cover every assertion recorded since the last reset.
+    """
+
+    def __init__(self, max_records: int = MetricsConstants.MAX_RECORDS):
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+        self._totals = self._empty_totals()
+
+    def record(self, metrics: AssertionMetrics) -> None:
+        """
+        Add the metrics of one assertion.
+
+        Args:
+            metrics: The metrics to add
+        """
+        with self._lock:
+            self._records.append(metrics)
+            totals = self._totals
+            totals["assertions"] += 1
+            totals["failed"] += 0 if metrics.passed else 1
+            totals["wall_seconds"] += metrics.wall_seconds
+            totals["rate_limiter_wait_seconds"] += metrics.rate_limiter_wait_seconds
+            totals["retries"] += metrics.retries
+            totals["requests"] += metrics.requests
+            totals["input_tokens"] += metrics.input_tokens
+            totals["output_tokens"] += metrics.output_tokens
+            totals["cached_input_tokens"] += metrics.cached_input_tokens
+            totals["verdict_cache_hits"] += 1 if metrics.verdict_cache_hit else 0
+            totals["early_stopped_streams"] += metrics.early_stopped_streams
+
+    @property
+    def records(self) -> List[AssertionMetrics]:
+        """The retained assertion metrics, oldest first"""
+        with self._lock:
+            return list(self._records)
+
+    def slowest(self, count: int) -> List[AssertionMetrics]:
+        """
+        Return the retained assertions that took the longest.
+
+        Args:
+            count: Maximum number of assertions to return
+
+        Returns:
+            List[AssertionMetrics]: Slowest first
+        """
+        return sorted(self.records, key=lambda metrics: metrics.wall_seconds, reverse=True)[:count]
+
+    @property
+    def summary(self) -> MetricsSummary:
+        """Totals over every assertion recorded since the last reset"""
+        with self._lock:
+            return MetricsSummary(**self._totals)
+
+    def reset(self) -> None:
+        """Discard every recorded assertion"""
+        with self._lock:
+            self._records.clear()
+            self._totals = self._empty_totals()
+
+    @staticmethod
+    def _empty_totals() -> dict:
+        return {
+            "assertions": 0,
+            "failed": 0,
+            "wall_seconds": 0.0,
+            "rate_limiter_wait_seconds": 0.0,
+            "retries": 0,
+            "requests": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cached_input_tokens": 0,
+            "verdict_cache_hits": 0,
+            "early_stopped_streams": 0
+        }
+
+
+_shared_registry: Optional[MetricsRegistry] = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_shared_metrics_registry() -> MetricsRegistry:
+    """
+    Return the process-wide metrics registry every BehavioralAssertion records into by default.
+
+    Returns:
+        MetricsRegistry: The shared registry
+    """
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = MetricsRegistry()
+        return _shared_registry
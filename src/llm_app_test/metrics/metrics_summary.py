@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MetricsSummary:
+    """Totals over every assertion recorded in a MetricsRegistry"""
+    assertions: int
+    failed: int
+    wall_seconds: float
+    rate_limiter_wait_seconds: float
+    retries: int
+    requests: int
+    input_tokens: int
+    output_tokens: int
+    cached_input_tokens: int
+    verdict_cache_hits: int
+    early_stopped_streams: int = 0
+
+    @property
+    def verdict_cache_hit_rate(self) -> float:
+        """Share of assertions answered from a verdict cache"""
+        return self.verdict_cache_hits / self.assertions if self.assertions else 0.0
@@ -0,0 +1,43 @@
+"""Run a MockProviderServer until interrupted: python -m llm_app_test.mock_provider --port 8080"""
+import argparse
+
+from llm_app_test.mock_provider.latency_distribution_enum import LatencyDistribution
+from llm_app_test.mock_provider.mock_provider_config import MockProviderConfig
+from llm_app_test.mock_provider.mock_provider_server import MockProviderServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m llm_app_test.mock_provider",
+        description="Local stand-in for the OpenAI and Anthropic chat APIs"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--verdict", action="append", dest="verdicts",
+                        help="Response to cycle through, may be repeated (default: PASS)")
+    parser.add_argument("--latency-distribution", default=LatencyDistribution.FIXED.value,
+                        choices=[kind.value for kind in LatencyDistribution])
+    parser.add_argument("--latency", type=float, default=0.0, dest="latency_seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, dest="latency_jitter_seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--retry-after", type=float, default=1.0, dest="retry_after_seconds")
+    parser.add_argument("--seed", type=int)
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+
+    server = MockProviderServer(MockProviderConfig(**{**args, "verdicts": tuple(args["verdicts"] or ("PASS",))}),
+                                host, port)
+    print(f"Mock provider listening on {server.base_url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
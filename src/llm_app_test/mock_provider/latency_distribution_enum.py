@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class LatencyDistribution(Enum):
+    FIXED = "fixed"
+    UNIFORM = "uniform"
+    LOGNORMAL = "lognormal"
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Union
+
+from llm_app_test.exceptions.test_exceptions import LLMConfigurationError
+from llm_app_test.mock_provider.latency_distribution_enum import LatencyDistribution
+
+
+@dataclass(frozen=True)
+class MockProviderConfig:
+    """
+    Behaviour of a MockProviderServer.
+
+    Attributes:
+        verdicts: Responses of the judge, either a sequence cycled through in request order
+            or a callable receiving the text of the last user message and returning the response
+        latency_distribution: How the delay before each response is drawn
+        latency_seconds: The fixed delay, the midpoint of the uniform distribution or the
+            median of the lognormal distribution
+        latency_jitter_seconds: Half-width of the uniform distribution
+        latency_sigma: Shape of the lognormal distribution, the standard deviation of the
+            underlying normal distribution
+        rate_limit_rate: Fraction of requests answered with 429 Too Many Requests
+        error_rate: Fraction of requests answered with error_status
+        error_status: Status of injected errors
+        retry_after_seconds: Retry-After header sent with 429, 503 and 529 responses, or None to omit it
+        status_script: Statuses returned, in order, to the first requests before any random
+            injection, for example (429, 429) to rate limit the first two requests
+        seed: Seed of the latency and injection random number generator
+    """
+    verdicts: Union[Sequence[str], Callable[[str], str]] = ("PASS",)
+    latency_distribution: Union[str, LatencyDistribution] = LatencyDistribution.FIXED
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    latency_sigma: float = 0.5
+    rate_limit_rate: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    retry_after_seconds: Optional[float] = 1.0
+    status_script: Sequence[int] = ()
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        try:
+            object.__setattr__(self, "latency_distribution", LatencyDistribution(
+                self.latency_distribution.value if isinstance(self.latency_distribution, LatencyDistribution)
+                else str(self.latency_distribution).lower()
+            ))
+        except ValueError as e:
+            raise LLMConfigurationError(
+                f"Invalid latency distribution: {self.latency_distribution}",
+                reason=f"latency_distribution must be one of {[kind.value for kind in LatencyDistribution]}"
+            ) from e
+
+        if not callable(self.verdicts) and (isinstance(self.verdicts, str) or len(self.verdicts) == 0):
+            raise LLMConfigurationError(
+                "Invalid mock provider verdicts",
+                reason="verdicts must be a non-empty sequence of responses or a callable"
+            )
+        if min(self.latency_seconds, self.latency_jitter_seconds, self.latency_sigma) < 0:
+            raise LLMConfigurationError(
+                "Invalid mock provider latency",
+                reason="latency_seconds, latency_jitter_seconds and latency_sigma must not be negative"
+            )
+        if not (0 <= self.rate_limit_rate <= 1 and 0 <= self.error_rate <= 1) or \
+                self.rate_limit_rate + self.error_rate > 1:
+            raise LLMConfigurationError(
+                f"Invalid mock provider injection rates: rate_limit_rate {self.rate_limit_rate}, "
+                f"error_rate {self.error_rate}",
+                reason="Rates must be between 0 and 1 and add up to at most 1"
+            )
+        if self.retry_after_seconds is not None and self.retry_after_seconds < 0:
+            raise LLMConfigurationError(
+                f"Invalid retry_after_seconds value: {self.retry_after_seconds}",
+                reason="retry_after_seconds must not be negative"
+            )
+        for status in (self.error_status, *self.status_script):
+            if not 200 <= status <= 599:
+                raise LLMConfigurationError(
+                    f"Invalid mock provider status: {status}",
+                    reason="Statuses must be HTTP statuses between 200 and 599"
+                )
@@ -0,0 +1,391 @@
+import hashlib
+import itertools
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import PromptCacheConstants
+from llm_app_test.behavioral_assert.llm_config.message_text import content_text
+from llm_app_test.mock_provider.latency_distribution_enum import LatencyDistribution
+from llm_app_test.mock_provider.mock_provider_config import MockProviderConfig
+from llm_app_test.rate_limiter.token_estimator import estimate_text_tokens
+
+_ERROR_TYPES = {
+    400: ("invalid_request_error", "invalid_request_error"),
+    401: ("invalid_request_error", "authentication_error"),
+    429: ("rate_limit_error", "rate_limit_error"),
+    529: ("server_error", "overloaded_error"),
+}
+_SERVER_ERROR_TYPES = ("server_error", "api_error")
+_RETRY_AFTER_STATUSES = {429, 503, 529}
+
+
+class MockProviderServer:
+    """
+    Local HTTP stand-in for the OpenAI and Anthropic chat APIs.
+
+    Answers POST requests to paths ending in /chat/completions in the OpenAI chat
+    completions format and paths ending in /messages in the Anthropic messages format,
+    including their streaming variants, so ChatOpenAI and ChatAnthropic can both be
+    pointed at base_url. Responses carry the scripted verdicts and token usage estimated
+    with the rate limiter's characters-per-token rule. When an Anthropic request marks
+    content with cache_control, the prompt up to the last marker is reported as a cache
+    write the first time it is seen and as a cache read afterwards, provided it reaches
+    Anthropic's minimum cacheable length for the requested model.
+
+    Every response, including injected errors, is delayed by a latency drawn from the
+    configured distribution. Requests are served on separate threads, so concurrent
+    requests wait concurrently as they would against a real provider.
+
+    Attributes:
+        config: Behaviour of the server
+        host: Interface the server listens on
+        port: Port the server listens on, chosen by the OS when 0 is passed
+    """
+
+    def __init__(self, config: Optional[MockProviderConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Bind the server without starting it.
+
+        Args:
+            config: Behaviour of the server, defaults to passing every request without delay
+            host: Interface to listen on
+            port: Port to listen on, 0 picks a free port
+        """
+        self.config = config or MockProviderConfig()
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._verdicts = None if callable(self.config.verdicts) else itertools.cycle(self.config.verdicts)
+        self._request_count = 0
+        self._total_latency_seconds = 0.0
+        self._status_counts: Counter = Counter()
+        self._cached_prefixes = set()
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), _MockProviderRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock_provider = self
+        self.host, self.port = self._httpd.server_address[:2]
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to configure on the judge, for either provider"""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests received since the server started or was reset"""
+        with self._lock:
+            return self._request_count
+
+    @property
+    def total_latency_seconds(self) -> float:
+        """Sum of the latencies injected into responses since the server started or was reset"""
+        with self._lock:
+            return self._total_latency_seconds
+
+    @property
+    def status_counts(self) -> Dict[int, int]:
+        """Number of responses sent per HTTP status since the server started or was reset"""
+        with self._lock:
+            return dict(self._status_counts)
+
+    def reset(self) -> None:
+        """Restart the status script and verdict sequence and clear the counters and prompt cache"""
+        with self._lock:
+            self._request_count = 0
+            self._total_latency_seconds = 0.0
+            self._status_counts.clear()
+            self._cached_prefixes.clear()
+            self._random = random.Random(self.config.seed)
+            self._verdicts = None if callable(self.config.verdicts) else itertools.cycle(self.config.verdicts)
+
+    def start(self) -> "MockProviderServer":
+        """Serve requests on a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                            name="mock-provider", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until stop is called from another thread"""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def _next_outcome(self) -> Tuple[int, float]:
+        """Draw the status and latency of the next response"""
+        config = self.config
+        with self._lock:
+            index = self._request_count
+            self._request_count += 1
+
+            if index < len(config.status_script):
+                status = config.status_script[index]
+            else:
+                draw = self._random.random()
+                status = 429 if draw < config.rate_limit_rate else \
+                    config.error_status if draw < config.rate_limit_rate + config.error_rate else 200
+
+            if config.latency_distribution == LatencyDistribution.UNIFORM:
+                latency = self._random.uniform(config.latency_seconds - config.latency_jitter_seconds,
+                                               config.latency_seconds + config.latency_jitter_seconds)
+            elif config.latency_distribution == LatencyDistribution.LOGNORMAL and config.latency_seconds > 0:
+                latency = config.latency_seconds * self._random.lognormvariate(0, config.latency_sigma)
+            else:
+                latency = config.latency_seconds
+
+            latency = max(latency, 0.0)
+            self._total_latency_seconds += latency
+
+        return status, latency
+
+    def _verdict(self, prompt: str) -> str:
+        if callable(self.config.verdicts):
+            return self.config.verdicts(prompt)
+        with self._lock:
+            return next(self._verdicts)
+
+    def _record_status(self, status: int) -> None:
+        with self._lock:
+            self._status_counts[status] += 1
+
+    def _cache_usage(self, cached_prefix: str, model: str) -> Tuple[int, int]:
+        """Return the (cache write, cache read) tokens of a prompt prefix marked with cache_control"""
+        tokens = estimate_text_tokens(cached_prefix)
+        min_tokens = PromptCacheConstants.HAIKU_MIN_CACHEABLE_TOKENS if "haiku" in model else \
+            PromptCacheConstants.MIN_CACHEABLE_TOKENS
+        if tokens < min_tokens:
+            return 0, 0
+        digest = hashlib.sha256(cached_prefix.encode("utf-8")).hexdigest()
+        with self._lock:
+            if digest in self._cached_prefixes:
+                return 0, tokens
+            self._cached_prefixes.add(digest)
+        return tokens, 0
+
+
+class _MockProviderRequestHandler(BaseHTTPRequestHandler):
+    """Serves one request to a MockProviderServer"""
+    protocol_version = "HTTP/1.1"
+    server_version = "llm-app-test-mock-provider"
+
+    def setup(self):
+        super().setup()
+        # headers and body are written separately; without this, delayed ACKs add ~40ms per response
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_POST(self):
+        provider: MockProviderServer = self.server.mock_provider
+        path = self.path.split("?", 1)[0].rstrip("/")
+        length = int(self.headers.get("Content-Length") or 0)
+
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_error(400, "Request body is not valid JSON", anthropic=path.endswith("/messages"))
+            return
+
+        if path.endswith("/chat/completions"):
+            anthropic = False
+        elif path.endswith("/messages"):
+            anthropic = True
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "not_found"}})
+            return
+
+        status, latency = provider._next_outcome()
+        time.sleep(latency)
+
+        if status != 200:
+            self._send_error(status, "Injected by the mock provider", anthropic)
+            return
+
+        if anthropic:
+            self._answer_messages(provider, body)
+        else:
+            self._answer_chat_completions(provider, body)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _answer_chat_completions(self, provider: MockProviderServer, body: Dict[str, Any]) -> None:
+        messages = body.get("messages") or []
+        prompt = next((content_text(message.get("content") or "") for message in reversed(messages)
+                       if message.get("role") == "user"), "")
+        verdict = provider._verdict(prompt)
+        prompt_tokens = sum(estimate_text_tokens(content_text(message.get("content") or "")) for message in messages)
+        completion_tokens = estimate_text_tokens(verdict)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": 0}
+        }
+        response_id = f"chatcmpl-mock-{provider.request_count}"
+        created = int(time.time())
+        model = body.get("model", "mock")
+        logprobs = {
+            "content": [{"token": piece, "logprob": 0.0, "bytes": list(piece.encode("utf-8")), "top_logprobs": []}
+                        for piece in _pieces(verdict)]
+        } if body.get("logprobs") else None
+
+        if not body.get("stream"):
+            self._send_json(200, {
+                "id": response_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": verdict},
+                    "logprobs": logprobs,
+                    "finish_reason": "stop"
+                }],
+                "usage": usage
+            })
+            return
+
+        def chunk(choices: List[Dict[str, Any]], **extra: Any) -> Dict[str, Any]:
+            return {"id": response_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                    "choices": choices, **extra}
+
+        events = [chunk([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])]
+        for piece in _pieces(verdict):
+            events.append(chunk([{
+                "index": 0,
+                "delta": {"content": piece},
+                "logprobs": {"content": [{"token": piece, "logprob": 0.0, "top_logprobs": []}]} if logprobs else None,
+                "finish_reason": None
+            }]))
+        events.append(chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+        if (body.get("stream_options") or {}).get("include_usage"):
+            events.append(chunk([], usage=usage))
+
+        self._send_events([(None, event) for event in events] + [(None, "[DONE]")])
+
+    def _answer_messages(self, provider: MockProviderServer, body: Dict[str, Any]) -> None:
+        messages = body.get("messages") or []
+        prompt = next((content_text(message.get("content") or "") for message in reversed(messages)
+                       if message.get("role") == "user"), "")
+        verdict = provider._verdict(prompt)
+
+        blocks = _content_blocks(body.get("system") or "")
+        for message in messages:
+            blocks.extend(_content_blocks(message.get("content") or ""))
+        cached_blocks = max((index + 1 for index, block in enumerate(blocks) if block.get("cache_control")), default=0)
+        cache_write, cache_read = provider._cache_usage(
+            "".join(content_text([block]) for block in blocks[:cached_blocks]), body.get("model") or "")
+        if not cache_write and not cache_read:
+            cached_blocks = 0
+        usage = {
+            "input_tokens": sum(estimate_text_tokens(content_text([block])) for block in blocks[cached_blocks:]),
+            "output_tokens": estimate_text_tokens(verdict),
+            "cache_creation_input_tokens": cache_write,
+            "cache_read_input_tokens": cache_read
+        }
+        message = {
+            "id": f"msg_mock_{provider.request_count}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "mock"),
+            "content": [{"type": "text", "text": verdict}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": usage
+        }
+
+        if not body.get("stream"):
+            self._send_json(200, message)
+            return
+
+        events = [("message_start", {"type": "message_start", "message": {
+            **message, "content": [], "stop_reason": None, "usage": {**usage, "output_tokens": 0}
+        }}), ("content_block_start", {
+            "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}
+        })]
+        for piece in _pieces(verdict):
+            events.append(("content_block_delta", {
+                "type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": piece}
+            }))
+        events.extend([
+            ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+            ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                               "usage": {"output_tokens": usage["output_tokens"]}}),
+            ("message_stop", {"type": "message_stop"})
+        ])
+
+        self._send_events(events)
+
+    def _send_error(self, status: int, message: str, anthropic: bool) -> None:
+        openai_type, anthropic_type = _ERROR_TYPES.get(
+            status, _SERVER_ERROR_TYPES if status >= 500 else ("invalid_request_error", "invalid_request_error")
+        )
+        body = {"type": "error", "error": {"type": anthropic_type, "message": message}} if anthropic else \
+            {"error": {"message": message, "type": openai_type, "param": None, "code": openai_type}}
+
+        headers = {}
+        retry_after = self.server.mock_provider.config.retry_after_seconds
+        if status in _RETRY_AFTER_STATUSES and retry_after is not None:
+            headers["Retry-After"] = f"{retry_after:g}"
+
+        self.server.mock_provider._record_status(status)
+        self._send_json(status, body, headers)
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        if status == 200:
+            self.server.mock_provider._record_status(status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_events(self, events: List[Tuple[Optional[str], Any]]) -> None:
+        self.server.mock_provider._record_status(200)
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for event, data in events:
+            line = f"event: {event}\n" if event else ""
+            line += f"data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+            self.wfile.write(line.encode("utf-8"))
+            self.wfile.flush()
+
+
+def _pieces(text: str) -> List[str]:
+    """Split a response into word-sized stream deltas that join back to the original text"""
+    pieces = []
+    for index, word in enumerate(text.split(" ")):
+        pieces.append(word if index == 0 else " " + word)
+    return [piece for piece in pieces if piece]
+
+
+def _content_blocks(content: Any) -> List[Dict[str, Any]]:
+    if isinstance(content, str):
+        return [{"type": "text", "text": content}] if content else []
+    return [block for block in content if isinstance(block, dict)]
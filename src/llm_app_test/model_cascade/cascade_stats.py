@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CascadeStats:
+    """Snapshot of the counters kept by a model cascade"""
+    judgements: int
+    escalations_on_fail: int
+    escalations_on_low_confidence: int
+    escalations_on_error: int
+
+    @property
+    def escalations(self) -> int:
+        return self.escalations_on_fail + self.escalations_on_low_confidence + self.escalations_on_error
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalations / self.judgements if self.judgements else 0.0
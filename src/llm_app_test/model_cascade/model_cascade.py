@@ -0,0 +1,122 @@
+import sys
+import threading
+from typing import Optional
+
+from langchain_core.runnables import Runnable
+
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.exceptions.test_exceptions import LLMConnectionError
+from llm_app_test.model_cascade.cascade_stats import CascadeStats
+
+
+class ModelCascade:
+    """
+    Fast first-tier judge whose verdicts are escalated to the configured judge when they cannot be trusted.
+
+    A first-tier PASS is accepted as it is. A FAIL is always escalated, since a wrongly
+    failed test costs more than a second request, and so is a PASS whose confidence is
+    below confidence_threshold or a first-tier request that failed with a transient
+    error (see escalates_on). Any other error is a bug or a misconfiguration and is
+    raised. Every decision is counted so the escalation rate can be read back through stats.
+
+    Attributes:
+        llm: The fast first-tier judge.
+        confidence_threshold: Confidence below which a first-tier PASS is escalated, 0 disables the check.
+        request_logprobs: Whether to ask the first tier for logprobs so its confidence is known.
+    """
+
+    def __init__(self, llm: Runnable, confidence_threshold: float = 0.0, request_logprobs: bool = False):
+        self.llm = llm
+        self.confidence_threshold = confidence_threshold
+        self.request_logprobs = request_logprobs
+        self._lock = threading.Lock()
+        self._judgements = 0
+        self._escalations_on_fail = 0
+        self._escalations_on_low_confidence = 0
+        self._escalations_on_error = 0
+
+    @property
+    def verdict_llm(self) -> Runnable:
+        """The first-tier judge, asking for logprobs on the verdict token when they are needed"""
+        if self.request_logprobs:
+            return self.llm.bind(logprobs=True)
+        return self.llm
+
+    @staticmethod
+    def escalates_on(error: BaseException) -> bool:
+        """
+        Whether a first-tier request error is transient, so the configured judge may still answer.
+
+        Connection failures, timeouts, rate limiting and server errors of the provider SDKs are
+        transient. Authentication, bad requests and every other exception are not. Provider
+        error classes are looked up in sys.modules, as in catch_llm_errors.
+
+        Args:
+            error: The exception raised by the first-tier request
+
+        Returns:
+            True if the request should be escalated, False if the error should be raised
+        """
+        if isinstance(error, (ConnectionError, TimeoutError, LLMConnectionError)):
+            return True
+
+        for sdk_name in ("openai", "anthropic"):
+            sdk = sys.modules.get(sdk_name)
+            if sdk is None:
+                continue
+            if isinstance(error, sdk.APIConnectionError):
+                return True
+            if isinstance(error, sdk.APIStatusError) and (error.status_code == 429 or error.status_code >= 500):
+                return True
+
+        return False
+
+    def should_escalate(self, verdict: Optional[Verdict]) -> bool:
+        """
+        Decide whether a first-tier verdict must be escalated, and count the decision.
+
+        Args:
+            verdict: The first-tier verdict, or None if the first-tier request failed with an error
+                escalates_on accepts
+
+        Returns:
+            True if the configured judge must be asked instead
+        """
+        with self._lock:
+            self._judgements += 1
+
+            if verdict is None:
+                self._escalations_on_error += 1
+                return True
+            if not verdict.passed:
+                self._escalations_on_fail += 1
+                return True
+            if verdict.confidence is not None and verdict.confidence < self.confidence_threshold:
+                self._escalations_on_low_confidence += 1
+                return True
+
+            return False
+
+    def reset_stats(self) -> None:
+        """Reset the escalation counters."""
+        with self._lock:
+            self._judgements = 0
+            self._escalations_on_fail = 0
+            self._escalations_on_low_confidence = 0
+            self._escalations_on_error = 0
+
+    @property
+    def stats(self) -> CascadeStats:
+        """
+        Returns a snapshot of the cascade counters.
+
+        Returns:
+            CascadeStats: Number of first-tier judgements and escalations by cause
+        """
+        with self._lock:
+            return CascadeStats(
+                judgements=self._judgements,
+                escalations_on_fail=self._escalations_on_fail,
+                escalations_on_low_confidence=self._escalations_on_low_confidence,
+                escalations_on_error=self._escalations_on_error
+            )
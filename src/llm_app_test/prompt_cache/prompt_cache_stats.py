@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PromptCacheStats:
+    """Snapshot of the provider prompt-cache usage reported by judge responses"""
+    requests: int
+    input_tokens: int
+    cache_read_input_tokens: int
+    cache_creation_input_tokens: int
+
+    @property
+    def cache_read_ratio(self) -> float:
+        """Share of input tokens that were read from the provider's prompt cache"""
+        return self.cache_read_input_tokens / self.input_tokens if self.input_tokens else 0.0
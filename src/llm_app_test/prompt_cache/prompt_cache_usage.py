@@ -0,0 +1,64 @@
+import threading
+from typing import Any
+
+from llm_app_test.prompt_cache.prompt_cache_stats import PromptCacheStats
+
+
+class PromptCacheUsage:
+    """
+    Thread-safe tally of the input and cached input tokens reported by judge responses.
+
+    Token counts are read from LangChain's standard usage_metadata, where both the OpenAI
+    and Anthropic integrations report prompt cache reads under input_token_details.cache_read
+    and Anthropic additionally reports cache writes under input_token_details.cache_creation.
+    Responses without usage metadata are counted as requests only.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._input_tokens = 0
+        self._cache_read_input_tokens = 0
+        self._cache_creation_input_tokens = 0
+
+    def record(self, response: Any) -> None:
+        """
+        Add the token usage of one judge response.
+
+        Args:
+            response: The message returned by the judge LLM
+        """
+        usage = getattr(response, "usage_metadata", None)
+        usage = usage if isinstance(usage, dict) else {}
+        details = usage.get("input_token_details")
+        details = details if isinstance(details, dict) else {}
+
+        with self._lock:
+            self._requests += 1
+            self._input_tokens += usage.get("input_tokens") or 0
+            self._cache_read_input_tokens += details.get("cache_read") or 0
+            self._cache_creation_input_tokens += details.get("cache_creation") or 0
+
+    def reset_stats(self) -> None:
+        """Reset the usage counters."""
+        with self._lock:
+            self._requests = 0
+            self._input_tokens = 0
+            self._cache_read_input_tokens = 0
+            self._cache_creation_input_tokens = 0
+
+    @property
+    def stats(self) -> PromptCacheStats:
+        """
+        Returns a snapshot of the usage counters.
+
+        Returns:
+            PromptCacheStats: Request count plus total, cache-read and cache-write input tokens
+        """
+        with self._lock:
+            return PromptCacheStats(
+                requests=self._requests,
+                input_tokens=self._input_tokens,
+                cache_read_input_tokens=self._cache_read_input_tokens,
+                cache_creation_input_tokens=self._cache_creation_input_tokens
+            )
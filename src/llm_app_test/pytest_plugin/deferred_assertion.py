@@ -0,0 +1,117 @@
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Sequence, TYPE_CHECKING
+
+from llm_app_test.behavioral_assert.validation.behavioral_assert_input_validator import AssertBehavioralMatchValidator
+from llm_app_test.behavioral_assert.validation.vote_input_validator import VoteInputsValidator
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError
+from llm_app_test.local_checks.local_check import LocalCheck
+
+if TYPE_CHECKING:
+    from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+
+
+class DeferredAssertionCollector:
+    """
+    Runs deferred behavioral assertions in the background and collects their outcomes.
+
+    Assertions submitted while a test runs are accumulated until the plugin drains them
+    when the test's call phase is reported, so each test waits only once, for its slowest
+    judgement, instead of for every judgement in turn.
+
+    Attributes:
+        max_workers: Maximum number of judgements running at once.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-app-test-deferred")
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+    def submit(
+            self,
+            asserter: "BehavioralAssertion",
+            actual: str,
+            expected_behavior: str,
+            votes: Optional[int] = None,
+            local_checks: Optional[Sequence[LocalCheck]] = None
+    ) -> None:
+        """
+        Validate the inputs immediately and schedule the judgement in the background.
+
+        Args:
+            asserter: The asserter whose assert_behavioral_match will be run
+            actual: The actual output to test
+            expected_behavior: Natural language specification of expected behavior
+            votes: Maximum number of judge samples to vote over, see assert_behavioral_match
+            local_checks: Deterministic checks run before the LLM judge, see assert_behavioral_match
+
+        Raises:
+            InvalidPromptError: If either input is invalid
+            LLMConfigurationError: If votes is invalid
+        """
+        AssertBehavioralMatchValidator.validate(actual, expected_behavior)
+        votes = VoteInputsValidator.validate_votes(votes)
+
+        # Run in a copy of the test's context so the judgement is attributed to the test in metrics
+        context = contextvars.copy_context()
+        future = self._executor.submit(
+            context.run, asserter.assert_behavioral_match, actual, expected_behavior, votes, local_checks
+        )
+        with self._lock:
+            self._pending.append(future)
+
+    def drain(self) -> Optional[BaseException]:
+        """
+        Wait for every pending judgement and return the error the test should fail with.
+
+        Returns:
+            None if every judgement passed, the only error if one failed, or a single
+            aggregated BehavioralAssertionError if several behavioral assertions failed
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        errors = {}
+        for index, future in enumerate(pending):
+            error = future.exception()
+            if error is not None:
+                errors[index] = error
+
+        if not errors:
+            return None
+        if len(errors) == 1:
+            return next(iter(errors.values()))
+
+        non_behavioral = [error for error in errors.values() if not isinstance(error, BehavioralAssertionError)]
+        if non_behavioral:
+            return non_behavioral[0]
+
+        return BehavioralAssertionError(
+            f"{len(errors)} of {len(pending)} deferred behavioral assertions failed",
+            reason="; ".join(f"[{index}] {error.reason}" for index, error in errors.items()),
+            details={"failures": {index: error.reason for index, error in errors.items()}}
+        )
+
+    def shutdown(self) -> None:
+        """Wait for outstanding judgements and release the worker threads."""
+        self._executor.shutdown(wait=True)
+
+
+class DeferredBehavioralMatch:
+    """Drop-in replacement for assert_behavioral_match that returns before the judgement completes"""
+
+    def __init__(self, asserter: "BehavioralAssertion", collector: DeferredAssertionCollector):
+        self.asserter = asserter
+        self.collector = collector
+
+    def __call__(
+            self,
+            actual: str,
+            expected_behavior: str,
+            votes: Optional[int] = None,
+            local_checks: Optional[Sequence[LocalCheck]] = None
+    ) -> None:
+        self.collector.submit(self.asserter, actual, expected_behavior, votes, local_checks)
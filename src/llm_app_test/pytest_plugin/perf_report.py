@@ -0,0 +1,114 @@
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+
+from llm_app_test.metrics.assertion_metrics import AssertionMetrics
+from llm_app_test.metrics.cost_estimate import estimate_cost_usd
+from llm_app_test.metrics.metrics_registry import MetricsRegistry, get_shared_metrics_registry
+
+REPORT_ATTRIBUTE = "llm_app_test_metrics"
+EXPECTED_BEHAVIOR_WIDTH = 60
+
+
+class PerfReport:
+    """
+    Plugin gathering the metrics of the behavioral assertions made by each test for --llm-perf-report.
+
+    The assertions a test made are attached to its teardown report, so they reach the
+    terminal summary the same way under pytest-xdist, where each worker records into its
+    own shared metrics registry. Test time is the sum of every setup, call and teardown
+    duration, as with --durations, and is summed across workers like judge wall time.
+
+    Attributes:
+        slowest: Number of slowest assertions to list, 0 lists all of them.
+    """
+
+    def __init__(self, slowest: int):
+        self.slowest = slowest
+        self.registry = MetricsRegistry()
+        self.test_seconds = 0.0
+        self._recorded_before = 0
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: Any) -> None:
+        """Note how many assertions the shared registry held before the test started"""
+        self._recorded_before = get_shared_metrics_registry().summary.assertions
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: Any, call: Any):
+        """Attach the assertions the test made to its teardown report"""
+        outcome = yield
+        if call.when != "teardown":
+            return
+        shared_registry = get_shared_metrics_registry()
+        made = shared_registry.summary.assertions - self._recorded_before
+        records = shared_registry.records[-made:] if made > 0 else []
+        setattr(outcome.get_result(), REPORT_ATTRIBUTE, [asdict(metrics) for metrics in records])
+
+    def pytest_runtest_logreport(self, report: Any) -> None:
+        """Count the report's duration and the assertions attached to it"""
+        self.test_seconds += report.duration
+        for metrics in getattr(report, REPORT_ATTRIBUTE, None) or []:
+            self.registry.record(AssertionMetrics(**metrics))
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        """Write the report section to the terminal"""
+        terminalreporter.write_sep("=", "llm_app_test performance report")
+        summary = self.registry.summary
+        if summary.assertions == 0:
+            terminalreporter.write_line("no behavioral assertions were recorded")
+            return
+
+        slowest = self.registry.slowest(self.slowest or summary.assertions)
+        terminalreporter.write_line(
+            f"slowest {len(slowest)} behavioral assertions:" if self.slowest else "behavioral assertions:"
+        )
+        for metrics in slowest:
+            terminalreporter.write_line(
+                f"{metrics.wall_seconds:8.2f}s {metrics.requests:3d} req {metrics.retries:2d} retry "
+                f"{metrics.rate_limiter_wait_seconds:7.2f}s stalled  "
+                f"{metrics.test_id or metrics.method}  {self._short(metrics.expected_behavior)}"
+            )
+        terminalreporter.write_line("")
+
+        share = summary.wall_seconds / self.test_seconds if self.test_seconds else 0.0
+        terminalreporter.write_line(
+            f"judge wall time: {summary.wall_seconds:.2f}s of {self.test_seconds:.2f}s total test time ({share:.1%})"
+        )
+        terminalreporter.write_line(
+            f"assertions: {summary.assertions} ({summary.failed} failed), "
+            f"judge requests: {summary.requests}, retries: {summary.retries}"
+        )
+        cached_share = summary.cached_input_tokens / summary.input_tokens if summary.input_tokens else 0.0
+        terminalreporter.write_line(
+            f"tokens: {summary.input_tokens + summary.output_tokens:,} "
+            f"({summary.input_tokens:,} input, {summary.output_tokens:,} output, "
+            f"{summary.cached_input_tokens:,} input read from prompt cache, {cached_share:.1%})"
+        )
+        terminalreporter.write_line(self._cost_line())
+        terminalreporter.write_line(
+            f"verdict cache hit rate: {summary.verdict_cache_hit_rate:.1%} "
+            f"({summary.verdict_cache_hits} of {summary.assertions})"
+        )
+        terminalreporter.write_line(f"rate limiter stall time: {summary.rate_limiter_wait_seconds:.2f}s")
+
+    def _cost_line(self) -> str:
+        """Estimated cost of the retained assertions, naming the models without a known price"""
+        total = 0.0
+        unpriced = set()
+        for metrics in self.registry.records:
+            cost = estimate_cost_usd(metrics)
+            if cost is None:
+                unpriced.add(metrics.model or "unknown model")
+            else:
+                total += cost
+        line = f"estimated cost: ${total:.4f}"
+        if unpriced:
+            line += f" (excludes {', '.join(sorted(unpriced))}, no known price)"
+        return line
+
+    @staticmethod
+    def _short(text: str) -> str:
+        text = " ".join(text.split())
+        return text if len(text) <= EXPECTED_BEHAVIOR_WIDTH else text[:EXPECTED_BEHAVIOR_WIDTH - 3] + "..."
@@ -1,6 +1,94 @@
+import os
+
 import pytest
-from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
-from llm_app_test.semantic_assert.semantic_assert import deprecated, SemanticAssertion
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import BatchConstants, \
+    CassetteConstants, MetricsConstants
+from llm_app_test.metrics.assertion_attribution import attribute_assertions_to
+from llm_app_test.pytest_plugin.deferred_assertion import DeferredAssertionCollector, DeferredBehavioralMatch
+from llm_app_test.pytest_plugin.perf_report import PerfReport
+from llm_app_test.semantic_assert.deprecation import deprecated
+
+# The asserters are imported inside the fixtures: pytest loads this plugin on every run,
+# and importing them pulls in LangChain, which should only happen when a test needs it.
+
+FIXTURE_SCOPES = ("function", "class", "module", "package", "session")
+
+deferred_collector_key = pytest.StashKey[DeferredAssertionCollector]()
+saved_environment_key = pytest.StashKey[dict]()
+
+PERF_REPORT_PLUGIN_NAME = "llm_app_test_perf_report"
+
+
+def pytest_addoption(parser):
+    """Register llm_app_test command line and ini options"""
+    group = parser.getgroup("llm_app_test")
+    group.addoption(
+        "--llm-fixture-scope",
+        action="store",
+        dest="llm_fixture_scope",
+        choices=FIXTURE_SCOPES,
+        default=None,
+        help="Scope of the behavioral_assert and assert_behavioral_match fixtures. "
+             "Overrides the llm_app_test_fixture_scope ini option."
+    )
+    group.addoption(
+        "--llm-deferred",
+        action="store_true",
+        dest="llm_deferred",
+        default=False,
+        help="Make the assert_behavioral_match fixture return immediately and run judgements in the background. "
+             "Each test still fails with the right BehavioralAssertionError once its judgements complete."
+    )
+    group.addoption(
+        "--llm-deferred-workers",
+        action="store",
+        dest="llm_deferred_workers",
+        type=int,
+        default=BatchConstants.DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum number of deferred judgements running at once, default is "
+             f"{BatchConstants.DEFAULT_MAX_CONCURRENCY}."
+    )
+    group.addoption(
+        "--llm-record",
+        action="store",
+        dest="llm_record",
+        nargs="?",
+        const=CassetteConstants.DEFAULT_PATH,
+        default=None,
+        metavar="CASSETTE",
+        help=f"Record every judge request and response to a cassette file, default is "
+             f"{CassetteConstants.DEFAULT_PATH}."
+    )
+    group.addoption(
+        "--llm-replay",
+        action="store",
+        dest="llm_replay",
+        nargs="?",
+        const=CassetteConstants.DEFAULT_PATH,
+        default=None,
+        metavar="CASSETTE",
+        help="Answer judge requests from a recorded cassette file without calling the LLM, failing on any "
+             "request the cassette does not hold. No API key is needed."
+    )
+    group.addoption(
+        "--llm-perf-report",
+        action="store",
+        dest="llm_perf_report",
+        nargs="?",
+        type=int,
+        const=MetricsConstants.PERF_REPORT_SLOWEST,
+        default=None,
+        metavar="N",
+        help=f"Show the N slowest behavioral assertions, judge wall time, tokens, estimated cost, cache hit rate "
+             f"and rate limiter stall time at the end of the run (N=0 for all), default N is "
+             f"{MetricsConstants.PERF_REPORT_SLOWEST}."
+    )
+    parser.addini(
+        "llm_app_test_fixture_scope",
+        help="Scope of the behavioral_assert and assert_behavioral_match fixtures, default is function. "
+             "Use session to share one LLM client and rate limiter across the whole run.",
+        default="function"
+    )
 
 
 def pytest_configure(config):
@@ -17,22 +105,128 @@ def pytest_configure(config):
         "semantic: (deprecated) mark test as semantic comparison test. Use 'behavioral' marker instead. Will be removed in version 1.0.0 or first update after 1 June 2025"
     )
 
+    if config.getoption("llm_deferred", default=False):
+        workers = config.getoption("llm_deferred_workers")
+        if workers <= 0:
+            raise pytest.UsageError(f"Invalid --llm-deferred-workers: {workers}. Must be a positive integer")
+        config.stash[deferred_collector_key] = DeferredAssertionCollector(max_workers=workers)
 
-@pytest.fixture
-def behavioral_assert():
+    _configure_cassette(config)
+
+    slowest = config.getoption("llm_perf_report", default=None)
+    if slowest is not None:
+        if slowest < 0:
+            raise pytest.UsageError(f"Invalid --llm-perf-report: {slowest}. Must be zero or a positive integer")
+        _set_environment(config, "ASSERTER_COLLECT_METRICS", "true")
+        config.pluginmanager.register(PerfReport(slowest=slowest), PERF_REPORT_PLUGIN_NAME)
+
+
+def _configure_cassette(config):
+    """Point every BehavioralAssertion created during the run at the --llm-record / --llm-replay cassette.
+
+    The settings are passed through the environment so that asserters built outside the
+    fixtures, for example at module level, and pytest-xdist workers use them too.
+    """
+    record = config.getoption("llm_record", default=None)
+    replay = config.getoption("llm_replay", default=None)
+    if record and replay:
+        raise pytest.UsageError("--llm-record and --llm-replay cannot be used together")
+    if not (record or replay):
+        return
+
+    _set_environment(config, "ASSERTER_CASSETTE_MODE", "record" if record else "replay")
+    _set_environment(config, "ASSERTER_CASSETTE_PATH", record or replay)
+
+
+def _set_environment(config, name, value):
+    """Set an environment variable for the rest of the run, saving its value to restore at unconfigure"""
+    saved = config.stash.setdefault(saved_environment_key, {})
+    saved.setdefault(name, os.environ.get(name))
+    os.environ[name] = value
+
+
+def pytest_unconfigure(config):
+    """Shut down the deferred assertion workers and restore the environment set for the run"""
+    collector = config.stash.get(deferred_collector_key, None)
+    if collector is not None:
+        collector.shutdown()
+
+    for name, value in config.stash.get(saved_environment_key, {}).items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute the behavioral assertions made while a test runs to its node ID"""
+    with attribute_assertions_to(item.nodeid):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Fail tests whose deferred behavioral assertions did not pass"""
+    __tracebackhide__ = True
+    outcome = yield
+
+    collector = item.config.stash.get(deferred_collector_key, None)
+    if collector is None or call.when != "call":
+        return
+
+    error = collector.drain()
+    report = outcome.get_result()
+
+    if error is not None and report.passed:
+        try:
+            raise error
+        except BaseException:
+            excinfo = pytest.ExceptionInfo.from_current()
+        report.outcome = "failed"
+        report.longrepr = item.repr_failure(excinfo)
+
+
+def _fixture_scope(fixture_name, config):
+    """Resolve the scope of the asserter fixtures from the command line or ini file"""
+    scope = config.getoption("llm_fixture_scope", default=None) or config.getini("llm_app_test_fixture_scope")
+    scope = (scope or "function").strip().lower()
+    if scope not in FIXTURE_SCOPES:
+        raise pytest.UsageError(
+            f"Invalid llm_app_test_fixture_scope: {scope}. Must be one of {', '.join(FIXTURE_SCOPES)}"
+        )
+    return scope
+
+
+@pytest.fixture(scope="session")
+def shared_behavioral_assert():
+    """Session-wide asserter reusing one LLM client and rate limiter for the whole run"""
+    from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+    return BehavioralAssertion()
+
+
+@pytest.fixture(scope=_fixture_scope)
+def behavioral_assert(request):
     """Fixture to provide semantic assertion capabilities"""
+    if _fixture_scope("behavioral_assert", request.config) == "session":
+        return request.getfixturevalue("shared_behavioral_assert")
+    from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
     return BehavioralAssertion()
 
 
-@pytest.fixture
-def assert_behavioral_match(behavioral_assert):
+@pytest.fixture(scope=_fixture_scope)
+def assert_behavioral_match(request, behavioral_assert):
     """Fixture for semantic matching"""
+    collector = request.config.stash.get(deferred_collector_key, None)
+    if collector is not None:
+        return DeferredBehavioralMatch(behavioral_assert, collector)
     return behavioral_assert.assert_behavioral_match
 
 @pytest.fixture
 @deprecated
 def semantic_assert():
     """Deprecated: Use behavioral_assert instead"""
+    from llm_app_test.semantic_assert.semantic_assert import SemanticAssertion
     return SemanticAssertion()
 
 @pytest.fixture
@@ -0,0 +1,158 @@
+import re
+import threading
+import time
+from typing import Mapping, Optional
+
+from llm_app_test.rate_limiter.metered_in_memory_rate_limiter import MeteredInMemoryRateLimiter
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# Remaining-quota headers sent by OpenAI (x-ratelimit-*) and Anthropic (anthropic-ratelimit-*)
+_REMAINING_HEADERS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset"),
+    ("anthropic-ratelimit-input-tokens-remaining", "anthropic-ratelimit-input-tokens-reset"),
+)
+
+
+class AdaptiveRateLimiter(MeteredInMemoryRateLimiter):
+    """
+    InMemoryRateLimiter whose rate adapts to the provider using AIMD.
+
+    Every successful call raises requests_per_second by additive_increase, up to
+    max_requests_per_second. A rate-limited or overloaded call cuts it by
+    multiplicative_decrease, down to min_requests_per_second. Retry-After and the
+    provider's remaining-quota headers pause the bucket until the quota resets, so
+    waiting requests are not sent straight into another 429.
+
+    Feedback arrives through record_success and record_rate_limited, which
+    AdaptiveRateLimiterCallbackHandler calls from LangChain's callback events.
+
+    Attributes:
+        min_requests_per_second: The rate is never cut below this value.
+        max_requests_per_second: The rate is never raised above this value.
+        additive_increase: Requests per second added after each success.
+        multiplicative_decrease: Factor applied to the rate after each rate-limited call.
+        paused_until: Monotonic time before which no request is let through.
+    """
+
+    def __init__(
+            self,
+            *,
+            requests_per_second: float = 1,
+            check_every_n_seconds: float = 0.1,
+            max_bucket_size: float = 1,
+            min_requests_per_second: float = 0.05,
+            max_requests_per_second: float = 20.0,
+            additive_increase: float = 0.1,
+            multiplicative_decrease: float = 0.5
+    ):
+        super().__init__(
+            requests_per_second=requests_per_second,
+            check_every_n_seconds=check_every_n_seconds,
+            max_bucket_size=max_bucket_size
+        )
+        self.min_requests_per_second = min_requests_per_second
+        self.max_requests_per_second = max_requests_per_second
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.paused_until = 0.0
+        self._feedback_lock = threading.Lock()
+
+    def _consume(self) -> bool:
+        if time.monotonic() < self.paused_until:
+            return False
+        return super()._consume()
+
+    def record_success(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Raise the rate after a successful call, unless the response says the quota is exhausted.
+
+        Args:
+            headers: Response headers, if the provider integration exposes them.
+        """
+        exhausted_for = self._exhausted_for(headers or {})
+
+        with self._feedback_lock:
+            if exhausted_for is None:
+                self._set_rate(self.requests_per_second + self.additive_increase)
+            else:
+                self._pause(exhausted_for)
+
+    def record_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Cut the rate after a 429 or overloaded response and honour Retry-After.
+
+        Args:
+            retry_after: Seconds the provider asked us to wait, if it said.
+        """
+        with self._feedback_lock:
+            self._set_rate(self.requests_per_second * self.multiplicative_decrease)
+            if retry_after:
+                self._pause(retry_after)
+
+    def _set_rate(self, requests_per_second: float) -> None:
+        with self._consume_lock:
+            self.requests_per_second = min(
+                max(requests_per_second, self.min_requests_per_second),
+                self.max_requests_per_second
+            )
+
+    def _pause(self, seconds: float) -> None:
+        with self._consume_lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.available_tokens = 0.0
+            self.last = None
+
+    @classmethod
+    def _exhausted_for(cls, headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds until reset if any remaining-quota header reports zero, otherwise None"""
+        headers = {name.lower(): value for name, value in headers.items()}
+
+        for remaining_header, reset_header in _REMAINING_HEADERS:
+            remaining = headers.get(remaining_header)
+            if remaining is None:
+                continue
+            try:
+                if float(remaining) > 0:
+                    continue
+            except ValueError:
+                continue
+            return parse_reset(headers.get(reset_header)) or 1.0
+
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; HTTP dates are ignored"""
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate-limit reset header into seconds.
+
+    Accepts OpenAI durations such as "1s", "6m0s" or "250ms" and plain seconds. Anthropic
+    sends an RFC 3339 timestamp, which is not parsed here and falls back to the caller's
+    default pause.
+    """
+    if value is None:
+        return None
+
+    seconds = parse_retry_after(value)
+    if seconds is not None:
+        return seconds
+
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value.strip():
+        return None
+
+    return sum(float(number) * _DURATION_SECONDS[unit] for number, unit in parts)
@@ -0,0 +1,47 @@
+from typing import Any, Mapping, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from llm_app_test.rate_limiter.adaptive_rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+RATE_LIMITED_STATUS_CODES = (429, 529)
+
+
+class AdaptiveRateLimiterCallbackHandler(BaseCallbackHandler):
+    """
+    Feeds the outcome of every LLM call back into an AdaptiveRateLimiter.
+
+    Successes carry the response headers when the integration includes them (ChatOpenAI
+    with include_response_headers). Errors are treated as rate limiting when their HTTP
+    status is 429 (rate limited) or 529 (Anthropic overloaded), and their Retry-After
+    header is passed on. Other errors leave the rate unchanged, except the GeneratorExit
+    reported when a stream is closed early (streaming verdict mode on PASS), which is a
+    successful request.
+    """
+
+    def __init__(self, rate_limiter: AdaptiveRateLimiter):
+        self.rate_limiter = rate_limiter
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self.rate_limiter.record_success(self._response_headers(response))
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        if isinstance(error, GeneratorExit):
+            self.rate_limiter.record_success()
+            return
+
+        if getattr(error, "status_code", None) not in RATE_LIMITED_STATUS_CODES:
+            return
+
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        self.rate_limiter.record_rate_limited(parse_retry_after(headers.get("retry-after")))
+
+    @staticmethod
+    def _response_headers(response: LLMResult) -> Optional[Mapping[str, str]]:
+        for generations in response.generations:
+            for generation in generations:
+                headers = (generation.generation_info or {}).get("headers")
+                if headers:
+                    return headers
+        return None
@@ -0,0 +1,141 @@
+import asyncio
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Optional
+
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from llm_app_test.metrics.assertion_metrics_collector import measure_rate_limiter_wait
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class CrossProcessRateLimiter(BaseRateLimiter):
+    """
+    Token bucket rate limiter whose bucket is shared by every process on the machine.
+
+    The bucket state (available tokens and last refill time) lives in a small memory-mapped
+    state file, and every read-modify-write of that state happens under an exclusive
+    fcntl lock on the file. All pytest-xdist workers pointed at the same state file
+    therefore draw from one bucket. The refill logic mirrors LangChain's InMemoryRateLimiter.
+
+    Attributes:
+        requests_per_second: The number of tokens added to the bucket per second.
+        check_every_n_seconds: How often to check for available tokens while blocking.
+        max_bucket_size: The maximum number of tokens that can accumulate in the bucket.
+        state_file: Path of the shared state file.
+    """
+
+    _STATE = struct.Struct("dd")
+
+    def __init__(
+            self,
+            state_file: str,
+            requests_per_second: float = 1,
+            check_every_n_seconds: float = 0.1,
+            max_bucket_size: float = 1
+    ):
+        if fcntl is None:
+            raise OSError("The cross-process rate limiter requires fcntl, which is unavailable on this platform")
+
+        self.state_file = state_file
+        self.requests_per_second = requests_per_second
+        self.check_every_n_seconds = check_every_n_seconds
+        self.max_bucket_size = max_bucket_size
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._map: Optional[mmap.mmap] = None
+        self._pid: Optional[int] = None
+
+        directory = os.path.dirname(os.path.abspath(state_file))
+        os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    def _open(self) -> None:
+        """Open and map the state file, re-opening after a fork so processes never share descriptors"""
+        if self._pid == os.getpid():
+            return
+
+        fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size < self._STATE.size:
+                os.ftruncate(fd, self._STATE.size)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+        self._fd = fd
+        self._map = mmap.mmap(fd, self._STATE.size)
+        self._pid = os.getpid()
+
+    def _consume(self) -> bool:
+        """Try to take one token from the shared bucket"""
+        with self._thread_lock:
+            self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                available_tokens, last = self._STATE.unpack_from(self._map, 0)
+                now = time.time()
+
+                # initialize on first use to avoid a burst, and recover if the clock went backwards
+                if last <= 0 or last > now:
+                    last = now
+
+                elapsed = now - last
+
+                if elapsed * self.requests_per_second >= 1:
+                    available_tokens += elapsed * self.requests_per_second
+                    last = now
+
+                available_tokens = min(available_tokens, self.max_bucket_size)
+
+                consumed = available_tokens >= 1
+                if consumed:
+                    available_tokens -= 1
+
+                self._STATE.pack_into(self._map, 0, available_tokens, last)
+                return consumed
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @measure_rate_limiter_wait
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """
+        Take a token from the shared bucket.
+
+        Args:
+            blocking: If True, wait until a token is available. If False, return immediately.
+
+        Returns:
+            True if a token was taken, False otherwise.
+        """
+        if not blocking:
+            return self._consume()
+
+        while not self._consume():
+            time.sleep(self.check_every_n_seconds)
+        return True
+
+    @measure_rate_limiter_wait
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """
+        Take a token from the shared bucket without blocking the event loop.
+
+        Args:
+            blocking: If True, wait until a token is available. If False, return immediately.
+
+        Returns:
+            True if a token was taken, False otherwise.
+        """
+        if not blocking:
+            return self._consume()
+
+        while not self._consume():
+            await asyncio.sleep(self.check_every_n_seconds)
+        return True
@@ -0,0 +1,15 @@
+from langchain_core.rate_limiters import InMemoryRateLimiter
+
+from llm_app_test.metrics.assertion_metrics_collector import measure_rate_limiter_wait
+
+
+class MeteredInMemoryRateLimiter(InMemoryRateLimiter):
+    """InMemoryRateLimiter charging the time requests wait for a token to the assertion that sent them"""
+
+    @measure_rate_limiter_wait
+    def acquire(self, *, blocking: bool = True) -> bool:
+        return super().acquire(blocking=blocking)
+
+    @measure_rate_limiter_wait
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        return await super().aacquire(blocking=blocking)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class RateLimiterBackend(Enum):
+    IN_MEMORY = "in_memory"
+    CROSS_PROCESS = "cross_process"
+    ADAPTIVE = "adaptive"
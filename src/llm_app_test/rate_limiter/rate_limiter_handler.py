@@ -1,4 +1,5 @@
 import os
+import tempfile
 from typing import Optional
 
 from dotenv import load_dotenv
@@ -6,6 +7,11 @@ from langchain_core.rate_limiters import InMemoryRateLimiter
 
 from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import RateLimiterConstants
 from llm_app_test.behavioral_assert.validation.rate_limiter_input_validator import RateLimiterInputsValidator
+from llm_app_test.exceptions.test_exceptions import RateLimiterConfigurationError
+from llm_app_test.rate_limiter.adaptive_rate_limiter import AdaptiveRateLimiter
+from llm_app_test.rate_limiter.cross_process_rate_limiter import CrossProcessRateLimiter
+from llm_app_test.rate_limiter.metered_in_memory_rate_limiter import MeteredInMemoryRateLimiter
+from llm_app_test.rate_limiter.tokens_per_minute_rate_limiter import TokensPerMinuteRateLimiter
 
 
 class LLMInMemoryRateLimiter:
@@ -81,8 +87,191 @@ class LLMInMemoryRateLimiter:
             specified rate limiting settings.
             @rtype: InMemoryRateLimiter
         """
-        return InMemoryRateLimiter(
+        return MeteredInMemoryRateLimiter(
             requests_per_second=self.requests_per_second,
             check_every_n_seconds=self.check_every_n_seconds,
             max_bucket_size=self.max_bucket_size
-        )
\ No newline at end of file
+        )
+
+
+class LLMCrossProcessRateLimiter(LLMInMemoryRateLimiter):
+    """
+    Rate limiter configuration whose token bucket is shared across processes on one machine.
+
+    Takes the same parameters and environment variables as LLMInMemoryRateLimiter, plus the
+    location of the shared state file. Every process (for example every pytest-xdist worker)
+    configured with the same state file draws from the same bucket.
+
+    Attributes:
+        state_file: Path of the shared bucket state file.
+    """
+    def __init__(self,
+                 requests_per_second: Optional[float] = None,
+                 check_every_n_seconds: Optional[float] = None,
+                 max_bucket_size: Optional[float] = None,
+                 state_file: Optional[str] = None
+    ):
+        """
+        Initializes the cross-process rate limiter configuration.
+
+        Parameters:
+        requests_per_second, check_every_n_seconds, max_bucket_size:
+            As for LLMInMemoryRateLimiter.
+        state_file: Optional[str]
+            Path of the shared bucket state file. If not specified, retrieved from the
+            `RATE_LIMITER_STATE_FILE` environment variable or defaults to
+            `RateLimiterConstants.STATE_FILE_NAME` in the system temporary directory.
+        """
+        super().__init__(requests_per_second, check_every_n_seconds, max_bucket_size)
+        state_file_override = state_file if state_file is not None else os.getenv(
+            'RATE_LIMITER_STATE_FILE',
+            os.path.join(tempfile.gettempdir(), RateLimiterConstants.STATE_FILE_NAME)
+        )
+        self.state_file = RateLimiterInputsValidator.validate_state_file(state_file_override)
+
+    @property
+    def get_rate_limiter(self) -> CrossProcessRateLimiter:
+        """
+            Returns an instance of CrossProcessRateLimiter configured with the rate
+            limiting parameters and state file defined for the current instance.
+
+            @return: An instance of CrossProcessRateLimiter sharing its bucket through
+            the configured state file.
+            @rtype: CrossProcessRateLimiter
+        """
+        try:
+            return CrossProcessRateLimiter(
+                state_file=self.state_file,
+                requests_per_second=self.requests_per_second,
+                check_every_n_seconds=self.check_every_n_seconds,
+                max_bucket_size=self.max_bucket_size
+            )
+        except OSError as e:
+            raise RateLimiterConfigurationError(
+                message=f"Unable to open rate limiter state file: {self.state_file}.",
+                reason=str(e)) from e
+
+
+class LLMAdaptiveRateLimiter(LLMInMemoryRateLimiter):
+    """
+    Rate limiter configuration whose rate adapts to the provider's responses.
+
+    Takes the same parameters and environment variables as LLMInMemoryRateLimiter, where
+    requests_per_second is the starting rate, plus the bounds the rate may move within.
+
+    Attributes:
+        min_requests_per_second: Lower bound for the adapted rate.
+        max_requests_per_second: Upper bound for the adapted rate.
+    """
+    def __init__(self,
+                 requests_per_second: Optional[float] = None,
+                 check_every_n_seconds: Optional[float] = None,
+                 max_bucket_size: Optional[float] = None,
+                 min_requests_per_second: Optional[float] = None,
+                 max_requests_per_second: Optional[float] = None
+    ):
+        """
+        Initializes the adaptive rate limiter configuration.
+
+        Parameters:
+        requests_per_second, check_every_n_seconds, max_bucket_size:
+            As for LLMInMemoryRateLimiter; requests_per_second is the starting rate.
+        min_requests_per_second: Optional[float]
+            Lower bound for the rate. If not specified, retrieved from the
+            `RATE_LIMITER_MIN_REQUESTS_PER_SECOND` environment variable or defaults to
+            `RateLimiterConstants.ADAPTIVE_MIN_REQUESTS_PER_SECOND`.
+        max_requests_per_second: Optional[float]
+            Upper bound for the rate. If not specified, retrieved from the
+            `RATE_LIMITER_MAX_REQUESTS_PER_SECOND` environment variable or defaults to
+            `RateLimiterConstants.ADAPTIVE_MAX_REQUESTS_PER_SECOND`.
+        """
+        super().__init__(requests_per_second, check_every_n_seconds, max_bucket_size)
+        min_override = min_requests_per_second if min_requests_per_second is not None else os.getenv(
+            'RATE_LIMITER_MIN_REQUESTS_PER_SECOND', RateLimiterConstants.ADAPTIVE_MIN_REQUESTS_PER_SECOND)
+        max_override = max_requests_per_second if max_requests_per_second is not None else os.getenv(
+            'RATE_LIMITER_MAX_REQUESTS_PER_SECOND', RateLimiterConstants.ADAPTIVE_MAX_REQUESTS_PER_SECOND)
+
+        self.min_requests_per_second, self.max_requests_per_second = \
+            RateLimiterInputsValidator.validate_adaptive_bounds(min_override, max_override)
+
+    @property
+    def get_rate_limiter(self) -> AdaptiveRateLimiter:
+        """
+            Returns an instance of AdaptiveRateLimiter starting at the configured rate
+            and bounded by the configured minimum and maximum.
+
+            @return: An instance of AdaptiveRateLimiter.
+            @rtype: AdaptiveRateLimiter
+        """
+        return AdaptiveRateLimiter(
+            requests_per_second=min(max(self.requests_per_second, self.min_requests_per_second),
+                                    self.max_requests_per_second),
+            check_every_n_seconds=self.check_every_n_seconds,
+            max_bucket_size=self.max_bucket_size,
+            min_requests_per_second=self.min_requests_per_second,
+            max_requests_per_second=self.max_requests_per_second,
+            additive_increase=RateLimiterConstants.ADAPTIVE_ADDITIVE_INCREASE,
+            multiplicative_decrease=RateLimiterConstants.ADAPTIVE_MULTIPLICATIVE_DECREASE
+        )
+
+
+class LLMTokensPerMinuteRateLimiter:
+    """
+    Tokens-per-minute rate limiter configuration.
+
+    Providers often meter input tokens per minute as well as requests, and long actual
+    outputs exhaust the token quota well before the request quota. This configuration
+    builds a TokensPerMinuteRateLimiter that the asserter charges with the estimated
+    prompt size of every judge request, alongside the request rate limiter.
+
+    Attributes:
+        tokens_per_minute: The number of prompt tokens allowed per minute, 0 disables the limiter.
+        check_every_n_seconds: The interval in seconds to check for available budget.
+    """
+    def __init__(self,
+                 tokens_per_minute: Optional[float] = None,
+                 check_every_n_seconds: Optional[float] = None
+    ):
+        """
+        Initializes the tokens-per-minute configuration, validating the provided or
+        retrieved values using the `RateLimiterInputsValidator`.
+
+        Parameters:
+        tokens_per_minute: Optional[float]
+            Prompt tokens allowed per minute. If not specified, retrieved from the
+            `RATE_LIMITER_TOKENS_PER_MINUTE` environment variable or defaults to
+            `RateLimiterConstants.TOKENS_PER_MINUTE` (disabled).
+        check_every_n_seconds: Optional[float]
+            As for LLMInMemoryRateLimiter, shared through `RATE_LIMITER_CHECK_EVERY_N_SECONDS`.
+        """
+        load_dotenv()
+
+        tokens_per_minute_override = tokens_per_minute if tokens_per_minute is not None else os.getenv(
+            'RATE_LIMITER_TOKENS_PER_MINUTE',
+            RateLimiterConstants.TOKENS_PER_MINUTE
+        )
+        check_every_n_seconds_override = check_every_n_seconds if check_every_n_seconds is not None else os.getenv(
+            'RATE_LIMITER_CHECK_EVERY_N_SECONDS',
+            RateLimiterConstants.CHECK_EVERY_N_SECONDS
+        )
+
+        self.tokens_per_minute = RateLimiterInputsValidator.validate_tokens_per_minute(tokens_per_minute_override)
+        self.check_every_n_seconds = RateLimiterInputsValidator.validate_check_every_n_seconds(
+            check_every_n_seconds_override)
+
+    @property
+    def get_rate_limiter(self) -> Optional[TokensPerMinuteRateLimiter]:
+        """
+            Returns an instance of TokensPerMinuteRateLimiter configured with the
+            parameters of the current instance, or None when tokens_per_minute is 0.
+
+            @return: An instance of TokensPerMinuteRateLimiter, or None if disabled.
+            @rtype: Optional[TokensPerMinuteRateLimiter]
+        """
+        if not self.tokens_per_minute:
+            return None
+
+        return TokensPerMinuteRateLimiter(
+            tokens_per_minute=self.tokens_per_minute,
+            check_every_n_seconds=self.check_every_n_seconds
+        )
@@ -0,0 +1,31 @@
+import math
+from typing import Sequence
+
+from langchain_core.messages import BaseMessage
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import RateLimiterConstants
+from llm_app_test.behavioral_assert.llm_config.message_text import content_text
+
+
+def estimate_prompt_tokens(messages: Sequence[BaseMessage]) -> int:
+    """
+    Estimate the prompt token cost of a judge request without calling a tokenizer.
+
+    Uses the common rule of thumb of about four characters per token for English text plus
+    a small per-message overhead for role and formatting tokens. The estimate only has to
+    be close enough to keep a tokens-per-minute budget, and avoids importing a provider
+    specific tokenizer on the hot path.
+    """
+    tokens = 0
+
+    for message in messages:
+        tokens += RateLimiterConstants.TOKENS_PER_MESSAGE
+        tokens += estimate_text_tokens(content_text(message.content))
+
+    return tokens
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Estimate the token count of a piece of text with the same characters-per-token rule"""
+    return math.ceil(len(text) / RateLimiterConstants.CHARS_PER_TOKEN)
+
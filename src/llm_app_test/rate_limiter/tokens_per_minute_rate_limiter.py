@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from llm_app_test.metrics.assertion_metrics_collector import measure_rate_limiter_wait
+
+
+class TokensPerMinuteRateLimiter:
+    """
+    Token bucket that limits the number of prompt tokens sent per minute.
+
+    Unlike LangChain's request-based rate limiters, each acquire is charged the estimated
+    token cost of the request. The bucket holds one minute of budget, refills continuously
+    at tokens_per_minute / 60 per second and starts full, matching how providers meter
+    per-minute token quotas. A request larger than the whole budget waits for a full
+    bucket and then empties it, so it is never blocked forever.
+
+    Attributes:
+        tokens_per_minute: The number of prompt tokens allowed per minute.
+        check_every_n_seconds: How often to check for available budget while blocking.
+        available_tokens: The budget currently left in the bucket.
+    """
+
+    def __init__(self, tokens_per_minute: float, check_every_n_seconds: float = 0.1):
+        self.tokens_per_minute = tokens_per_minute
+        self.check_every_n_seconds = check_every_n_seconds
+        self.available_tokens = tokens_per_minute
+        self._lock = threading.Lock()
+        self._last: Optional[float] = None
+
+    def _consume(self, tokens: float) -> bool:
+        """Try to charge tokens against the bucket"""
+        with self._lock:
+            now = time.monotonic()
+
+            if self._last is not None:
+                refill = (now - self._last) * self.tokens_per_minute / 60
+                self.available_tokens = min(self.available_tokens + refill, self.tokens_per_minute)
+            self._last = now
+
+            cost = min(tokens, self.tokens_per_minute)
+            if self.available_tokens >= cost:
+                self.available_tokens -= cost
+                return True
+
+            return False
+
+    @measure_rate_limiter_wait
+    def acquire(self, tokens: float, *, blocking: bool = True) -> bool:
+        """
+        Charge a request's token cost against the bucket.
+
+        Args:
+            tokens: The estimated token cost of the request.
+            blocking: If True, wait until the budget is available. If False, return immediately.
+
+        Returns:
+            True if the tokens were charged, False otherwise.
+        """
+        if not blocking:
+            return self._consume(tokens)
+
+        while not self._consume(tokens):
+            time.sleep(self.check_every_n_seconds)
+        return True
+
+    @measure_rate_limiter_wait
+    async def aacquire(self, tokens: float, *, blocking: bool = True) -> bool:
+        """
+        Charge a request's token cost against the bucket without blocking the event loop.
+
+        Args:
+            tokens: The estimated token cost of the request.
+            blocking: If True, wait until the budget is available. If False, return immediately.
+
+        Returns:
+            True if the tokens were charged, False otherwise.
+        """
+        if not blocking:
+            return self._consume(tokens)
+
+        while not self._consume(tokens):
+            await asyncio.sleep(self.check_every_n_seconds)
+        return True
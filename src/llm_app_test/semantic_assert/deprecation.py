@@ -0,0 +1,25 @@
+import functools
+import sys
+import warnings
+
+
+def deprecated(func):
+    """This decorator marks functions and classes as deprecated"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        warnings.warn(
+            f"{func.__name__} is deprecated. Use behavioral testing methods such as BehavioralAssert.assert_behavioral_match(actual, expected) instead. "
+            f"{func.__name__} will be removed in version 1.0.0 or the first update "
+            f"after 1 June 2025, whichever comes later",
+            category=UserWarning,
+            stacklevel=2
+        )
+        print(
+            f"\nWARNING: {func.__name__} is deprecated. Use behavioral testing methods such as BehavioralAssert.assert_behavioral_match(actual, expected) instead. "
+            f"{func.__name__} will be removed in version 1.0.0 or the first update "
+            f"after 1 June 2025, whichever comes later\n",
+            file=sys.stderr)
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -1,6 +1,3 @@
-import functools
-import sys
-import warnings
 from typing import Optional, Union, Tuple, Type
 
 from langchain_core.language_models import BaseLanguageModel
@@ -9,28 +6,7 @@ from langchain_core.runnables import Runnable
 from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompt_configurator import AsserterPromptConfigurator
 from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
 from llm_app_test.behavioral_assert.llm_config.llm_provider_enum import LLMProvider
-
-
-def deprecated(func):
-    """This decorator marks functions and classes as deprecated"""
-
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        warnings.warn(
-            f"{func.__name__} is deprecated. Use behavioral testing methods such as BehavioralAssert.assert_behavioral_match(actual, expected) instead. "
-            f"{func.__name__} will be removed in version 1.0.0 or the first update "
-            f"after 1 June 2025, whichever comes later",
-            category=UserWarning,
-            stacklevel=2
-        )
-        print(
-            f"\nWARNING: {func.__name__} is deprecated. Use behavioral testing methods such as BehavioralAssert.assert_behavioral_match(actual, expected) instead. "
-            f"{func.__name__} will be removed in version 1.0.0 or the first update "
-            f"after 1 June 2025, whichever comes later\n",
-            file=sys.stderr)
-        return func(*args, **kwargs)
-
-    return wrapper
+from llm_app_test.semantic_assert.deprecation import deprecated
 
 
 @deprecated
@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import VerdictCacheConstants
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.verdict_cache.verdict_cache_stats import VerdictCacheStats
+
+
+class InMemoryVerdictCache:
+    """
+    Bounded, thread-safe LRU verdict cache with a per-entry time to live.
+
+    Entries are evicted in least recently used order once max_size is reached, and are
+    dropped on lookup once they are older than ttl_seconds. A ttl_seconds of 0 disables
+    expiry.
+
+    Attributes:
+        max_size: Maximum number of verdicts held at once.
+        ttl_seconds: Seconds a verdict stays valid after being stored.
+    """
+
+    def __init__(
+            self,
+            max_size: int = VerdictCacheConstants.IN_MEMORY_MAX_SIZE,
+            ttl_seconds: float = VerdictCacheConstants.IN_MEMORY_TTL_SECONDS
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Verdict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[Verdict]:
+        """
+        Look up a cached verdict, refreshing its position in the LRU order.
+
+        Args:
+            key: Cache key built by VerdictCacheKey.build
+
+        Returns:
+            The cached Verdict, or None on a miss or if the entry has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            stored_at, verdict = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return verdict
+
+    def set(self, key: str, verdict: Verdict) -> None:
+        """
+        Store a verdict, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: Cache key built by VerdictCacheKey.build
+            verdict: The verdict to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), verdict)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached verdict and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    @property
+    def stats(self) -> VerdictCacheStats:
+        """
+        Returns a snapshot of the cache counters.
+
+        Returns:
+            VerdictCacheStats: Hit, miss, eviction and expiration counts plus current size
+        """
+        with self._lock:
+            return VerdictCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_size=self.max_size
+            )
+
+
+_shared_cache: Optional[InMemoryVerdictCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_verdict_cache(
+        max_size: int = VerdictCacheConstants.IN_MEMORY_MAX_SIZE,
+        ttl_seconds: float = VerdictCacheConstants.IN_MEMORY_TTL_SECONDS
+) -> InMemoryVerdictCache:
+    """
+    Return the process-wide in-memory verdict cache shared by all BehavioralAssertion instances.
+
+    The cache is created on first use with the given limits. Later calls return the same
+    instance and apply the most recently requested limits to it.
+
+    Args:
+        max_size: Maximum number of verdicts held at once
+        ttl_seconds: Seconds a verdict stays valid after being stored
+
+    Returns:
+        InMemoryVerdictCache: The shared cache
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = InMemoryVerdictCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        else:
+            _shared_cache.max_size = max_size
+            _shared_cache.ttl_seconds = ttl_seconds
+        return _shared_cache
+
+
+def reset_shared_verdict_cache() -> None:
+    """Discard the process-wide in-memory verdict cache."""
+    global _shared_cache
+    with _shared_cache_lock:
+        _shared_cache = None
@@ -0,0 +1,138 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import VerdictCacheConstants
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.exceptions.test_exceptions import VerdictCacheError
+
+
+class SQLiteVerdictCache:
+    """
+    Persistent verdict cache backed by SQLite.
+
+    The database is opened in WAL mode so that several processes (for example pytest-xdist
+    workers) can read and write the same cache file concurrently. Each thread gets its own
+    connection because sqlite3 connections cannot be shared between threads.
+
+    Attributes:
+        path: Location of the SQLite database file.
+    """
+
+    _CREATE_TABLE = """
+        CREATE TABLE IF NOT EXISTS verdicts (
+            key TEXT PRIMARY KEY,
+            passed INTEGER NOT NULL,
+            reason TEXT,
+            created_at REAL NOT NULL,
+            confidence REAL,
+            votes TEXT
+        )
+    """
+
+    # columns added after the first release, added to existing cache files when they are opened
+    _ADDED_COLUMNS = {"confidence": "REAL", "votes": "TEXT"}
+
+    def __init__(self, path: str, busy_timeout: float = VerdictCacheConstants.BUSY_TIMEOUT_SECONDS):
+        """
+        Open (and create if necessary) the verdict cache database.
+
+        Args:
+            path: Location of the SQLite database file
+            busy_timeout: Seconds to wait for a lock held by another writer
+
+        Raises:
+            VerdictCacheError: If the database cannot be opened or initialised
+        """
+        self.path = path
+        self._busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            connection = self._connection()
+            connection.execute(self._CREATE_TABLE)
+            self._add_missing_columns(connection)
+            connection.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise VerdictCacheError(
+                f"Unable to open verdict cache at {path}",
+                reason=str(e)
+            ) from e
+
+    def get(self, key: str) -> Optional[Verdict]:
+        """
+        Look up a cached verdict.
+
+        Args:
+            key: Cache key built by VerdictCacheKey.build
+
+        Returns:
+            The cached Verdict, or None on a cache miss
+        """
+        try:
+            row = self._connection().execute(
+                "SELECT passed, reason, confidence, votes FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            raise VerdictCacheError("Unable to read from verdict cache", reason=str(e)) from e
+
+        if row is None:
+            return None
+        votes = tuple(json.loads(row[3])) if row[3] is not None else None
+        return Verdict(passed=bool(row[0]), reason=row[1], confidence=row[2], votes=votes)
+
+    def set(self, key: str, verdict: Verdict) -> None:
+        """
+        Store a verdict.
+
+        Args:
+            key: Cache key built by VerdictCacheKey.build
+            verdict: The verdict to store
+        """
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, passed, reason, created_at, confidence, votes) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, int(verdict.passed), verdict.reason, time.time(), verdict.confidence,
+                 json.dumps(list(verdict.votes)) if verdict.votes is not None else None)
+            )
+            connection.commit()
+        except sqlite3.Error as e:
+            raise VerdictCacheError("Unable to write to verdict cache", reason=str(e)) from e
+
+    def clear(self) -> None:
+        """Remove every cached verdict."""
+        try:
+            connection = self._connection()
+            connection.execute("DELETE FROM verdicts")
+            connection.commit()
+        except sqlite3.Error as e:
+            raise VerdictCacheError("Unable to clear verdict cache", reason=str(e)) from e
+
+    def _add_missing_columns(self, connection: sqlite3.Connection) -> None:
+        """Bring a cache file written by an earlier version up to the current schema"""
+        existing = {row[1] for row in connection.execute("PRAGMA table_info(verdicts)")}
+        for name, column_type in self._ADDED_COLUMNS.items():
+            if name in existing:
+                continue
+            try:
+                connection.execute(f"ALTER TABLE verdicts ADD COLUMN {name} {column_type}")
+            except sqlite3.OperationalError as e:
+                # another process opening the same file may have added it first
+                if "duplicate column" not in str(e):
+                    raise
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self._busy_timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
@@ -0,0 +1,103 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from langchain_core.runnables import Runnable
+from langchain_core.runnables.base import RunnableBindingBase
+
+from llm_app_test.behavioral_assert.llm_config.llm_config import LLMConfig
+
+
+class VerdictCacheKey:
+    """Builds content-addressed keys for cached behavioral verdicts"""
+
+    KEY_VERSION = 1
+
+    @staticmethod
+    def describe_config(config: LLMConfig) -> Dict[str, Any]:
+        """
+        Describe the judge LLM built from an LLMConfig.
+
+        Args:
+            config: The configuration the judge LLM was created from
+
+        Returns:
+            Dict containing the provider, model and temperature of the judge, and its
+            base URL when it does not use the provider's own endpoint
+        """
+        description = {
+            "provider": config.provider.value,
+            "model": config.model,
+            "temperature": config.temperature
+        }
+        if config.base_url:
+            description["base_url"] = config.base_url
+        return description
+
+    @staticmethod
+    def describe_runnable(llm: Runnable) -> Dict[str, Any]:
+        """
+        Describe a custom judge LLM passed directly to BehavioralAssertion.
+
+        Bindings such as the wrapper returned by with_retry are unwrapped so that the key
+        reflects the underlying chat model.
+
+        Args:
+            llm: The Runnable used as the judge
+
+        Returns:
+            Dict containing the class, model and temperature of the judge where available
+        """
+        while isinstance(llm, RunnableBindingBase):
+            llm = llm.bound
+
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+
+        return {
+            "provider": type(llm).__name__,
+            "model": str(model) if model is not None else None,
+            "temperature": VerdictCacheKey._as_float(getattr(llm, "temperature", None))
+        }
+
+    @staticmethod
+    def build(
+            llm_description: Dict[str, Any],
+            system_prompt: str,
+            human_prompt: str,
+            actual: str,
+            expected_behavior: str
+    ) -> str:
+        """
+        Build the cache key for a single judgement.
+
+        Args:
+            llm_description: Output of describe_config or describe_runnable
+            system_prompt: The system prompt sent to the judge
+            human_prompt: The formatted human prompt sent to the judge
+            actual: The actual output under test
+            expected_behavior: The expected behavior specification
+
+        Returns:
+            Hex encoded SHA-256 digest identifying the judgement
+        """
+        payload = json.dumps(
+            {
+                "version": VerdictCacheKey.KEY_VERSION,
+                "llm": llm_description,
+                "system_prompt": system_prompt,
+                "human_prompt": human_prompt,
+                "actual": actual,
+                "expected_behavior": expected_behavior
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _as_float(value: Any) -> Optional[float]:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
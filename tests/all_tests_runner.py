@@ -31,7 +31,33 @@ def get_test_files():
         str(test_dir / "test_rate_limiter" / "test_rate_limiter_scoped.py"),
         str(test_dir / "test_rate_limiter_validator" / "test_rate_limiter_input_validator.py"),
         str(test_dir / "test_with_retry" / "test_with_retry.py"),
-        str(test_dir / "test_with_retry" / "test_with_retry_validator.py")
+        str(test_dir / "test_with_retry" / "test_with_retry_validator.py"),
+        str(test_dir / "test_verdict_cache" / "test_sqlite_verdict_cache.py"),
+        str(test_dir / "test_verdict_cache" / "test_in_memory_verdict_cache.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_async.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_batch.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_multi_criteria.py"),
+        str(test_dir / "pytest_plugin_tests" / "test_fixture_scope.py"),
+        str(test_dir / "pytest_plugin_tests" / "test_deferred_mode.py"),
+        str(test_dir / "test_rate_limiter" / "test_cross_process_rate_limiter.py"),
+        str(test_dir / "pytest_plugin_tests" / "test_import_time.py"),
+        str(test_dir / "test_rate_limiter" / "test_tokens_per_minute_rate_limiter.py"),
+        str(test_dir / "test_rate_limiter" / "test_adaptive_rate_limiter.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_streaming.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_two_phase.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_confidence.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_votes.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_cascade.py"),
+        str(test_dir / "test_local_checks" / "test_local_checks.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_prompt_cache.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_long_input.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_canonicalization.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_cassette.py"),
+        str(test_dir / "pytest_plugin_tests" / "test_cassette_mode.py"),
+        str(test_dir / "test_mock_provider" / "test_mock_provider_server.py"),
+        str(test_dir / "test_benchmarks" / "test_assertion_throughput.py"),
+        str(test_dir / "test_behavioral_assert" / "test_behavioral_assert_metrics.py"),
+        str(test_dir / "pytest_plugin_tests" / "test_perf_report.py")
     ]
 
     semantic_test_files = [
@@ -0,0 +1,145 @@
+import math
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+
+# answers passing outputs containing "Hello", with a confidence of 0.9 when asked for logprobs
+GREETING_VERDICTS = {"Hello": ("PASS", 0.9), "": ("FAIL: not a greeting", 0.9)}
+
+# usage of a judge response reading 60 of its 100 input tokens from the provider's prompt cache
+CACHED_USAGE = {"input_tokens": 100, "output_tokens": 2, "total_tokens": 102, "input_token_details": {"cache_read": 60}}
+
+
+@dataclass(frozen=True)
+class FakeRequest:
+    """One request received by a FakeJudge"""
+    messages: List[BaseMessage]
+    kwargs: Dict[str, Any]
+
+    @property
+    def system(self) -> Any:
+        return self.messages[0].content
+
+    @property
+    def human(self) -> Any:
+        return self.messages[-1].content
+
+
+class FakeJudge(BaseChatModel):
+    """
+    Chat model standing in for the asserter LLM, recording every request it receives.
+
+    answers decides how each request is answered:
+
+    - a string, or a (content, probability) tuple, answers every request
+    - an exception is raised by every request
+    - a list is a script consumed one answer per request, repeating its last answer once exhausted,
+      whose entries can be any of the other kinds of answer
+    - a dict answers with the value of the first key found in the human prompt
+    - a callable is called with the human prompt and returns the answer
+
+    A (content, probability) answer carries OpenAI-style logprobs giving its first token that
+    probability when the request asks for logprobs. When chunks is set, every request is
+    answered with the chunks joined, and streamed requests receive them one at a time.
+    """
+    answers: Any = "PASS"
+    chunks: Optional[List[str]] = None
+    usage: Optional[Dict[str, Any]] = None
+    requests: List[FakeRequest] = []
+    sent: int = 0
+    closed: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-judge"
+
+    @property
+    def calls(self) -> int:
+        return len(self.requests)
+
+    @property
+    def prompts(self) -> List[Any]:
+        return [request.human for request in self.requests]
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None,
+                  **kwargs: Any) -> ChatResult:
+        if self.chunks is not None:
+            self.requests.append(FakeRequest(messages=messages, kwargs=kwargs))
+            self.sent = len(self.chunks)
+            return ChatResult(generations=[ChatGeneration(message=self._message("".join(self.chunks), {}))])
+
+        content, metadata = self._answer(messages, kwargs)
+        return ChatResult(generations=[ChatGeneration(message=self._message(content, metadata))])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None,
+                **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        try:
+            for chunk in self._stream_chunks(messages, kwargs):
+                self.sent += 1
+                yield ChatGenerationChunk(message=AIMessageChunk(content=chunk))
+        finally:
+            self.closed = True
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        try:
+            for chunk in self._stream_chunks(messages, kwargs):
+                self.sent += 1
+                yield ChatGenerationChunk(message=AIMessageChunk(content=chunk))
+        finally:
+            self.closed = True
+
+    def _stream_chunks(self, messages: List[BaseMessage], kwargs: Dict[str, Any]) -> List[str]:
+        if self.chunks is None:
+            return [self._answer(messages, kwargs)[0]]
+        self.requests.append(FakeRequest(messages=messages, kwargs=kwargs))
+        return self.chunks
+
+    def _answer(self, messages: List[BaseMessage], kwargs: Dict[str, Any]):
+        """Record the request and resolve its answer into content and response metadata"""
+        self.requests.append(FakeRequest(messages=messages, kwargs=kwargs))
+        human = messages[-1].content
+        answer = self.answers
+
+        if isinstance(answer, list):
+            answer = answer.pop(0) if len(answer) > 1 else answer[0]
+        if isinstance(answer, dict):
+            answer = answer[next(key for key in answer if key in human)]
+        elif callable(answer) and not isinstance(answer, BaseException):
+            answer = answer(human)
+
+        if isinstance(answer, BaseException):
+            raise answer
+        if not isinstance(answer, tuple):
+            return answer, {}
+
+        content, probability = answer
+        if not kwargs.get("logprobs"):
+            return content, {}
+        return content, {"logprobs": {"content": [{"token": content.split(":")[0], "logprob": math.log(probability)}]}}
+
+    def _message(self, content: str, metadata: Dict[str, Any]) -> AIMessage:
+        if self.usage is None:
+            return AIMessage(content=content, response_metadata=metadata)
+        return AIMessage(content=content, response_metadata=metadata, usage_metadata=self.usage)
+
+
+def asserter_with(judge: Optional[FakeJudge] = None, replace_llm: bool = False, **kwargs) -> BehavioralAssertion:
+    """
+    BehavioralAssertion judged by judge, a FakeJudge passing every request by default.
+
+    The judge is passed in as llm, or with replace_llm swapped in after construction, so the
+    asserter is still configured for its provider, for example to ask OpenAI for logprobs.
+    """
+    judge = judge if judge is not None else FakeJudge()
+    if not replace_llm:
+        return BehavioralAssertion(llm=judge, **kwargs)
+
+    asserter = BehavioralAssertion(**kwargs)
+    asserter.llm = judge
+    return asserter
@@ -0,0 +1,82 @@
+import os
+
+pytest_plugins = "pytester"
+
+JUDGE_CONFTEST = """
+import os
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+
+
+def judge(messages):
+    if os.environ.get("JUDGE_OFFLINE"):
+        raise RuntimeError("the judge was called")
+    if "hello" in messages[1].content.lower():
+        return AIMessage(content="PASS")
+    return AIMessage(content="FAIL: Output is not a greeting")
+
+
+@pytest.fixture
+def behavioral_assert():
+    return BehavioralAssertion(llm=RunnableLambda(judge))
+"""
+
+TESTS = """
+import pytest
+
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError
+
+
+def test_greeting(assert_behavioral_match):
+    assert_behavioral_match("Hello there", "A greeting")
+
+
+def test_farewell(assert_behavioral_match):
+    with pytest.raises(BehavioralAssertionError):
+        assert_behavioral_match("Goodbye", "A greeting")
+"""
+
+
+class TestCassetteMode:
+    """Test suite for the --llm-record / --llm-replay plugin modes"""
+
+    def test_replay_uses_recorded_responses(self, pytester, monkeypatch):
+        pytester.makeconftest(JUDGE_CONFTEST)
+        pytester.makepyfile(TESTS)
+        cassette = pytester.path / "judge.jsonl"
+
+        pytester.runpytest("-p", "no:cacheprovider", f"--llm-record={cassette}").assert_outcomes(passed=2)
+        monkeypatch.setenv("JUDGE_OFFLINE", "1")
+        result = pytester.runpytest("-p", "no:cacheprovider", f"--llm-replay={cassette}")
+
+        result.assert_outcomes(passed=2)
+        assert len(cassette.read_text().splitlines()) == 2
+
+    def test_replay_miss_fails(self, pytester, monkeypatch):
+        pytester.makeconftest(JUDGE_CONFTEST)
+        pytester.makepyfile(TESTS)
+        cassette = pytester.path / "judge.jsonl"
+        pytester.runpytest("-p", "no:cacheprovider", f"--llm-record={cassette}", "-k", "greeting")
+
+        monkeypatch.setenv("JUDGE_OFFLINE", "1")
+        result = pytester.runpytest("-p", "no:cacheprovider", f"--llm-replay={cassette}")
+
+        result.assert_outcomes(passed=1, failed=1)
+        result.stdout.fnmatch_lines(["*CassetteMissError*"])
+
+    def test_record_and_replay_are_exclusive(self, pytester):
+        result = pytester.runpytest("--llm-record", "--llm-replay")
+
+        result.stderr.fnmatch_lines(["*--llm-record and --llm-replay cannot be used together*"])
+
+    def test_environment_restored(self, pytester, monkeypatch):
+        monkeypatch.delenv("ASSERTER_CASSETTE_MODE", raising=False)
+        pytester.makepyfile("def test_nothing():\n    pass\n")
+
+        pytester.runpytest("-p", "no:cacheprovider", f"--llm-record={pytester.path / 'judge.jsonl'}")
+
+        assert "ASSERTER_CASSETTE_MODE" not in os.environ
@@ -0,0 +1,114 @@
+import pytest
+
+pytest_plugins = "pytester"
+
+SLOW_JUDGE_CONFTEST = """
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+
+
+def slow_judge(messages):
+    time.sleep(0.3)
+    if "hello" in messages[1].content.lower():
+        return AIMessage(content="PASS")
+    return AIMessage(content="FAIL: Output is not a greeting")
+
+
+@pytest.fixture
+def behavioral_assert():
+    return BehavioralAssertion(llm=RunnableLambda(slow_judge))
+"""
+
+
+class TestDeferredMode:
+    """Test suite for the --llm-deferred plugin mode"""
+
+    @pytest.fixture(autouse=True)
+    def slow_judge(self, pytester):
+        pytester.makeconftest(SLOW_JUDGE_CONFTEST)
+
+    def test_assertions_overlap(self, pytester):
+        """Test that a test making several assertions waits only for the slowest judgement"""
+        pytester.makepyfile("""
+            import time
+
+            def test_three_assertions(assert_behavioral_match):
+                start = time.perf_counter()
+                assert_behavioral_match("Hello Alice", "A greeting")
+                assert_behavioral_match("Hello Bob", "A greeting")
+                assert_behavioral_match("Hello Carol", "A greeting")
+                assert time.perf_counter() - start < 0.2
+        """)
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-deferred", "--durations=1", "-vv")
+
+        result.assert_outcomes(passed=1)
+        durations = [line for line in result.outlines if "call" in line and "test_three_assertions" in line]
+        assert float(durations[0].split("s")[0]) < 0.8
+
+    def test_failure_is_reported_on_the_test(self, pytester):
+        """Test that a failing deferred judgement fails its own test with BehavioralAssertionError"""
+        pytester.makepyfile("""
+            def test_fails(assert_behavioral_match):
+                assert_behavioral_match("Goodbye", "A greeting")
+
+            def test_passes(assert_behavioral_match):
+                assert_behavioral_match("Hello", "A greeting")
+        """)
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-deferred")
+
+        result.assert_outcomes(passed=1, failed=1)
+        result.stdout.fnmatch_lines([
+            "*BehavioralAssertionError*Output is not a greeting*",
+            "FAILED *test_fails*"
+        ])
+
+    def test_multiple_failures_are_aggregated(self, pytester):
+        """Test that several failing judgements in one test are reported together"""
+        pytester.makepyfile("""
+            def test_fails_twice(assert_behavioral_match):
+                assert_behavioral_match("Goodbye", "A greeting")
+                assert_behavioral_match("Hello", "A greeting")
+                assert_behavioral_match("See you", "A greeting")
+        """)
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-deferred")
+
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(["*2 of 3 deferred behavioral assertions failed*[0]*[2]*"])
+
+    def test_invalid_input_fails_immediately(self, pytester):
+        """Test that input validation still happens synchronously"""
+        pytester.makepyfile("""
+            import pytest
+            from llm_app_test.exceptions.test_exceptions import InvalidPromptError
+
+            def test_invalid(assert_behavioral_match):
+                with pytest.raises(InvalidPromptError):
+                    assert_behavioral_match(None, "A greeting")
+        """)
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-deferred")
+
+        result.assert_outcomes(passed=1)
+
+    def test_disabled_by_default(self, pytester):
+        """Test that assertions are synchronous unless --llm-deferred is passed"""
+        pytester.makepyfile("""
+            import pytest
+            from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError
+
+            def test_sync(assert_behavioral_match):
+                with pytest.raises(BehavioralAssertionError):
+                    assert_behavioral_match("Goodbye", "A greeting")
+        """)
+
+        result = pytester.runpytest("-p", "no:cacheprovider")
+
+        result.assert_outcomes(passed=1)
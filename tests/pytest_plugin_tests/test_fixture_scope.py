@@ -0,0 +1,81 @@
+import pytest
+
+pytest_plugins = "pytester"
+
+SCOPE_PROBE_TESTS = """
+seen = {}
+
+
+def test_first(behavioral_assert, assert_behavioral_match):
+    seen["first"] = (id(behavioral_assert), id(behavioral_assert.llm), id(assert_behavioral_match.__self__))
+
+
+def test_second(behavioral_assert, assert_behavioral_match, shared_behavioral_assert):
+    seen["second"] = (id(behavioral_assert), id(behavioral_assert.llm), id(assert_behavioral_match.__self__))
+    seen["shared"] = id(shared_behavioral_assert)
+
+
+def test_report():
+    print("SAME_ASSERTER=%s" % (seen["first"][0] == seen["second"][0]))
+    print("SAME_CLIENT=%s" % (seen["first"][1] == seen["second"][1]))
+    print("MATCH_BOUND_TO_ASSERTER=%s" % (seen["second"][2] == seen["second"][0]))
+    print("USES_SHARED=%s" % (seen["second"][0] == seen["shared"]))
+"""
+
+
+class TestFixtureScope:
+    """Test suite for the configurable asserter fixture scope"""
+
+    @pytest.fixture(autouse=True)
+    def api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+
+    def test_default_scope_is_function(self, pytester):
+        """Test that each test gets a fresh asserter by default"""
+        pytester.makepyfile(SCOPE_PROBE_TESTS)
+
+        result = pytester.runpytest("-s", "-p", "no:cacheprovider")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines(["*SAME_ASSERTER=False*", "*MATCH_BOUND_TO_ASSERTER=True*", "*USES_SHARED=False*"])
+
+    def test_session_scope_from_ini(self, pytester):
+        """Test that the ini option shares one asserter, client and rate limiter across the run"""
+        pytester.makeini("[pytest]\nllm_app_test_fixture_scope = session\n")
+        pytester.makepyfile(SCOPE_PROBE_TESTS)
+
+        result = pytester.runpytest("-s", "-p", "no:cacheprovider")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines([
+            "*SAME_ASSERTER=True*", "*SAME_CLIENT=True*", "*MATCH_BOUND_TO_ASSERTER=True*", "*USES_SHARED=True*"
+        ])
+
+    def test_command_line_overrides_ini(self, pytester):
+        """Test that --llm-fixture-scope takes priority over the ini option"""
+        pytester.makeini("[pytest]\nllm_app_test_fixture_scope = session\n")
+        pytester.makepyfile(SCOPE_PROBE_TESTS)
+
+        result = pytester.runpytest("-s", "-p", "no:cacheprovider", "--llm-fixture-scope", "function")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines(["*SAME_ASSERTER=False*"])
+
+    def test_module_scope(self, pytester):
+        """Test that module scope shares one asserter within a module"""
+        pytester.makepyfile(SCOPE_PROBE_TESTS)
+
+        result = pytester.runpytest("-s", "-p", "no:cacheprovider", "--llm-fixture-scope", "module")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines(["*SAME_ASSERTER=True*", "*USES_SHARED=False*"])
+
+    def test_invalid_ini_scope(self, pytester):
+        """Test that an unknown scope in the ini file is reported as a usage error"""
+        pytester.makeini("[pytest]\nllm_app_test_fixture_scope = forever\n")
+        pytester.makepyfile(SCOPE_PROBE_TESTS)
+
+        result = pytester.runpytest("-p", "no:cacheprovider")
+
+        assert result.ret != 0
+        result.stdout.fnmatch_lines(["*Invalid llm_app_test_fixture_scope: forever*"])
@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Importing the plugin happens on every pytest run, so it must not drag in LangChain's
+# provider integrations or the provider SDKs. The budget is deliberately loose to stay
+# stable on slow CI machines while still catching an eager provider import (~3s).
+PLUGIN_IMPORT_BUDGET_SECONDS = 1.0
+
+PROVIDER_MODULES = ("openai", "anthropic", "langchain_openai", "langchain_anthropic", "langchain.schema")
+
+_MEASURE_PLUGIN_IMPORT = """
+import json, sys, time
+import pytest
+start = time.perf_counter()
+import llm_app_test.pytest_plugin.plugin
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": [m for m in %r if m in sys.modules]}))
+""" % (PROVIDER_MODULES,)
+
+_MEASURE_ASSERTER_IMPORT = """
+import json, sys
+import llm_app_test.behavioral_assert.behavioral_assert
+print(json.dumps({"modules": [m for m in %r if m in sys.modules]}))
+""" % (PROVIDER_MODULES,)
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestPluginImportTime:
+
+    def test_plugin_import_does_not_load_providers(self):
+        assert _run(_MEASURE_PLUGIN_IMPORT)["modules"] == []
+
+    def test_asserter_import_does_not_load_providers(self):
+        assert _run(_MEASURE_ASSERTER_IMPORT)["modules"] == []
+
+    def test_plugin_import_within_budget(self):
+        # best of three, to keep a single slow start from failing the run
+        elapsed = min(_run(_MEASURE_PLUGIN_IMPORT)["elapsed"] for _ in range(3))
+
+        assert elapsed < PLUGIN_IMPORT_BUDGET_SECONDS, (
+            f"Importing the pytest plugin took {elapsed:.3f}s, budget is {PLUGIN_IMPORT_BUDGET_SECONDS}s"
+        )
+
+    def test_provider_class_loaded_on_first_use(self):
+        from llm_app_test.behavioral_assert.llm_config import llm_factory
+        from langchain_openai import ChatOpenAI
+
+        assert llm_factory.ChatOpenAI is ChatOpenAI
+
+    def test_unknown_factory_attribute(self):
+        from llm_app_test.behavioral_assert.llm_config import llm_factory
+
+        with pytest.raises(AttributeError):
+            getattr(llm_factory, "ChatUnknown")
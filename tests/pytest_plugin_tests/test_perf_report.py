@@ -0,0 +1,139 @@
+from llm_app_test.metrics.assertion_metrics import AssertionMetrics
+from llm_app_test.metrics.cost_estimate import estimate_cost_usd
+
+pytest_plugins = "pytester"
+
+JUDGE_CONFTEST = """
+import pytest
+
+from tests.fake_judge import CACHED_USAGE, GREETING_VERDICTS, FakeJudge, asserter_with
+
+
+@pytest.fixture
+def behavioral_assert():
+    return asserter_with(FakeJudge(answers=GREETING_VERDICTS, usage=CACHED_USAGE))
+"""
+
+TESTS = """
+import pytest
+
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError
+
+
+def test_greeting(assert_behavioral_match):
+    assert_behavioral_match("Hello there", "A greeting")
+
+
+def test_farewell(assert_behavioral_match):
+    with pytest.raises(BehavioralAssertionError):
+        assert_behavioral_match("Goodbye", "A farewell that is not a greeting")
+
+
+def test_no_assertions():
+    pass
+"""
+
+PRICED_TEST = """
+from llm_app_test.metrics.assertion_metrics import AssertionMetrics
+from llm_app_test.metrics.metrics_registry import get_shared_metrics_registry
+
+
+def test_priced():
+    get_shared_metrics_registry().record(AssertionMetrics(
+        method="assert_behavioral_match", test_id="test_priced.py::test_priced", expected_behavior="A greeting",
+        model="gpt-4o", passed=True, error=None, wall_seconds=0.5, rate_limiter_wait_seconds=0.25, retries=1,
+        requests=2, input_tokens=1_000_000, output_tokens=100_000, cached_input_tokens=0, verdict_cache_hit=False
+    ))
+"""
+
+
+def metrics(model, input_tokens=0, output_tokens=0, cached_input_tokens=0):
+    return AssertionMetrics(
+        method="assert_behavioral_match", test_id=None, expected_behavior="A greeting", model=model, passed=True,
+        error=None, wall_seconds=0.1, rate_limiter_wait_seconds=0.0, retries=0, requests=1,
+        input_tokens=input_tokens, output_tokens=output_tokens, cached_input_tokens=cached_input_tokens,
+        verdict_cache_hit=False
+    )
+
+
+class TestEstimateCost:
+
+    def test_cached_input_charged_at_cached_price(self):
+        cost = estimate_cost_usd(metrics("gpt-4o", input_tokens=1_000_000, output_tokens=1_000_000,
+                                         cached_input_tokens=400_000))
+
+        assert cost == 0.6 * 2.50 + 0.4 * 1.25 + 10.00
+
+    def test_unknown_model(self):
+        assert estimate_cost_usd(metrics("my-local-judge", input_tokens=10)) is None
+
+    def test_no_tokens_costs_nothing(self):
+        assert estimate_cost_usd(metrics(None)) == 0.0
+
+
+class TestPerfReport:
+    """Test suite for the --llm-perf-report terminal summary"""
+
+    def test_report_lists_assertions_and_totals(self, pytester):
+        pytester.makeconftest(JUDGE_CONFTEST)
+        pytester.makepyfile(TESTS)
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-perf-report")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.fnmatch_lines([
+            "*llm_app_test performance report*",
+            "slowest 2 behavioral assertions:",
+            "*stalled  test_report_lists_assertions_and_totals.py::test_*",
+            "*stalled  test_report_lists_assertions_and_totals.py::test_*",
+            "",
+            "judge wall time: *s of *s total test time (*%)",
+            "assertions: 2 (1 failed), judge requests: 2, retries: 0",
+            "tokens: 204 (200 input, 4 output, 120 input read from prompt cache, 60.0%)",
+            "estimated cost: $0.0000 (excludes unknown model, no known price)",
+            "verdict cache hit rate: 0.0% (0 of 2)",
+            "rate limiter stall time: 0.00s",
+        ])
+        result.stdout.fnmatch_lines(["*::test_farewell  A farewell that is not a greeting"])
+        result.stdout.fnmatch_lines(["*::test_greeting  A greeting"])
+
+    def test_report_limits_slowest_and_estimates_cost(self, pytester):
+        pytester.makeconftest(JUDGE_CONFTEST)
+        pytester.makepyfile(TESTS, test_priced=PRICED_TEST)
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-perf-report=1")
+
+        result.assert_outcomes(passed=4)
+        result.stdout.fnmatch_lines([
+            "slowest 1 behavioral assertions:",
+            "*0.50s   2 req  1 retry    0.25s stalled  test_priced.py::test_priced  A greeting",
+            "",
+            "judge wall time:*",
+            "assertions: 3 (1 failed), judge requests: 4, retries: 1",
+            "estimated cost: $3.5000 (excludes unknown model, no known price)",
+            "rate limiter stall time: 0.25s",
+        ])
+
+    def test_no_assertions_recorded(self, pytester):
+        pytester.makepyfile("def test_nothing():\n    pass\n")
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-perf-report")
+
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*llm_app_test performance report*", "no behavioral assertions were recorded"])
+
+    def test_report_off_by_default(self, pytester):
+        pytester.makeconftest(JUDGE_CONFTEST)
+        pytester.makepyfile(TESTS)
+
+        result = pytester.runpytest("-p", "no:cacheprovider")
+
+        result.assert_outcomes(passed=3)
+        result.stdout.no_fnmatch_line("*llm_app_test performance report*")
+
+    def test_negative_count_rejected(self, pytester):
+        pytester.makepyfile("def test_nothing():\n    pass\n")
+
+        result = pytester.runpytest("-p", "no:cacheprovider", "--llm-perf-report=-1")
+
+        result.stderr.fnmatch_lines(["*Invalid --llm-perf-report: -1*"])
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from langchain_core.language_models import BaseLanguageModel
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.exceptions.test_exceptions import (
+    BehavioralAssertionError,
+    InvalidPromptError,
+    LLMConnectionError
+)
+
+
+class TestBehavioralAssertionAsync:
+    """Test suite for aassert_behavioral_match"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock_llm = Mock(spec=BaseLanguageModel)
+        mock_llm.ainvoke = AsyncMock(return_value=Mock(content="PASS"))
+        return mock_llm
+
+    def test_pass_uses_ainvoke(self, mock_llm):
+        """Test that a passing judgement awaits ainvoke and never blocks on invoke"""
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        asyncio.run(asserter.aassert_behavioral_match("Hello Alice", "A greeting"))
+
+        mock_llm.ainvoke.assert_awaited_once()
+        mock_llm.invoke.assert_not_called()
+
+    def test_same_messages_as_sync(self, mock_llm):
+        """Test that the async path sends the same prompts as assert_behavioral_match"""
+        mock_llm.invoke.return_value = Mock(content="PASS")
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        asserter.assert_behavioral_match("Hello Alice", "A greeting")
+        asyncio.run(asserter.aassert_behavioral_match("Hello Alice", "A greeting"))
+
+        assert mock_llm.ainvoke.await_args.args[0] == mock_llm.invoke.call_args.args[0]
+
+    def test_fail_raises_behavioral_assertion_error(self, mock_llm):
+        """Test that a FAIL verdict raises BehavioralAssertionError with the reason"""
+        mock_llm.ainvoke.return_value = Mock(content="FAIL: Not a greeting")
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            asyncio.run(asserter.aassert_behavioral_match("Goodbye", "A greeting"))
+
+        assert excinfo.value.reason == "Not a greeting"
+
+    def test_invalid_input(self, mock_llm):
+        """Test that inputs are validated before calling the LLM"""
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        with pytest.raises(InvalidPromptError):
+            asyncio.run(asserter.aassert_behavioral_match(None, "A greeting"))
+
+        mock_llm.ainvoke.assert_not_awaited()
+
+    def test_generic_llm_error(self, mock_llm):
+        """Test that generic errors are wrapped the same way as in the sync API"""
+        mock_llm.ainvoke.side_effect = ValueError("Generic LLM error")
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        with pytest.raises(LLMConnectionError) as excinfo:
+            asyncio.run(asserter.aassert_behavioral_match("test", "test"))
+
+        assert "LLM operation failed in aassert_behavioral_match" in str(excinfo.value)
+        assert "Generic LLM error" in str(excinfo.value)
+
+    def test_judgements_overlap(self, mock_llm):
+        """Test that concurrent judgements run in parallel on one event loop"""
+        async def slow_pass(messages):
+            await asyncio.sleep(0.1)
+            return Mock(content="PASS")
+
+        mock_llm.ainvoke.side_effect = slow_pass
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        async def run_all():
+            await asyncio.gather(*(
+                asserter.aassert_behavioral_match(f"Hello {i}", "A greeting") for i in range(20)
+            ))
+
+        start = time.perf_counter()
+        asyncio.run(run_all())
+
+        assert time.perf_counter() - start < 1.0
+        assert mock_llm.ainvoke.await_count == 20
+
+    def test_uses_verdict_cache(self, mock_llm, tmp_path):
+        """Test that the async path shares the verdict cache with the sync path"""
+        mock_llm.invoke.return_value = Mock(content="PASS")
+        asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True,
+                                       verdict_cache_path=str(tmp_path / "verdicts.sqlite3"))
+
+        asserter.assert_behavioral_match("Hello Alice", "A greeting")
+        asyncio.run(asserter.aassert_behavioral_match("Hello Alice", "A greeting"))
+
+        mock_llm.ainvoke.assert_not_awaited()
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.exceptions.test_exceptions import (
+    BehavioralAssertionError,
+    InvalidPromptError,
+    LLMConfigurationError,
+    LLMConnectionError
+)
+
+
+def judge_by_keyword(messages):
+    """Fake judge that passes any output containing 'hello'"""
+    if "hello" in messages[1].content.lower():
+        return AIMessage(content="PASS")
+    return AIMessage(content="FAIL: Output is not a greeting")
+
+
+class TestBehavioralAssertionBatch:
+    """Test suite for assert_behavioral_matches"""
+
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def asserter(self, calls):
+        def recording_judge(messages):
+            calls.append(messages)
+            return judge_by_keyword(messages)
+
+        return BehavioralAssertion(llm=RunnableLambda(recording_judge))
+
+    def test_all_pass_returns_verdicts(self, asserter, calls):
+        """Test that passing pairs return one verdict each, in order"""
+        pairs = [(f"Hello {name}", "A greeting") for name in ("Alice", "Bob", "Carol")]
+
+        verdicts = asserter.assert_behavioral_matches(pairs)
+
+        assert verdicts == [Verdict(passed=True)] * 3
+        assert len(calls) == 3
+
+    def test_failures_are_aggregated(self, asserter, calls):
+        """Test that every verdict is gathered before one error lists every failing index"""
+        pairs = [
+            ("Hello Alice", "A greeting"),
+            ("Goodbye Bob", "A greeting"),
+            ("Hello Carol", "A greeting"),
+            ("See you later", "A greeting")
+        ]
+
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            asserter.assert_behavioral_matches(pairs)
+
+        assert len(calls) == 4
+        assert "2 of 4 behavioral assertions failed" in str(excinfo.value)
+        assert excinfo.value.details["failures"] == {
+            1: "Output is not a greeting",
+            3: "Output is not a greeting"
+        }
+        assert "[1]" in excinfo.value.reason and "[3]" in excinfo.value.reason
+
+    def test_max_concurrency_is_respected(self):
+        """Test that no more than max_concurrency judgements are in flight at once"""
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def slow_judge(messages):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return AIMessage(content="PASS")
+
+        asserter = BehavioralAssertion(llm=RunnableLambda(slow_judge))
+
+        asserter.assert_behavioral_matches([(f"Hello {i}", "A greeting") for i in range(12)], max_concurrency=3)
+
+        assert 1 < peak[0] <= 3
+
+    def test_cached_pairs_are_not_resent(self, calls, tmp_path):
+        """Test that only verdict cache misses are sent to the LLM"""
+        def recording_judge(messages):
+            calls.append(messages)
+            return judge_by_keyword(messages)
+
+        asserter = BehavioralAssertion(llm=RunnableLambda(recording_judge), use_verdict_cache=True,
+                                       verdict_cache_path=str(tmp_path / "verdicts.sqlite3"))
+
+        asserter.assert_behavioral_match("Hello Alice", "A greeting")
+        asserter.assert_behavioral_matches([("Hello Alice", "A greeting"), ("Hello Bob", "A greeting")])
+
+        assert len(calls) == 2
+
+    def test_llm_error_is_wrapped(self):
+        """Test that LLM errors are surfaced as LLMConnectionError"""
+        def failing_judge(messages):
+            raise ValueError("Generic LLM error")
+
+        asserter = BehavioralAssertion(llm=RunnableLambda(failing_judge))
+
+        with pytest.raises(LLMConnectionError) as excinfo:
+            asserter.assert_behavioral_matches([("Hello", "A greeting")])
+
+        assert "1 of 1 judge requests failed" in str(excinfo.value)
+        assert excinfo.value.details["errors"] == {0: "ValueError: Generic LLM error"}
+
+    def test_llm_errors_are_aggregated_with_failures(self):
+        """Test that an LLM error does not discard the behavioral failures gathered for other pairs"""
+        def flaky_judge(messages):
+            if "Alice" in messages[1].content:
+                raise ValueError("Generic LLM error")
+            return judge_by_keyword(messages)
+
+        asserter = BehavioralAssertion(llm=RunnableLambda(flaky_judge))
+        pairs = [("Hello Alice", "A greeting"), ("Goodbye Bob", "A greeting"), ("Hello Carol", "A greeting")]
+
+        with pytest.raises(LLMConnectionError) as excinfo:
+            asserter.assert_behavioral_matches(pairs)
+
+        assert "1 of 3 judge requests failed and 1 behavioral assertions failed" in str(excinfo.value)
+        assert excinfo.value.details == {
+            "errors": {0: "ValueError: Generic LLM error"},
+            "failures": {1: "Output is not a greeting"}
+        }
+        assert excinfo.value.reason == "[0] ValueError: Generic LLM error; [1] Output is not a greeting"
+        assert isinstance(excinfo.value.__cause__, ValueError)
+
+    def test_async_batch(self, asserter, calls):
+        """Test that aassert_behavioral_matches aggregates failures the same way"""
+        pairs = [("Hello Alice", "A greeting"), ("Goodbye Bob", "A greeting")]
+
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            asyncio.run(asserter.aassert_behavioral_matches(pairs, max_concurrency=2))
+
+        assert excinfo.value.details["failures"] == {1: "Output is not a greeting"}
+        assert len(calls) == 2
+
+    def test_generator_pairs_are_judged(self, asserter, calls):
+        """Test that pairs given as a generator are judged, not consumed by validation"""
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            asserter.assert_behavioral_matches((actual, "A greeting") for actual in ["Goodbye", "Hello"])
+
+        assert excinfo.value.details["failures"] == {0: "Output is not a greeting"}
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("pairs", [None, "Hello", [("Hello",)], [("Hello", None)]])
+    def test_invalid_pairs(self, asserter, pairs):
+        """Test that malformed pairs are rejected before any judgement"""
+        with pytest.raises(InvalidPromptError):
+            asserter.assert_behavioral_matches(pairs)
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1, "abc", 1.5, True])
+    def test_invalid_max_concurrency(self, asserter, max_concurrency):
+        """Test that invalid concurrency limits are rejected"""
+        with pytest.raises(LLMConfigurationError):
+            asserter.assert_behavioral_matches([("Hello", "A greeting")], max_concurrency=max_concurrency)
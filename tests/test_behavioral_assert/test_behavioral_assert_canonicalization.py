@@ -0,0 +1,89 @@
+import pytest
+
+from llm_app_test.canonicalization.text_canonicalizer import canonicalize_text
+from llm_app_test.exceptions.test_exceptions import LocalCheckError
+from llm_app_test.local_checks.regex_check import MatchesRegex
+from tests.fake_judge import FakeJudge, asserter_with
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    monkeypatch.delenv('ASSERTER_CANONICALIZE_INPUTS', raising=False)
+
+
+class TestCanonicalizeText:
+
+    def test_triple_quoted_indentation_removed(self):
+        text = """Dear customer,
+            Thank you for your order.
+
+            Regards"""
+
+        assert canonicalize_text(text) == "Dear customer,\nThank you for your order.\n\nRegards"
+
+    def test_relative_indentation_kept(self):
+        text = """
+            Steps:
+              - first
+              - second
+        """
+
+        assert canonicalize_text(text) == "Steps:\n  - first\n  - second"
+
+    def test_whitespace_runs_collapsed(self):
+        assert canonicalize_text("a  \t b   \n\n\n\nc  ") == "a b\n\nc"
+
+    def test_line_endings_normalized(self):
+        assert canonicalize_text("one\r\ntwo\rthree") == "one\ntwo\nthree"
+
+    def test_unicode_normalized(self):
+        assert canonicalize_text("cafe\u0301\u00a0au\u200b lait\ufeff") == "caf\u00e9 au lait"
+
+
+class TestCanonicalizeInputs:
+
+    def test_disabled_by_default(self):
+        asserter = asserter_with()
+
+        asserter.assert_behavioral_match("Hello   there", "A greeting")
+
+        assert "Hello   there" in asserter.llm.prompts[0]
+
+    def test_prompt_receives_canonical_inputs(self):
+        asserter = asserter_with(canonicalize_inputs=True)
+
+        asserter.assert_behavioral_match("""Hello
+                there""", "A   greeting")
+
+        assert "Expected Behavior: A greeting" in asserter.llm.prompts[0]
+        assert "Actual Output: Hello\nthere" in asserter.llm.prompts[0]
+
+    def test_cosmetic_changes_hit_cache(self):
+        asserter = asserter_with(canonicalize_inputs=True, use_in_memory_verdict_cache=True)
+        asserter.in_memory_verdict_cache.clear()
+
+        asserter.assert_behavioral_match("Hello there", "A greeting")
+        asserter.assert_behavioral_matches([("""
+            Hello   there
+        """, "A greeting\r\n")])
+
+        assert len(asserter.llm.prompts) == 1
+
+    def test_multi_criteria_inputs(self):
+        asserter = asserter_with(FakeJudge(answers="1. PASS\n2. PASS"), canonicalize_inputs=True)
+
+        asserter.assert_behavioral_match_all("Hi  there", ["A  greeting", "Polite"])
+
+        assert "1. A greeting" in asserter.llm.prompts[0]
+        assert "Actual Output: Hi there" in asserter.llm.prompts[0]
+
+    def test_local_checks_see_original(self):
+        asserter = asserter_with(canonicalize_inputs=True)
+
+        with pytest.raises(LocalCheckError):
+            asserter.assert_behavioral_match("Hello   there", "A greeting", local_checks=MatchesRegex(r"Hello there"))
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_CANONICALIZE_INPUTS', 'true')
+
+        assert asserter_with().canonicalize_inputs is True
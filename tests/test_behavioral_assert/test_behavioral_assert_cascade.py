@@ -0,0 +1,177 @@
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, LLMConfigurationError, LLMConnectionError
+from llm_app_test.model_cascade.cascade_stats import CascadeStats
+from tests.fake_judge import FakeJudge, asserter_with
+
+OPENAI_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ('USE_MODEL_CASCADE', 'CASCADE_MODEL', 'CASCADE_CONFIDENCE_THRESHOLD', 'LLM_PROVIDER', 'LLM_MODEL',
+                 'USE_VERDICT_CONFIDENCE', 'ASSERTER_CONFIDENCE_THRESHOLD', 'ASSERTER_VERDICT_MODE'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+
+
+def cascade_asserter(fast_answers, strong_answers, **kwargs):
+    asserter = asserter_with(FakeJudge(answers=strong_answers), replace_llm=True, use_model_cascade=True, **kwargs)
+    asserter.model_cascade.llm = FakeJudge(answers=fast_answers)
+    return asserter
+
+
+class TestModelCascade:
+
+    def test_fast_pass_is_not_escalated(self):
+        asserter = cascade_asserter({"Hello": ("PASS", 0.99)}, {"Hello": ("PASS", 0.99)})
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert asserter.llm.calls == 0
+        assert asserter.model_cascade.stats == CascadeStats(
+            judgements=1, escalations_on_fail=0, escalations_on_low_confidence=0, escalations_on_error=0)
+
+    def test_fast_fail_escalates_to_strong_judge(self):
+        asserter = cascade_asserter({"Howdy": ("FAIL: not sure", 0.99)}, {"Howdy": ("PASS", 0.99)})
+
+        assert asserter.assert_behavioral_match("Howdy", "A greeting") == Verdict(passed=True)
+
+        assert asserter.llm.calls == 1
+        assert asserter.model_cascade.stats.escalations_on_fail == 1
+
+    def test_strong_fail_is_reported(self):
+        asserter = cascade_asserter({"Bye": ("FAIL: fast", 0.99)}, {"Bye": ("FAIL: a farewell", 0.99)})
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asyncio.run(asserter.aassert_behavioral_match("Bye", "A greeting"))
+
+        assert exc_info.value.reason == "a farewell"
+
+    def test_low_confidence_pass_escalates(self):
+        asserter = cascade_asserter({"Hey": ("PASS", 0.6)}, {"Hey": ("PASS", 0.99)}, cascade_confidence_threshold=0.9)
+
+        asserter.assert_behavioral_match("Hey", "A greeting")
+
+        assert asserter.llm.calls == 1
+        assert asserter.model_cascade.stats.escalations_on_low_confidence == 1
+
+    @pytest.mark.parametrize("error", [
+        openai.APIConnectionError(request=OPENAI_REQUEST),
+        openai.RateLimitError("slow down", response=httpx.Response(429, request=OPENAI_REQUEST), body=None),
+        openai.InternalServerError("overloaded", response=httpx.Response(503, request=OPENAI_REQUEST), body=None),
+        TimeoutError("timed out")
+    ])
+    def test_transient_fast_error_escalates(self, error):
+        asserter = cascade_asserter({"Hi": error}, {"Hi": ("PASS", 0.99)})
+
+        asserter.assert_behavioral_match("Hi", "A greeting")
+
+        assert asserter.llm.calls == 1
+        assert asserter.model_cascade.stats == CascadeStats(
+            judgements=1, escalations_on_fail=0, escalations_on_low_confidence=0, escalations_on_error=1)
+
+    @pytest.mark.parametrize("error", [
+        openai.AuthenticationError("bad key", response=httpx.Response(401, request=OPENAI_REQUEST), body=None),
+        TypeError("unexpected keyword argument 'logprobs'")
+    ])
+    def test_other_fast_errors_are_raised(self, error):
+        asserter = cascade_asserter({"Hi": error}, {"Hi": ("PASS", 0.99)})
+
+        with pytest.raises(LLMConnectionError) as exc_info:
+            asyncio.run(asserter.aassert_behavioral_match("Hi", "A greeting"))
+
+        assert exc_info.value.__cause__ is error
+        assert asserter.llm.calls == 0
+        assert asserter.model_cascade.stats.judgements == 0
+
+    def test_batch_raises_other_fast_errors(self):
+        asserter = cascade_asserter({"one": ("PASS", 0.99), "two": ValueError("parser bug")}, {})
+
+        with pytest.raises(LLMConnectionError) as exc_info:
+            asserter.assert_behavioral_matches([("one", "A number"), ("two", "A number")])
+
+        assert isinstance(exc_info.value.__cause__, ValueError)
+        assert asserter.llm.calls == 0
+
+    def test_batch_escalates_only_untrusted_verdicts(self):
+        asserter = cascade_asserter(
+            {"one": ("PASS", 0.99), "two": ("FAIL: hmm", 0.99), "three": ("PASS", 0.5), "four": ("PASS", 0.95)},
+            {"two": ("PASS", 0.99), "three": ("PASS", 0.99)},
+            cascade_confidence_threshold=0.9
+        )
+
+        verdicts = asserter.assert_behavioral_matches([(key, "A number") for key in ("one", "two", "three", "four")])
+
+        assert all(verdict.passed for verdict in verdicts)
+        assert asserter.llm.calls == 2
+        stats = asserter.model_cascade.stats
+        assert (stats.judgements, stats.escalations) == (4, 2)
+        assert stats.escalation_rate == 0.5
+
+    def test_reset_stats(self):
+        asserter = cascade_asserter({"Hello": ("PASS", 0.99)}, {})
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        asserter.model_cascade.reset_stats()
+
+        assert asserter.model_cascade.stats.judgements == 0
+        assert asserter.model_cascade.stats.escalation_rate == 0.0
+
+
+class TestModelCascadeConfiguration:
+
+    def test_disabled_by_default(self):
+        assert BehavioralAssertion().model_cascade is None
+
+    def test_default_fast_models(self):
+        openai = BehavioralAssertion(use_model_cascade=True)
+        anthropic = BehavioralAssertion(provider="anthropic", use_model_cascade=True)
+
+        assert openai.model_cascade.llm.model_name == "gpt-4o-mini"
+        assert anthropic.model_cascade.llm.model == "claude-3-5-haiku-latest"
+        assert openai.model_cascade.request_logprobs is False
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv('USE_MODEL_CASCADE', 'true')
+        monkeypatch.setenv('CASCADE_MODEL', 'gpt-4o-mini')
+        monkeypatch.setenv('CASCADE_CONFIDENCE_THRESHOLD', '0.8')
+
+        asserter = BehavioralAssertion()
+
+        assert asserter.model_cascade.confidence_threshold == 0.8
+        assert asserter.model_cascade.request_logprobs is True
+
+    def test_cascade_with_retry(self):
+        asserter = BehavioralAssertion(use_model_cascade=True, langchain_with_retry=True)
+
+        assert asserter.model_cascade.llm.bound.model_name == "gpt-4o-mini"
+
+    def test_cascade_changes_cache_key(self):
+        plain = BehavioralAssertion()
+        cascaded = BehavioralAssertion(use_model_cascade=True)
+
+        assert "cascade" not in plain._llm_description
+        assert cascaded._llm_description["cascade"] == {"model": "gpt-4o-mini", "confidence_threshold": 0.0}
+
+    def test_ignored_with_custom_llm(self):
+        asserter = asserter_with(use_model_cascade=True)
+
+        assert asserter.model_cascade is None
+
+    @pytest.mark.parametrize("kwargs", [
+        {"cascade_model": "gpt-4o"},
+        {"cascade_model": "claude-3-5-haiku-latest"},
+        {"cascade_confidence_threshold": 1.5},
+        {"provider": "anthropic", "cascade_confidence_threshold": 0.5}
+    ])
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(LLMConfigurationError):
+            BehavioralAssertion(use_model_cascade=True, **kwargs)
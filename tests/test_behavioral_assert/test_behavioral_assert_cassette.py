@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.cassette.cassette import Cassette
+from llm_app_test.cassette.cassette_mode_enum import CassetteMode
+from llm_app_test.exceptions.test_exceptions import (
+    BehavioralAssertionError,
+    CassetteError,
+    CassetteMissError,
+    LLMConfigurationError
+)
+from tests.fake_judge import GREETING_VERDICTS, FakeJudge, asserter_with
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ('ASSERTER_CASSETTE_MODE', 'ASSERTER_CASSETTE_PATH', 'OPENAI_API_KEY', 'ASSERTER_VERDICT_MODE'):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    return str(tmp_path / "cassette.jsonl")
+
+
+def cassette_asserter(mode, path, **kwargs):
+    judge = FakeJudge(answers=GREETING_VERDICTS)
+    return asserter_with(judge, cassette_mode=mode, cassette_path=path, **kwargs), judge
+
+
+class TestCassette:
+
+    def test_keys_cover_messages_and_call_options(self):
+        judge = FakeJudge()
+        messages = [HumanMessage(content="Hello")]
+
+        assert Cassette.key(messages, judge) == Cassette.key([HumanMessage(content="Hello")], judge)
+        assert Cassette.key(messages, judge) != Cassette.key([HumanMessage(content="Hi")], judge)
+        assert Cassette.key(messages, judge) != Cassette.key(messages, judge.bind(max_tokens=5))
+
+    def test_record_appends_new_entries_only(self, cassette_path):
+        cassette = Cassette(cassette_path, CassetteMode.RECORD)
+        messages = [HumanMessage(content="Hello")]
+
+        cassette.record(messages, FakeJudge(), AIMessage(content="PASS"))
+        cassette.record(messages, FakeJudge(), AIMessage(content="PASS"))
+
+        assert len(open(cassette_path).read().splitlines()) == 1
+        assert Cassette(cassette_path, CassetteMode.REPLAY).replay(messages, FakeJudge()).content == "PASS"
+
+    def test_missing_cassette_in_replay(self, cassette_path):
+        with pytest.raises(CassetteError):
+            Cassette(cassette_path, CassetteMode.REPLAY)
+
+    def test_corrupt_cassette(self, cassette_path):
+        with open(cassette_path, "w") as cassette_file:
+            cassette_file.write("not json\n")
+
+        with pytest.raises(CassetteError):
+            Cassette(cassette_path, CassetteMode.RECORD)
+
+
+class TestCassetteAssertions:
+
+    def test_replay_without_calling_the_judge(self, cassette_path):
+        recorder, _ = cassette_asserter("record", cassette_path)
+        recorder.assert_behavioral_match("Hello", "A greeting")
+        recorder.assert_behavioral_matches([("Hello there", "A greeting"), ("Hello again", "A greeting")])
+
+        player, judge = cassette_asserter("replay", cassette_path)
+        player.assert_behavioral_match("Hello", "A greeting")
+        asyncio.run(player.aassert_behavioral_matches([("Hello there", "A greeting"), ("Hello again", "A greeting")]))
+
+        assert judge.calls == 0
+
+    def test_replayed_failure_and_confidence(self, cassette_path, monkeypatch):
+        monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+        recorder = asserter_with(FakeJudge(answers=GREETING_VERDICTS), replace_llm=True, use_verdict_confidence=True,
+                                 cassette_mode="record", cassette_path=cassette_path)
+        with pytest.raises(BehavioralAssertionError):
+            recorder.assert_behavioral_match("Goodbye", "A greeting")
+
+        player = asserter_with(FakeJudge(answers=GREETING_VERDICTS), replace_llm=True, use_verdict_confidence=True,
+                               cassette_mode="replay", cassette_path=cassette_path)
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            player.assert_behavioral_match("Goodbye", "A greeting")
+
+        assert exc_info.value.reason == "not a greeting"
+        assert exc_info.value.details["confidence"] == pytest.approx(0.9)
+
+    def test_streaming_replay(self, cassette_path):
+        recorder, _ = cassette_asserter("record", cassette_path, verdict_mode="streaming")
+        recorder.assert_behavioral_match("Hello", "A greeting")
+
+        player, judge = cassette_asserter("replay", cassette_path, verdict_mode="streaming")
+
+        assert player.assert_behavioral_match("Hello", "A greeting").passed
+        assert judge.calls == 0
+
+    def test_replay_miss_fails_fast(self, cassette_path):
+        recorder, _ = cassette_asserter("record", cassette_path)
+        recorder.assert_behavioral_match("Hello", "A greeting")
+        player, judge = cassette_asserter("replay", cassette_path)
+
+        with pytest.raises(CassetteMissError) as exc_info:
+            player.assert_behavioral_matches([("Hello", "A greeting"), ("Hello, world", "A greeting")])
+
+        assert exc_info.value.details["cassette"] == cassette_path
+        assert judge.calls == 0
+
+    def test_replay_needs_no_api_key(self, cassette_path, monkeypatch):
+        open(cassette_path, "w").close()
+        monkeypatch.setenv('ASSERTER_CASSETTE_MODE', 'replay')
+        monkeypatch.setenv('ASSERTER_CASSETTE_PATH', cassette_path)
+
+        asserter = BehavioralAssertion()
+
+        assert asserter.cassette.replaying
+        with pytest.raises(CassetteMissError):
+            asserter.assert_behavioral_match("Hello", "A greeting")
+
+    def test_disabled_by_default(self):
+        assert asserter_with().cassette is None
+
+    def test_invalid_mode(self, cassette_path):
+        with pytest.raises(LLMConfigurationError):
+            cassette_asserter("rewind", cassette_path)
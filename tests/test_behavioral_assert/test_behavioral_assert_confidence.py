@@ -0,0 +1,204 @@
+import asyncio
+import math
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_openai import ChatOpenAI
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.behavioral_assert.verdict.verdict_parser import VerdictParser
+from llm_app_test.exceptions.test_exceptions import (
+    BehavioralAssertionError,
+    LLMConfigurationError,
+    UncertainVerdictError
+)
+from tests.fake_judge import FakeJudge, asserter_with
+
+
+def logprobs_metadata(*tokens):
+    return {"logprobs": {"content": [{"token": token, "logprob": logprob} for token, logprob in tokens]}}
+
+
+@pytest.fixture(autouse=True)
+def openai_env(monkeypatch):
+    for name in ('USE_VERDICT_CONFIDENCE', 'ASSERTER_CONFIDENCE_THRESHOLD', 'ASSERTER_VERDICT_MODE'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+
+
+class TestVerdictConfidenceParsing:
+
+    def test_confidence_from_first_non_whitespace_token(self):
+        metadata = logprobs_metadata(("\n", -3.0), ("PASS", math.log(0.9)))
+
+        assert VerdictParser.parse_confidence(metadata) == pytest.approx(0.9)
+
+    def test_no_logprobs(self):
+        assert VerdictParser.parse_confidence({}) is None
+        assert VerdictParser.parse_response(AIMessage(content="PASS")) == Verdict(passed=True)
+
+    def test_parse_response_attaches_confidence(self):
+        message = AIMessage(content="FAIL: off topic", response_metadata=logprobs_metadata(("FAIL", math.log(0.7))))
+
+        verdict = VerdictParser.parse_response(message)
+
+        assert verdict.passed is False
+        assert verdict.reason == "off topic"
+        assert verdict.confidence == pytest.approx(0.7)
+
+
+class TestVerdictConfidence:
+
+    def test_disabled_by_default(self):
+        asserter = asserter_with(FakeJudge(answers=("PASS", 0.99)), replace_llm=True)
+
+        verdict = asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert verdict == Verdict(passed=True)
+        assert "logprobs" not in asserter.llm.requests[0].kwargs
+
+    def test_pass_returns_confidence(self):
+        asserter = asserter_with(FakeJudge(answers=("PASS", 0.97)), replace_llm=True, use_verdict_confidence=True)
+
+        verdict = asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert asserter.llm.requests[0].kwargs["logprobs"] is True
+        assert verdict.passed is True
+        assert verdict.confidence == pytest.approx(0.97)
+
+    def test_fail_details_include_confidence(self):
+        asserter = asserter_with(FakeJudge(answers=("FAIL: a farewell", 0.88)), replace_llm=True,
+                                 use_verdict_confidence=True)
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_match("Goodbye", "A greeting")
+
+        assert not isinstance(exc_info.value, UncertainVerdictError)
+        assert exc_info.value.details["confidence"] == pytest.approx(0.88)
+
+    def test_low_confidence_pass_is_uncertain(self):
+        asserter = asserter_with(FakeJudge(answers=("PASS", 0.55)), replace_llm=True, confidence_threshold=0.8)
+
+        with pytest.raises(UncertainVerdictError) as exc_info:
+            asserter.assert_behavioral_match("Hi?", "A greeting")
+
+        assert exc_info.value.details["verdict"] == "PASS"
+        assert exc_info.value.details["confidence"] == pytest.approx(0.55)
+        assert exc_info.value.details["threshold"] == 0.8
+        assert "Uncertain PASS verdict" in str(exc_info.value)
+
+    def test_threshold_from_env(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_CONFIDENCE_THRESHOLD', '0.9')
+        asserter = asserter_with(FakeJudge(answers=("FAIL: not sure", 0.6)), replace_llm=True)
+
+        assert asserter.use_verdict_confidence is True
+        with pytest.raises(UncertainVerdictError):
+            asyncio.run(asserter.aassert_behavioral_match("Hmm", "A greeting"))
+
+    def test_uncertain_verdict_not_cached(self):
+        asserter = asserter_with(FakeJudge(answers=[("PASS", 0.5), ("PASS", 0.95)]), replace_llm=True,
+                                 confidence_threshold=0.8, use_in_memory_verdict_cache=True)
+        asserter.in_memory_verdict_cache.clear()
+
+        with pytest.raises(UncertainVerdictError):
+            asserter.assert_behavioral_match("Hey", "A greeting")
+
+        assert asserter.assert_behavioral_match("Hey", "A greeting").confidence == pytest.approx(0.95)
+        assert len(asserter.llm.requests) == 2
+
+    def test_cached_pass_without_confidence_not_reused(self, tmp_path):
+        cache_path = str(tmp_path / "verdicts.sqlite3")
+        asserter_with(FakeJudge(answers=("PASS", 0.99)), replace_llm=True, use_verdict_cache=True,
+                      verdict_cache_path=cache_path).assert_behavioral_match("Hey", "A greeting")
+        asserter = asserter_with(FakeJudge(answers=("PASS", 0.5)), replace_llm=True, confidence_threshold=0.9,
+                                 use_verdict_cache=True, verdict_cache_path=cache_path)
+
+        with pytest.raises(UncertainVerdictError):
+            asserter.assert_behavioral_match("Hey", "A greeting")
+
+        assert len(asserter.llm.requests) == 1
+
+    def test_cached_confidence_checked_against_threshold(self, tmp_path):
+        cache_path = str(tmp_path / "verdicts.sqlite3")
+        cached = asserter_with(FakeJudge(answers=("PASS", 0.8)), replace_llm=True, confidence_threshold=0.5,
+                               use_verdict_cache=True, verdict_cache_path=cache_path)
+        cached.assert_behavioral_match("Hey", "A greeting")
+        asserter = asserter_with(replace_llm=True, confidence_threshold=0.9, use_verdict_cache=True,
+                                 verdict_cache_path=cache_path)
+
+        with pytest.raises(UncertainVerdictError) as exc_info:
+            asserter.assert_behavioral_match("Hey", "A greeting")
+
+        assert exc_info.value.details["confidence"] == pytest.approx(0.8)
+        assert asserter.llm.requests == []
+
+    def test_batch_reports_uncertain_pairs(self):
+        asserter = asserter_with(FakeJudge(answers=[("PASS", 0.99), ("PASS", 0.51)]), replace_llm=True,
+                                 confidence_threshold=0.8)
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_matches([("Hello", "A greeting"), ("Hm", "A greeting")], max_concurrency=1)
+
+        assert list(exc_info.value.details["failures"]) == [1]
+        assert "Uncertain PASS verdict" in exc_info.value.details["failures"][1]
+
+    def test_two_phase_confidence_from_verdict_phase(self):
+        asserter = asserter_with(FakeJudge(answers=[("FAIL", 0.92), ("It is a farewell.", 1.0)]), replace_llm=True,
+                                 use_verdict_confidence=True, verdict_mode="two_phase")
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_match("Goodbye", "A greeting")
+
+        assert exc_info.value.reason == "It is a farewell."
+        assert exc_info.value.details["confidence"] == pytest.approx(0.92)
+
+
+class TestVerdictConfidenceConfiguration:
+
+    def test_anthropic_not_supported(self, monkeypatch):
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+
+        with pytest.raises(LLMConfigurationError):
+            BehavioralAssertion(provider="anthropic", use_verdict_confidence=True)
+
+    def test_injected_openai_model_supported(self):
+        llm = ChatOpenAI(api_key="test-key").with_retry()
+
+        asserter = BehavioralAssertion(llm=llm, use_verdict_confidence=True)
+
+        assert asserter.use_verdict_confidence is True
+
+    def test_injected_other_model_not_supported(self):
+        with pytest.raises(LLMConfigurationError):
+            asserter_with(confidence_threshold=0.5)
+
+    @pytest.mark.parametrize("threshold", [-0.1, 1.5, "high"])
+    def test_invalid_threshold(self, threshold):
+        with pytest.raises(LLMConfigurationError):
+            BehavioralAssertion(confidence_threshold=threshold)
+
+    def test_streaming_with_threshold_rejected(self):
+        with pytest.raises(LLMConfigurationError) as exc_info:
+            BehavioralAssertion(verdict_mode="streaming", confidence_threshold=0.9)
+
+        assert "streaming" in exc_info.value.reason
+
+    def test_streaming_with_threshold_from_env_rejected(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_VERDICT_MODE', 'streaming')
+        monkeypatch.setenv('ASSERTER_CONFIDENCE_THRESHOLD', '0.9')
+
+        with pytest.raises(LLMConfigurationError):
+            BehavioralAssertion()
+
+    def test_match_all_with_threshold_rejected(self):
+        asserter = asserter_with(FakeJudge(answers=("1. PASS\n2. PASS", 0.99)), replace_llm=True,
+                                 confidence_threshold=0.9)
+
+        with pytest.raises(LLMConfigurationError) as exc_info:
+            asserter.assert_behavioral_match_all("Hello Alice", ["A greeting", "Addresses Alice"])
+        with pytest.raises(LLMConfigurationError):
+            asyncio.run(asserter.aassert_behavioral_match_all("Hello Alice", ["A greeting", "Addresses Alice"]))
+
+        assert "assert_behavioral_match_all" in exc_info.value.reason
+        assert asserter.llm.requests == []
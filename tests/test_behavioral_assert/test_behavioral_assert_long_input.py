@@ -0,0 +1,208 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompt_configurator import AsserterPromptConfigurator
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.behavioral_assert.verdict.verdict_parser import VerdictParser
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, InvalidPromptError, LLMConfigurationError
+from llm_app_test.long_input.text_chunker import TextChunker
+from tests.fake_judge import FakeJudge, asserter_with
+
+PARAGRAPHS = [f"Paragraph {number} of the report." + " Some filler text." * 10 for number in range(1, 7)]
+REPORT = "\n\n".join(PARAGRAPHS)
+
+
+def excerpt_of(prompt):
+    return prompt.split("Excerpt of Actual Output: ")[1].split("\n\n    What does")[0]
+
+
+def excerpts(judge):
+    """The excerpts judge was asked to review"""
+    return [excerpt_of(prompt) for prompt in judge.prompts
+            if "Excerpt of Actual Output:" in prompt and "Excerpt Reviews:" not in prompt]
+
+
+def reviews(judge):
+    """The final requests judge received, carrying the excerpt reviews"""
+    return [prompt for prompt in judge.prompts if "Excerpt Reviews:" in prompt]
+
+
+def map_reduce_judge(final_answer="PASS"):
+    """Judge reviewing excerpts and answering the final request with final_answer"""
+    def answer(prompt):
+        if "Excerpt Reviews:" in prompt:
+            return final_answer
+        if "Excerpt of Actual Output:" not in prompt:
+            return "PASS"
+        return "FAIL: contradiction" if "CONTRADICTION" in excerpt_of(prompt) else "PASS: shows part of the report"
+    return FakeJudge(answers=answer)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ('ASSERTER_LONG_INPUT_THRESHOLD', 'ASSERTER_CHUNK_SIZE', 'ASSERTER_CHUNK_OVERLAP',
+                 'ASSERTER_MAX_CONCURRENCY', 'USE_MODEL_CASCADE', 'CASCADE_MODEL', 'ASSERTER_VERDICT_MODE',
+                 'LLM_PROVIDER', 'LLM_MODEL'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+
+
+def map_reduce_asserter(final_answer="PASS", **kwargs):
+    settings = {"long_input_threshold": 100, "chunk_size": 60, "chunk_overlap": 0, **kwargs}
+    return asserter_with(map_reduce_judge(final_answer), **settings)
+
+
+class TestTextChunker:
+
+    def test_splits_on_paragraphs(self):
+        chunks = TextChunker(chunk_size=60, chunk_overlap=0).split(REPORT)
+
+        assert chunks == PARAGRAPHS
+
+    def test_overlap_repeats_end_of_previous_chunk(self):
+        text = " ".join(f"word{number}" for number in range(200))
+
+        chunks = TextChunker(chunk_size=50, chunk_overlap=10).split(text)
+
+        assert len(chunks) > 1
+        assert chunks[1].split()[0] in chunks[0].split()
+
+
+class TestMapReduceJudging:
+
+    def test_short_input_sent_whole(self):
+        asserter = map_reduce_asserter()
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert excerpts(asserter.llm) == []
+        assert reviews(asserter.llm) == []
+
+    def test_long_input_reviews_every_chunk_then_reduces(self):
+        asserter = map_reduce_asserter()
+
+        assert asserter.assert_behavioral_match(REPORT, "A six paragraph report") == Verdict(passed=True)
+
+        assert len(excerpts(asserter.llm)) == len(asserter.text_chunker.split(REPORT)) > 1
+        assert len(reviews(asserter.llm)) == 1
+        assert "Excerpt 1: PASS: shows part of the report" in reviews(asserter.llm)[0]
+
+    def test_reduce_failure_is_reported(self):
+        asserter = map_reduce_asserter(final_answer="FAIL: excerpt 2 contradicts the spec")
+        report = REPORT.replace("Paragraph 2", "CONTRADICTION")
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asyncio.run(asserter.aassert_behavioral_match(report, "A six paragraph report"))
+
+        assert exc_info.value.reason == "excerpt 2 contradicts the spec"
+        assert "Excerpt 2: FAIL: contradiction" in reviews(asserter.llm)[0]
+
+    def test_only_changed_chunks_rejudged(self):
+        asserter = map_reduce_asserter(use_in_memory_verdict_cache=True)
+        asserter.in_memory_verdict_cache.clear()
+        asserter.assert_behavioral_match(REPORT, "A six paragraph report")
+        asserter.llm.requests.clear()
+
+        asserter.assert_behavioral_match(REPORT.replace("Paragraph 4 of", "Paragraph 4 in"), "A six paragraph report")
+
+        assert len(excerpts(asserter.llm)) == 1
+        assert "Paragraph 4 in" in excerpts(asserter.llm)[0]
+        assert len(reviews(asserter.llm)) == 1
+
+    def test_disabled_with_zero_threshold(self):
+        asserter = map_reduce_asserter(long_input_threshold=0)
+
+        asserter.assert_behavioral_match(REPORT, "A six paragraph report")
+
+        assert excerpts(asserter.llm) == []
+
+    def test_reduce_is_voted_on(self):
+        asserter = map_reduce_asserter()
+
+        verdict = asserter.assert_behavioral_match(REPORT, "A six paragraph report", votes=3)
+
+        assert verdict.votes == (2, 0)
+        assert len(reviews(asserter.llm)) == 2
+        assert len(excerpts(asserter.llm)) == len(asserter.text_chunker.split(REPORT))
+
+    def test_async_reduce_is_voted_on(self):
+        asserter = map_reduce_asserter(final_answer="FAIL: missing paragraph")
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asyncio.run(asserter.aassert_behavioral_match(REPORT, "A seven paragraph report", votes=3))
+
+        assert exc_info.value.details["votes"] == {"pass": 0, "fail": 2}
+        assert len(reviews(asserter.llm)) == 2
+
+    def test_reduce_goes_through_cascade(self):
+        asserter = asserter_with(map_reduce_judge(), replace_llm=True, use_model_cascade=True,
+                                 long_input_threshold=100, chunk_size=60, chunk_overlap=0)
+        asserter.model_cascade.llm = map_reduce_judge(final_answer="FAIL: unsure")
+
+        assert asserter.assert_behavioral_match(REPORT, "A six paragraph report") == Verdict(passed=True)
+
+        assert len(reviews(asserter.model_cascade.llm)) == 1
+        assert excerpts(asserter.model_cascade.llm) == []
+        assert len(reviews(asserter.llm)) == 1
+        assert asserter.model_cascade.stats.escalations_on_fail == 1
+
+    def test_two_phase_reduce_sent_as_standard_request(self):
+        asserter = map_reduce_asserter(final_answer="FAIL: missing paragraph", verdict_mode="two_phase")
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_match(REPORT, "A seven paragraph report")
+
+        assert exc_info.value.reason == "missing paragraph"
+        assert len(reviews(asserter.llm)) == 1
+
+    def test_chunk_review_keeps_pass_notes(self):
+        assert VerdictParser.parse_chunk_response(AIMessage(content="PASS: lists the totals")) == \
+            Verdict(passed=True, reason="lists the totals")
+        assert VerdictParser.parse_chunk_response(AIMessage(content="PASS")) == Verdict(passed=True)
+        assert VerdictParser.parse_chunk_response(AIMessage(content="FAIL: wrong total")) == \
+            Verdict(passed=False, reason="wrong total")
+
+
+class TestLongInputConfiguration:
+
+    def test_defaults(self):
+        asserter = BehavioralAssertion()
+
+        assert asserter.long_input_threshold == 0
+        assert (asserter.text_chunker.chunk_size, asserter.text_chunker.chunk_overlap) == (8000, 200)
+
+    def test_long_input_sent_whole_by_default(self):
+        asserter = asserter_with(map_reduce_judge())
+
+        asserter.assert_behavioral_match(REPORT * 200, "A six paragraph report")
+
+        assert excerpts(asserter.llm) == []
+        assert reviews(asserter.llm) == []
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_LONG_INPUT_THRESHOLD', '5000')
+        monkeypatch.setenv('ASSERTER_CHUNK_SIZE', '1000')
+        monkeypatch.setenv('ASSERTER_CHUNK_OVERLAP', '50')
+
+        asserter = BehavioralAssertion()
+
+        assert asserter.long_input_threshold == 5000
+        assert (asserter.text_chunker.chunk_size, asserter.text_chunker.chunk_overlap) == (1000, 50)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"long_input_threshold": -1},
+        {"chunk_size": 0},
+        {"chunk_size": 2.5},
+        {"chunk_overlap": True},
+        {"chunk_size": 100, "chunk_overlap": 100}
+    ])
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(LLMConfigurationError):
+            BehavioralAssertion(**kwargs)
+
+    def test_reduce_prompt_needs_placeholders(self):
+        with pytest.raises(InvalidPromptError):
+            AsserterPromptConfigurator(reduce_human_prompt="Expected: {expected_behavior}")
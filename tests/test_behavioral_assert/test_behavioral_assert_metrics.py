@@ -0,0 +1,155 @@
+import asyncio
+from contextlib import nullcontext
+
+import pytest
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError
+from llm_app_test.metrics.assertion_attribution import attribute_assertions_to
+from llm_app_test.metrics.assertion_metrics_collector import collect_assertion_metrics
+from llm_app_test.metrics.metrics_registry import MetricsRegistry, get_shared_metrics_registry
+from llm_app_test.mock_provider.mock_provider_server import MockProviderServer
+from llm_app_test.pytest_plugin.deferred_assertion import DeferredAssertionCollector
+from llm_app_test.rate_limiter.metered_in_memory_rate_limiter import MeteredInMemoryRateLimiter
+from tests.fake_judge import CACHED_USAGE, GREETING_VERDICTS, FakeJudge, asserter_with
+
+
+def metered_judge(*failures):
+    """Judge passing greetings with fixed token usage, after raising each of failures in turn"""
+    return FakeJudge(answers=[*failures, GREETING_VERDICTS], usage=CACHED_USAGE)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    monkeypatch.delenv('ASSERTER_COLLECT_METRICS', raising=False)
+    get_shared_metrics_registry().reset()
+    yield
+    get_shared_metrics_registry().reset()
+
+
+class TestMetricsRegistry:
+
+    def test_summary_and_slowest(self):
+        registry = MetricsRegistry(max_records=2)
+        for expected_behavior in ("first", "second", "third"):
+            with pytest.raises(ValueError) if expected_behavior == "second" else nullcontext():
+                with collect_assertion_metrics(registry, "assert_behavioral_match", expected_behavior, None):
+                    if expected_behavior == "second":
+                        raise ValueError
+
+        assert [metrics.expected_behavior for metrics in registry.records] == ["second", "third"]
+        assert registry.summary.assertions == 3
+        assert registry.summary.failed == 1
+        assert registry.records[0].error == "ValueError"
+        assert len(registry.slowest(1)) == 1
+
+        registry.reset()
+
+        assert registry.records == []
+        assert registry.summary.assertions == 0
+
+    def test_rate_limiter_wait(self):
+        registry = MetricsRegistry()
+        rate_limiter = MeteredInMemoryRateLimiter(requests_per_second=20, check_every_n_seconds=0.01)
+
+        with collect_assertion_metrics(registry, "assert_behavioral_match", "A greeting", None):
+            rate_limiter.acquire()
+            asyncio.run(rate_limiter.aacquire())
+
+        assert registry.records[0].rate_limiter_wait_seconds >= 0.05
+
+
+class TestAssertionMetrics:
+
+    def test_tokens_and_outcome(self):
+        asserter = asserter_with(metered_judge(), collect_metrics=True)
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+        with pytest.raises(BehavioralAssertionError):
+            asserter.assert_behavioral_match("Goodbye", "A greeting")
+
+        passed, failed = asserter.metrics_registry.records
+        assert (passed.passed, passed.requests, passed.input_tokens, passed.output_tokens,
+                passed.cached_input_tokens) == (True, 1, 100, 2, 60)
+        assert (failed.passed, failed.error) == (False, "BehavioralAssertionError")
+        assert passed.test_id == \
+            "tests/test_behavioral_assert/test_behavioral_assert_metrics.py::TestAssertionMetrics::test_tokens_and_outcome"
+
+    def test_with_retry_retries(self):
+        asserter = asserter_with(metered_judge(ConnectionError("flaky judge"), ConnectionError("flaky judge")),
+                                 collect_metrics=True)
+        asserter.llm = asserter.llm.with_retry(stop_after_attempt=3, wait_exponential_jitter=False)
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        metrics = asserter.metrics_registry.records[0]
+        assert (metrics.requests, metrics.retries) == (3, 2)
+
+    def test_async_votes_and_cache_hits(self):
+        asserter = asserter_with(metered_judge(), collect_metrics=True, use_in_memory_verdict_cache=True)
+        asserter.in_memory_verdict_cache.clear()
+
+        asyncio.run(asserter.aassert_behavioral_match("Hello", "A greeting", votes=3))
+        asserter.assert_behavioral_match("Hello", "A greeting", votes=3)
+
+        voted, cached = asserter.metrics_registry.records
+        assert (voted.method, voted.requests, voted.input_tokens) == ("aassert_behavioral_match", 2, 200)
+        assert (cached.verdict_cache_hit, cached.requests) == (True, 0)
+        assert asserter.metrics_registry.summary.verdict_cache_hit_rate == 0.5
+
+    def test_rate_limiter_wait_through_provider(self):
+        with MockProviderServer() as server:
+            asserter = BehavioralAssertion(api_key="test-key", base_url=server.base_url, use_rate_limiter=True,
+                                           rate_limiter_requests_per_second=10, collect_metrics=True)
+
+            asserter.assert_behavioral_match("Hello", "A greeting")
+
+        metrics = asserter.metrics_registry.records[0]
+        assert 0.05 <= metrics.rate_limiter_wait_seconds <= metrics.wall_seconds
+
+    def test_batch_and_match_all(self):
+        asserter = asserter_with(metered_judge(), collect_metrics=True, use_in_memory_verdict_cache=True)
+        asserter.in_memory_verdict_cache.clear()
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        asserter.assert_behavioral_matches([("Hello", "A greeting"), ("Hello", "A polite greeting")])
+        with pytest.raises(BehavioralAssertionError):
+            asyncio.run(asserter.aassert_behavioral_match_all("Hello", ["A greeting", "Polite"]))
+
+        _, batch, match_all = asserter.metrics_registry.records
+        assert (batch.method, batch.expected_behavior, batch.requests, batch.input_tokens) == \
+            ("assert_behavioral_matches", "A greeting; A polite greeting", 1, 100)
+        assert not batch.verdict_cache_hit
+        assert (match_all.method, match_all.expected_behavior, match_all.requests, match_all.error) == \
+            ("aassert_behavioral_match_all", "A greeting; Polite", 1, "BehavioralAssertionError")
+
+    def test_test_id_from_plugin(self):
+        asserter = asserter_with(metered_judge(), collect_metrics=True)
+
+        with attribute_assertions_to(None):
+            asserter.assert_behavioral_match("Hello", "A greeting")
+        with attribute_assertions_to("tests/test_example.py::test_greeting"):
+            collector = DeferredAssertionCollector(max_workers=1)
+            collector.submit(asserter, "Hello", "A greeting")
+            assert collector.drain() is None
+            collector.shutdown()
+
+        outside, deferred = asserter.metrics_registry.records
+        assert outside.test_id is None
+        assert deferred.test_id == "tests/test_example.py::test_greeting"
+
+    def test_disabled_by_default(self):
+        asserter = asserter_with(metered_judge())
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert asserter.metrics_registry is None
+        assert get_shared_metrics_registry().summary.assertions == 0
+
+    def test_enabled_from_environment(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_COLLECT_METRICS', 'true')
+        asserter = asserter_with(metered_judge())
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert asserter.metrics_registry.summary.assertions == 1
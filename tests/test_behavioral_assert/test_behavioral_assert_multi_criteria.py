@@ -0,0 +1,152 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from langchain_core.language_models import BaseLanguageModel
+
+from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompt_configurator import AsserterPromptConfigurator
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.behavioral_assert.verdict.verdict_parser import VerdictParser
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, InvalidPromptError
+
+
+class TestMultiCriteriaVerdictParser:
+    """Test suite for parsing multi-criteria asserter responses"""
+
+    def test_plain_response(self):
+        """Test the exact format requested by the default prompt"""
+        verdicts = VerdictParser.parse_multi_criteria("1. PASS\n2. FAIL: Not polite\n3. PASS", 3)
+
+        assert verdicts == [Verdict(passed=True), Verdict(passed=False, reason="Not polite"), Verdict(passed=True)]
+
+    def test_decorated_and_reordered_response(self):
+        """Test that markdown decoration, alternative numbering and ordering are tolerated"""
+        content = "Here are my verdicts:\n**2)** FAIL - Too long\n[1] pass\nCriterion 3: PASS"
+
+        verdicts = VerdictParser.parse_multi_criteria(content, 3)
+
+        assert verdicts == [Verdict(passed=True), Verdict(passed=False, reason="Too long"), Verdict(passed=True)]
+
+    def test_wrapped_reason(self):
+        """Test that reasons continuing on the following lines are joined"""
+        verdicts = VerdictParser.parse_multi_criteria("1. FAIL: The greeting\nomits the name\n2. PASS", 2)
+
+        assert verdicts[0] == Verdict(passed=False, reason="The greeting omits the name")
+
+    def test_missing_criterion_fails(self):
+        """Test that a criterion missing from the response can never pass"""
+        verdicts = VerdictParser.parse_multi_criteria("1. PASS", 2)
+
+        assert verdicts[1] == Verdict(passed=False, reason=VerdictParser.MISSING_CRITERION_REASON)
+
+    def test_out_of_range_and_duplicate_numbers_ignored(self):
+        """Test that only the first verdict for each sent criterion is used"""
+        verdicts = VerdictParser.parse_multi_criteria("1. PASS\n1. FAIL: changed my mind\n7. FAIL: extra", 1)
+
+        assert verdicts == [Verdict(passed=True)]
+
+
+class TestBehavioralAssertionMultiCriteria:
+    """Test suite for assert_behavioral_match_all"""
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock_llm = Mock(spec=BaseLanguageModel)
+        mock_llm.invoke.return_value = Mock(content="1. PASS\n2. PASS\n3. PASS")
+        mock_llm.ainvoke = AsyncMock(return_value=Mock(content="1. PASS\n2. FAIL: Not formal"))
+        return mock_llm
+
+    def test_single_request_for_all_criteria(self, mock_llm):
+        """Test that every criterion is judged in one request that sends the actual output once"""
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        verdicts = asserter.assert_behavioral_match_all(
+            "Hello Alice, welcome aboard!",
+            ["A greeting", "Addresses Alice by name", "Is friendly"]
+        )
+
+        assert verdicts == [Verdict(passed=True)] * 3
+        mock_llm.invoke.assert_called_once()
+        human_prompt = mock_llm.invoke.call_args.args[0][1].content
+        assert human_prompt.count("Hello Alice, welcome aboard!") == 1
+        assert "1. A greeting" in human_prompt
+        assert "3. Is friendly" in human_prompt
+
+    def test_failures_raise_aggregated_error(self, mock_llm):
+        """Test that failing criteria are reported together with their index and reason"""
+        mock_llm.invoke.return_value = Mock(content="1. PASS\n2. FAIL: Bob is not named\n3. FAIL: Too short")
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            asserter.assert_behavioral_match_all("Hi", ["A greeting", "Addresses Bob", "At least two sentences"])
+
+        assert excinfo.value.details["failures"] == {1: "Bob is not named", 2: "Too short"}
+
+    def test_async(self, mock_llm):
+        """Test that aassert_behavioral_match_all awaits ainvoke"""
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            asyncio.run(asserter.aassert_behavioral_match_all("Hi there", ["A greeting", "Formal tone"]))
+
+        mock_llm.ainvoke.assert_awaited_once()
+        assert excinfo.value.details["failures"] == {1: "Not formal"}
+
+    def test_verdicts_are_cached(self, mock_llm, tmp_path):
+        """Test that a repeated multi-criteria assertion is served from the verdict cache"""
+        asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True,
+                                       verdict_cache_path=str(tmp_path / "verdicts.sqlite3"))
+        criteria = ["A greeting", "Addresses Alice by name", "Is friendly"]
+
+        asserter.assert_behavioral_match_all("Hello Alice", criteria)
+        asserter.assert_behavioral_match_all("Hello Alice", criteria)
+
+        mock_llm.invoke.assert_called_once()
+
+    def test_missing_criteria_are_not_cached(self, mock_llm, tmp_path):
+        """Test that a retry after a truncated response asks the judge again instead of failing from the cache"""
+        mock_llm.invoke.side_effect = [Mock(content="1. PASS"), Mock(content="1. PASS\n2. PASS")]
+        asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True,
+                                       verdict_cache_path=str(tmp_path / "verdicts.sqlite3"))
+        criteria = ["A greeting", "Addresses Alice by name"]
+
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            asserter.assert_behavioral_match_all("Hello Alice", criteria)
+        verdicts = asserter.assert_behavioral_match_all("Hello Alice", criteria)
+
+        assert excinfo.value.details["failures"] == {1: VerdictParser.MISSING_CRITERION_REASON}
+        assert verdicts == [Verdict(passed=True)] * 2
+        assert mock_llm.invoke.call_count == 2
+
+    def test_generator_expected_behaviors(self, mock_llm):
+        """Test that expected behaviors given as a generator are validated and judged"""
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        verdicts = asserter.assert_behavioral_match_all("Hello", (criterion for criterion in ["A", "B", "C"]))
+
+        assert verdicts == [Verdict(passed=True)] * 3
+        with pytest.raises(InvalidPromptError):
+            asserter.assert_behavioral_match_all("Hello", (criterion for criterion in []))
+
+    @pytest.mark.parametrize("expected_behaviors", [None, "A greeting", [], ["A greeting", None]])
+    def test_invalid_expected_behaviors(self, mock_llm, expected_behaviors):
+        """Test that malformed expected behaviors are rejected"""
+        asserter = BehavioralAssertion(llm=mock_llm)
+
+        with pytest.raises(InvalidPromptError):
+            asserter.assert_behavioral_match_all("Hello", expected_behaviors)
+
+    def test_default_multi_criteria_prompts(self):
+        """Test that the multi-criteria prompts default to the configurator constants"""
+        prompts = AsserterPromptConfigurator().prompts
+
+        assert prompts.multi_criteria_system_prompt == AsserterPromptConfigurator.DEFAULT_MULTI_CRITERIA_SYSTEM_PROMPT
+        assert prompts.multi_criteria_human_prompt == AsserterPromptConfigurator.DEFAULT_MULTI_CRITERIA_HUMAN_PROMPT
+
+    def test_invalid_multi_criteria_human_prompt(self):
+        """Test that a multi-criteria human prompt without placeholders is rejected"""
+        with pytest.raises(InvalidPromptError) as excinfo:
+            AsserterPromptConfigurator(multi_criteria_human_prompt="No placeholders")
+
+        assert "must contain {expected_behaviors} and {actual} placeholders" in str(excinfo.value)
@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.llm_config.prompt_messages import EPHEMERAL_CACHE_CONTROL, build_prompt_messages
+from llm_app_test.prompt_cache.prompt_cache_stats import PromptCacheStats
+from tests.fake_judge import FakeJudge, asserter_with
+
+# long enough for the prompt prefix before {actual} to reach Anthropic's minimum cacheable length
+LONG_SPEC = "A greeting that names the recipient and mentions the weather. " * 80
+
+USAGE = {
+    "input_tokens": 2000,
+    "output_tokens": 1,
+    "total_tokens": 2001,
+    "input_token_details": {"cache_read": 1500, "cache_creation": 0}
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ('USE_PROMPT_CACHING', 'LLM_PROVIDER', 'LLM_MODEL', 'ASSERTER_ENSEMBLE_PROVIDERS'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+
+
+def caching_asserter(**kwargs):
+    return asserter_with(FakeJudge(usage=USAGE), replace_llm=True, provider="anthropic", use_prompt_caching=True,
+                         **kwargs)
+
+
+class TestBuildPromptMessages:
+
+    def test_plain_messages_without_cache_control(self):
+        system, human = build_prompt_messages("Judge.", "Spec: {expected_behavior}\nOutput: {actual}",
+                                              expected_behavior="A greeting", actual="Hello")
+
+        assert system.content == "Judge."
+        assert human.content == "Spec: A greeting\nOutput: Hello"
+
+    def test_cache_breakpoints_before_actual(self):
+        system, human = build_prompt_messages("Judge.", "Spec: {expected_behavior}\nOutput: {actual}\nEnd",
+                                              cache_control=True, expected_behavior="A greeting", actual="Hello")
+
+        assert system.content == [{"type": "text", "text": "Judge.", "cache_control": EPHEMERAL_CACHE_CONTROL}]
+        assert human.content == [
+            {"type": "text", "text": "Spec: A greeting\nOutput: ", "cache_control": EPHEMERAL_CACHE_CONTROL},
+            {"type": "text", "text": "Hello\nEnd"}
+        ]
+
+    def test_actual_first_leaves_only_system_breakpoint(self):
+        _, human = build_prompt_messages("Judge.", "{actual} vs {expected_behavior}", cache_control=True,
+                                         expected_behavior="A greeting", actual="Hello")
+
+        assert human.content == [{"type": "text", "text": "Hello vs A greeting"}]
+
+    def test_short_prefix_sent_without_breakpoints(self):
+        system, human = build_prompt_messages("Judge.", "Spec: {expected_behavior}\nOutput: {actual}",
+                                              cache_control=True, min_cacheable_tokens=1024,
+                                              expected_behavior="A greeting", actual="Hello")
+
+        assert system.content == "Judge."
+        assert human.content == "Spec: A greeting\nOutput: Hello"
+
+    def test_breakpoint_only_where_prefix_is_long_enough(self):
+        system, human = build_prompt_messages("Judge.", "Spec: {expected_behavior}\nOutput: {actual}",
+                                              cache_control=True, min_cacheable_tokens=1024,
+                                              expected_behavior=LONG_SPEC, actual="Hello")
+
+        assert system.content == [{"type": "text", "text": "Judge."}]
+        assert human.content[0]["cache_control"] == EPHEMERAL_CACHE_CONTROL
+        assert "cache_control" not in human.content[1]
+
+    def test_braces_in_actual_are_kept(self):
+        _, human = build_prompt_messages("Judge.", "{expected_behavior}: {actual}", cache_control=True,
+                                         expected_behavior="JSON", actual='{"a": 1}')
+
+        assert human.content[1]["text"] == '{"a": 1}'
+
+
+class TestPromptCaching:
+
+    def test_anthropic_requests_with_long_spec_are_marked(self):
+        asserter = caching_asserter()
+
+        asserter.assert_behavioral_match("Hello", LONG_SPEC)
+
+        system, human = asserter.llm.requests[0].messages
+        assert "cache_control" not in system.content[0]
+        assert human.content[0]["cache_control"] == EPHEMERAL_CACHE_CONTROL
+        assert LONG_SPEC.strip() in human.content[0]["text"]
+        assert human.content[-1]["text"].startswith("Hello")
+
+    def test_default_prompts_with_short_spec_stay_plain(self):
+        asserter = caching_asserter()
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert all(isinstance(message.content, str) for message in asserter.llm.requests[0].messages)
+
+    def test_openai_requests_stay_plain(self):
+        asserter = asserter_with(FakeJudge(usage=USAGE), replace_llm=True, use_prompt_caching=True)
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert all(isinstance(message.content, str) for message in asserter.llm.requests[0].messages)
+
+    def test_mixed_ensemble_stays_plain(self):
+        asserter = BehavioralAssertion(provider="anthropic", use_prompt_caching=True, ensemble_providers=["openai"])
+
+        assert asserter._cache_control is False
+
+    def test_injected_anthropic_model(self):
+        llm = ChatAnthropic(model="claude-3-5-sonnet-latest", api_key="test-key").with_retry()
+
+        assert BehavioralAssertion(llm=llm, use_prompt_caching=True)._cache_control is True
+        assert asserter_with(use_prompt_caching=True)._cache_control is False
+
+    def test_haiku_needs_longer_prefix(self):
+        sonnet = ChatAnthropic(model="claude-3-5-sonnet-latest", api_key="test-key")
+        haiku = ChatAnthropic(model="claude-3-5-haiku-latest", api_key="test-key").with_retry()
+
+        assert BehavioralAssertion(llm=sonnet, use_prompt_caching=True)._min_cacheable_tokens == 1024
+        assert BehavioralAssertion(llm=haiku, use_prompt_caching=True)._min_cacheable_tokens == 2048
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv('USE_PROMPT_CACHING', 'true')
+
+        assert BehavioralAssertion(provider="anthropic")._cache_control is True
+
+    def test_cache_key_ignores_markers(self):
+        plain = BehavioralAssertion(provider="anthropic", use_in_memory_verdict_cache=True)
+        marked = BehavioralAssertion(provider="anthropic", use_in_memory_verdict_cache=True, use_prompt_caching=True)
+
+        assert plain._verdict_cache_key(plain._build_messages("Hello", "A greeting"), "Hello", "A greeting") == \
+            marked._verdict_cache_key(marked._build_messages("Hello", "A greeting"), "Hello", "A greeting")
+
+
+class TestPromptCacheUsage:
+
+    def test_usage_recorded(self):
+        asserter = caching_asserter()
+
+        asserter.assert_behavioral_match("Hello", LONG_SPEC)
+        asyncio.run(asserter.aassert_behavioral_match("Hi", LONG_SPEC))
+
+        stats = asserter.prompt_cache_usage.stats
+        assert stats == PromptCacheStats(requests=2, input_tokens=4000, cache_read_input_tokens=3000,
+                                         cache_creation_input_tokens=0)
+        assert stats.cache_read_ratio == 0.75
+
+    def test_batch_usage_recorded(self):
+        asserter = caching_asserter()
+
+        asserter.assert_behavioral_matches([("Hello", LONG_SPEC), ("Hi", LONG_SPEC)])
+
+        assert asserter.prompt_cache_usage.stats.requests == 2
+
+    def test_responses_without_usage(self):
+        asserter = BehavioralAssertion()
+
+        asserter.prompt_cache_usage.record(AIMessage(content="PASS"))
+
+        assert asserter.prompt_cache_usage.stats.input_tokens == 0
+        assert asserter.prompt_cache_usage.stats.cache_read_ratio == 0.0
+
+    def test_reset_stats(self):
+        asserter = caching_asserter()
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        asserter.prompt_cache_usage.reset_stats()
+
+        assert asserter.prompt_cache_usage.stats.requests == 0
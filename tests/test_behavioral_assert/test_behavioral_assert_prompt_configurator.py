@@ -1,7 +1,16 @@
+from unittest.mock import Mock
+
 import pytest
+from langchain_core.language_models import BaseLanguageModel
+
 from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompt_configurator import AsserterPromptConfigurator
 from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
-from llm_app_test.exceptions.test_exceptions import InvalidPromptError
+from llm_app_test.exceptions.test_exceptions import InvalidPromptError, LLMConfigurationError
+
+CUSTOM_STANDARD_PROMPTS = dict(
+    system_prompt="Custom system prompt",
+    human_prompt="Custom human prompt with {expected_behavior} and {actual}"
+)
 
 
 class TestAsserterPromptConfigurator:
@@ -55,3 +64,71 @@ class TestAsserterPromptConfigurator:
 
         assert asserter.custom_prompts.prompts.system_prompt == custom_system
         assert asserter.custom_prompts.prompts.human_prompt == custom_human
+
+    def test_customized_prompt_names(self):
+        """Test that the configurator reports which prompts were customised"""
+        configurator = AsserterPromptConfigurator(
+            system_prompt="Custom system prompt",
+            reduce_human_prompt="{expected_behavior}: {excerpt_reviews}"
+        )
+
+        assert configurator.customized == {"system_prompt", "reduce_human_prompt"}
+        assert AsserterPromptConfigurator().customized == frozenset()
+
+
+class TestCustomPromptsWithJudgingModes:
+    """Test that customised standard prompts are never silently replaced by the default prompts of a mode"""
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        for name in ('ASSERTER_VERDICT_MODE', 'ASSERTER_LONG_INPUT_THRESHOLD'):
+            monkeypatch.delenv(name, raising=False)
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock_llm = Mock(spec=BaseLanguageModel)
+        mock_llm.invoke.return_value = Mock(content="1. PASS\n2. PASS")
+        return mock_llm
+
+    @pytest.mark.parametrize("kwargs", [{"verdict_mode": "two_phase"}, {"long_input_threshold": 1000}])
+    def test_mode_without_its_prompts_rejected(self, mock_llm, kwargs):
+        with pytest.raises(LLMConfigurationError) as excinfo:
+            BehavioralAssertion(llm=mock_llm, custom_prompts=AsserterPromptConfigurator(**CUSTOM_STANDARD_PROMPTS),
+                                **kwargs)
+
+        assert "would be ignored" in excinfo.value.reason
+
+    @pytest.mark.parametrize("kwargs, mode_prompts", [
+        ({"verdict_mode": "two_phase"}, {"verdict_only_system_prompt": "Answer PASS or FAIL"}),
+        ({"long_input_threshold": 1000}, {"chunk_system_prompt": "Review the excerpt"})
+    ])
+    def test_mode_with_its_prompts_customised(self, mock_llm, kwargs, mode_prompts):
+        custom_prompts = AsserterPromptConfigurator(**CUSTOM_STANDARD_PROMPTS, **mode_prompts)
+
+        assert BehavioralAssertion(llm=mock_llm, custom_prompts=custom_prompts, **kwargs).custom_prompts is \
+            custom_prompts
+
+    def test_modes_with_default_prompts(self, mock_llm):
+        asserter = BehavioralAssertion(llm=mock_llm, verdict_mode="two_phase", long_input_threshold=1000)
+
+        assert asserter.assert_behavioral_match_all("Hello Alice", ["A greeting", "Names Alice"])[0].passed
+
+    def test_match_all_without_multi_criteria_prompts_rejected(self, mock_llm):
+        asserter = BehavioralAssertion(llm=mock_llm,
+                                       custom_prompts=AsserterPromptConfigurator(**CUSTOM_STANDARD_PROMPTS))
+
+        with pytest.raises(LLMConfigurationError):
+            asserter.assert_behavioral_match_all("Hello Alice", ["A greeting", "Names Alice"])
+
+        mock_llm.invoke.assert_not_called()
+
+    def test_match_all_with_multi_criteria_prompts(self, mock_llm):
+        custom_prompts = AsserterPromptConfigurator(
+            **CUSTOM_STANDARD_PROMPTS,
+            multi_criteria_human_prompt="Criteria:\n{expected_behaviors}\nOutput: {actual}"
+        )
+        asserter = BehavioralAssertion(llm=mock_llm, custom_prompts=custom_prompts)
+
+        asserter.assert_behavioral_match_all("Hello Alice", ["A greeting", "Names Alice"])
+
+        assert mock_llm.invoke.call_args.args[0][1].content.startswith("Criteria:")
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from llm_app_test.behavioral_assert.verdict.verdict_mode_enum import VerdictMode
+from llm_app_test.behavioral_assert.verdict.verdict_parser import VerdictParser
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, LLMConfigurationError
+from llm_app_test.metrics.metrics_registry import get_shared_metrics_registry
+from llm_app_test.rate_limiter.adaptive_rate_limiter import AdaptiveRateLimiter
+from llm_app_test.rate_limiter.adaptive_rate_limiter_callback_handler import AdaptiveRateLimiterCallbackHandler
+from tests.fake_judge import FakeJudge, asserter_with
+
+
+class TestStreamDecision:
+
+    @pytest.mark.parametrize("prefix, expected", [
+        ("", None), ("F", None), ("FAI", None), ("FAIL", False), ("FAIL: no", False),
+        ("P", True), ("PASS", True), ("Fine", True), (" FAIL", True)
+    ])
+    def test_stream_decision_matches_parse(self, prefix, expected):
+        assert VerdictParser.stream_decision(prefix) is expected
+        if expected is not None:
+            assert VerdictParser.parse(prefix).passed is expected
+
+
+class TestStreamingVerdicts:
+
+    @staticmethod
+    def asserter(chunks):
+        return asserter_with(FakeJudge(chunks=chunks), verdict_mode="streaming")
+
+    def test_pass_closes_stream_early(self):
+        asserter = self.asserter(["PA", "SS", " because", " it", " matches"])
+
+        asserter.assert_behavioral_match("actual", "expected")
+
+        assert asserter.llm.sent == 1
+        assert asserter.llm.closed is True
+
+    def test_fail_reads_reason_to_end(self):
+        asserter = self.asserter(["FA", "IL", ": ", "wrong ", "topic"])
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_match("actual", "expected")
+
+        assert exc_info.value.reason == "wrong topic"
+        assert asserter.llm.sent == 5
+
+    def test_async_pass_closes_stream_early(self):
+        asserter = self.asserter(["P", "ASS", " more", " text"])
+
+        asyncio.run(asserter.aassert_behavioral_match("actual", "expected"))
+
+        assert asserter.llm.sent == 1
+        assert asserter.llm.closed is True
+
+    def test_early_pass_is_not_reported_as_error(self):
+        """Test that closing the stream on PASS counts as a successful, early stopped request"""
+        limiter = AdaptiveRateLimiter(requests_per_second=1)
+        model = FakeJudge(chunks=["PASS", " because", " it matches"],
+                                   callbacks=[AdaptiveRateLimiterCallbackHandler(limiter)])
+        asserter = asserter_with(model, verdict_mode="streaming", collect_metrics=True)
+        registry = get_shared_metrics_registry()
+        registry.reset()
+
+        asserter.assert_behavioral_match("actual", "expected")
+        asyncio.run(asserter.aassert_behavioral_match("actual", "expected"))
+
+        assert [(metrics.error, metrics.requests, metrics.early_stopped_streams)
+                for metrics in registry.records] == [(None, 1, 1)] * 2
+        assert registry.summary.early_stopped_streams == 2
+        assert limiter.requests_per_second == pytest.approx(1.2)
+        registry.reset()
+
+    def test_async_fail_reads_reason(self):
+        asserter = self.asserter(["F", "AIL: ", "missing greeting"])
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asyncio.run(asserter.aassert_behavioral_match("actual", "expected"))
+
+        assert exc_info.value.reason == "missing greeting"
+
+    def test_standard_mode_waits_for_full_response(self):
+        asserter = asserter_with(FakeJudge(chunks=["PASS", " and", " more"]))
+
+        asserter.assert_behavioral_match("actual", "expected")
+
+        assert asserter.verdict_mode == VerdictMode.STANDARD
+        assert asserter.llm.sent == 3
+
+
+class TestVerdictModeConfiguration:
+
+    def test_mode_from_env(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_VERDICT_MODE', 'STREAMING')
+
+        asserter = asserter_with(FakeJudge(chunks=["PASS"]))
+
+        assert asserter.verdict_mode == VerdictMode.STREAMING
+
+    def test_direct_overrides_env(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_VERDICT_MODE', 'streaming')
+
+        asserter = asserter_with(FakeJudge(chunks=["PASS"]), verdict_mode=VerdictMode.STANDARD)
+
+        assert asserter.verdict_mode == VerdictMode.STANDARD
+
+    def test_invalid_mode(self):
+        with pytest.raises(LLMConfigurationError):
+            asserter_with(FakeJudge(chunks=["PASS"]), verdict_mode="psychic")
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompt_configurator import AsserterPromptConfigurator
+from llm_app_test.behavioral_assert.behavioral_assert_config.behavioral_assert_constants import VerdictConstants
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, InvalidPromptError
+from tests.fake_judge import FakeJudge, asserter_with
+
+
+class TestTwoPhaseVerdicts:
+
+    @staticmethod
+    def asserter(responses, **kwargs):
+        return asserter_with(FakeJudge(answers=responses), verdict_mode="two_phase", **kwargs)
+
+    def test_pass_needs_one_small_request(self):
+        asserter = self.asserter(["PASS"])
+
+        asserter.assert_behavioral_match("Hello there", "A greeting")
+
+        requests = asserter.llm.requests
+        assert len(requests) == 1
+        assert requests[0].kwargs["max_tokens"] == VerdictConstants.TWO_PHASE_VERDICT_MAX_TOKENS
+        assert requests[0].system == AsserterPromptConfigurator.DEFAULT_VERDICT_ONLY_SYSTEM_PROMPT
+
+    def test_fail_requests_reason(self):
+        asserter = self.asserter(["FAIL", "The output is a farewell, not a greeting."])
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_match("Goodbye", "A greeting")
+
+        assert exc_info.value.reason == "The output is a farewell, not a greeting."
+        requests = asserter.llm.requests
+        assert len(requests) == 2
+        assert "max_tokens" not in requests[1].kwargs
+        assert requests[1].system == AsserterPromptConfigurator.DEFAULT_REASON_SYSTEM_PROMPT
+        assert "Goodbye" in requests[1].human and "A greeting" in requests[1].human
+
+    def test_async_fail_requests_reason(self):
+        asserter = self.asserter(["FAIL", "  Wrong language.  "])
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asyncio.run(asserter.aassert_behavioral_match("Bonjour", "An English greeting"))
+
+        assert exc_info.value.reason == "Wrong language."
+
+    def test_async_pass(self):
+        asserter = self.asserter(["PASS"])
+
+        asyncio.run(asserter.aassert_behavioral_match("Hello", "A greeting"))
+
+        assert len(asserter.llm.requests) == 1
+
+    def test_custom_two_phase_prompts(self):
+        prompts = AsserterPromptConfigurator(
+            verdict_only_system_prompt="Answer PASS or FAIL only",
+            verdict_only_human_prompt="E: {expected_behavior} A: {actual}",
+            reason_system_prompt="Explain the failure",
+            reason_human_prompt="Why? E: {expected_behavior} A: {actual}"
+        )
+        asserter = self.asserter(["FAIL", "because"], custom_prompts=prompts)
+
+        with pytest.raises(BehavioralAssertionError):
+            asserter.assert_behavioral_match("x", "y")
+
+        assert asserter.llm.prompts == ["E: y A: x", "Why? E: y A: x"]
+
+    @pytest.mark.parametrize("argument", ["verdict_only_human_prompt", "reason_human_prompt"])
+    def test_two_phase_human_prompt_requires_placeholders(self, argument):
+        with pytest.raises(InvalidPromptError):
+            AsserterPromptConfigurator(**{argument: "No placeholders here"})
@@ -0,0 +1,223 @@
+import asyncio
+
+import pytest
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.llm_config.llm_provider_enum import LLMProvider
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.behavioral_assert.verdict.vote_strategy_enum import VoteStrategy
+from llm_app_test.behavioral_assert.verdict.vote_tally import VoteTally
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, LLMConfigurationError
+from tests.fake_judge import FakeJudge, asserter_with
+
+PASS = Verdict(passed=True)
+FAIL = Verdict(passed=False, reason="wrong")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in ('ASSERTER_VOTE_STRATEGY', 'ASSERTER_VOTE_CONFIDENCE', 'ASSERTER_ENSEMBLE_PROVIDERS',
+                 'ASSERTER_VERDICT_MODE', 'ASSERTER_CONFIDENCE_THRESHOLD', 'USE_VERDICT_CONFIDENCE'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+
+
+class TestVoteTally:
+
+    def test_majority_draws_only_what_can_decide(self):
+        tally = VoteTally(5)
+
+        assert tally.next_draw() == 3
+        for sample in (PASS, PASS, PASS):
+            tally.add(sample)
+
+        assert tally.next_draw() == 0
+        assert tally.verdict() == Verdict(passed=True, votes=(3, 0))
+
+    def test_majority_split_draws_again(self):
+        tally = VoteTally(3)
+        tally.add(PASS)
+        tally.add(FAIL)
+
+        assert tally.decision() is None
+        assert tally.next_draw() == 1
+
+        tally.add(FAIL)
+
+        assert tally.verdict() == Verdict(passed=False, reason="wrong", votes=(1, 2))
+
+    def test_even_votes_tie_fails(self):
+        tally = VoteTally(2)
+        tally.add(PASS)
+        tally.add(FAIL)
+
+        assert tally.next_draw() == 0
+        assert tally.decision() is False
+
+    def test_sprt_stops_at_margin(self):
+        tally = VoteTally(9, strategy=VoteStrategy.SPRT, confidence=0.95, judge_accuracy=0.9)
+
+        assert tally.next_draw() == 2
+        tally.add(PASS)
+        tally.add(FAIL)
+        assert tally.next_draw() == 2
+        tally.add(PASS)
+        tally.add(PASS)
+
+        assert tally.decision() is True
+        assert tally.verdict().votes == (3, 1)
+
+    def test_sprt_higher_confidence_needs_larger_margin(self):
+        tally = VoteTally(9, strategy=VoteStrategy.SPRT, confidence=0.999, judge_accuracy=0.9)
+
+        assert tally.next_draw() == 4
+
+    def test_sprt_falls_back_to_majority_when_votes_run_out(self):
+        tally = VoteTally(3, strategy=VoteStrategy.SPRT, confidence=0.999, judge_accuracy=0.9)
+        for sample in (PASS, FAIL, PASS):
+            tally.add(sample)
+
+        assert tally.next_draw() == 0
+        assert tally.decision() is True
+
+    def test_confidence_from_winning_samples(self):
+        tally = VoteTally(3)
+        tally.add(Verdict(passed=True, confidence=0.9))
+        tally.add(Verdict(passed=True, confidence=0.7))
+
+        assert tally.verdict().confidence == pytest.approx(0.8)
+
+
+class TestVotedAssertions:
+
+    def test_without_votes_single_call(self):
+        asserter = asserter_with()
+
+        assert asserter.assert_behavioral_match("Hello", "A greeting") == Verdict(passed=True)
+        assert asserter.llm.calls == 1
+
+    def test_unanimous_majority_stops_early(self):
+        asserter = asserter_with()
+
+        verdict = asserter.assert_behavioral_match("Hello", "A greeting", votes=5)
+
+        assert verdict.votes == (3, 0)
+        assert asserter.llm.calls == 3
+
+    def test_failed_vote_reports_counts(self):
+        asserter = asserter_with(FakeJudge(answers="FAIL: not a greeting"))
+
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_match("Goodbye", "A greeting", votes=3)
+
+        assert exc_info.value.reason == "not a greeting"
+        assert exc_info.value.details["votes"] == {"pass": 0, "fail": 2}
+
+    def test_async_split_vote_draws_tiebreaker(self):
+        asserter = asserter_with(FakeJudge(answers=["PASS", "FAIL: unsure", "PASS"]))
+
+        verdict = asyncio.run(asserter.aassert_behavioral_match("Hi", "A greeting", votes=3))
+
+        assert verdict.votes == (2, 1)
+        assert asserter.llm.calls == 3
+
+    def test_sprt_strategy(self):
+        asserter = asserter_with(vote_strategy="sprt")
+
+        verdict = asserter.assert_behavioral_match("Hello", "A greeting", votes=7)
+
+        assert verdict.votes == (2, 0)
+
+    def test_ensemble_judges_take_turns(self):
+        asserter = asserter_with()
+        other = FakeJudge(answers="FAIL: other judge disagrees")
+        asserter.ensemble_llms = [other]
+
+        verdict = asserter.assert_behavioral_match("Hello", "A greeting", votes=3)
+
+        assert verdict.votes == (2, 1)
+        assert asserter.llm.calls == 2
+        assert other.calls == 1
+
+    def test_voted_verdicts_cached_separately(self):
+        asserter = asserter_with(use_in_memory_verdict_cache=True)
+        asserter.in_memory_verdict_cache.clear()
+
+        asserter.assert_behavioral_match("Hello", "A greeting")
+        asserter.assert_behavioral_match("Hello", "A greeting", votes=3)
+        asserter.assert_behavioral_match("Hello", "A greeting", votes=3)
+
+        assert asserter.llm.calls == 3
+
+    def test_persistent_cache_keeps_votes(self, tmp_path):
+        cache_path = str(tmp_path / "verdicts.sqlite3")
+
+        for _ in range(2):
+            asserter = asserter_with(FakeJudge(answers="FAIL: not a greeting"), use_verdict_cache=True,
+                                     verdict_cache_path=cache_path)
+            with pytest.raises(BehavioralAssertionError) as exc_info:
+                asserter.assert_behavioral_match("Goodbye", "A greeting", votes=3)
+
+            assert exc_info.value.details["votes"] == {"pass": 0, "fail": 2}
+
+        assert asserter.llm.calls == 0
+
+    def test_vote_settings_feed_persistent_cache_key(self, tmp_path):
+        cache_path = str(tmp_path / "verdicts.sqlite3")
+        asserter = asserter_with(use_verdict_cache=True, verdict_cache_path=cache_path)
+
+        asserter.assert_behavioral_match("Hello", "A greeting", votes=3)
+        asserter.assert_behavioral_match("Hello", "A greeting", votes=5)
+        sprt = asserter_with(use_verdict_cache=True, verdict_cache_path=cache_path, vote_strategy="sprt")
+        verdict = sprt.assert_behavioral_match("Hello", "A greeting", votes=5)
+
+        assert asserter.llm.calls == 5
+        assert sprt.llm.calls == 2
+        assert verdict.votes == (2, 0)
+
+    @pytest.mark.parametrize("votes", [0, -1, 2.5, "3", True])
+    def test_invalid_votes(self, votes):
+        asserter = asserter_with()
+
+        with pytest.raises(LLMConfigurationError):
+            asserter.assert_behavioral_match("Hello", "A greeting", votes=votes)
+
+
+class TestVoteConfiguration:
+
+    def test_settings_from_env(self, monkeypatch):
+        monkeypatch.setenv('ASSERTER_VOTE_STRATEGY', 'SPRT')
+        monkeypatch.setenv('ASSERTER_VOTE_CONFIDENCE', '0.99')
+        monkeypatch.setenv('ASSERTER_ENSEMBLE_PROVIDERS', 'anthropic, openai')
+
+        asserter = BehavioralAssertion()
+
+        assert asserter.vote_strategy == VoteStrategy.SPRT
+        assert asserter.vote_confidence == 0.99
+        assert asserter.ensemble_providers == [LLMProvider.ANTHROPIC, LLMProvider.OPENAI]
+        assert [type(llm).__name__ for llm in asserter.ensemble_llms] == ["ChatAnthropic", "ChatOpenAI"]
+
+    def test_ensemble_ignored_with_custom_llm(self):
+        asserter = asserter_with(ensemble_providers=["anthropic"])
+
+        assert asserter.ensemble_llms == []
+
+    def test_ensemble_with_retry(self):
+        asserter = BehavioralAssertion(ensemble_providers=[LLMProvider.ANTHROPIC], langchain_with_retry=True)
+
+        assert type(asserter.ensemble_llms[0].bound).__name__ == "ChatAnthropic"
+
+    def test_confidence_needs_openai_ensemble(self):
+        with pytest.raises(LLMConfigurationError):
+            BehavioralAssertion(ensemble_providers=["anthropic"], use_verdict_confidence=True)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"vote_strategy": "unanimous"},
+        {"vote_confidence": 0.5},
+        {"vote_confidence": 1},
+        {"ensemble_providers": ["gemini"]}
+    ])
+    def test_invalid_settings(self, kwargs):
+        with pytest.raises(LLMConfigurationError):
+            BehavioralAssertion(**kwargs)
@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARK = Path(__file__).parents[2] / "benchmarks" / "assertion_throughput.py"
+
+
+def run_benchmark(*args):
+    return subprocess.run(
+        [sys.executable, str(BENCHMARK), "--assertions", "4", "--concurrency", "2", "--requests-per-second", "0",
+         "--retries", "sdk", "--payload-chars", "100", "--latency", "0.01", *args],
+        capture_output=True, text=True, timeout=120, check=True
+    )
+
+
+class TestAssertionThroughputBenchmark:
+
+    def test_writes_machine_readable_results(self, tmp_path):
+        output = tmp_path / "results.json"
+
+        run_benchmark("--output", str(output), "--rate-limit-rate", "0")
+
+        results = json.loads(output.read_text())
+        assert results["benchmark"] == "assertion_throughput"
+        assert [scenario["name"] for scenario in results["scenarios"]] == [
+            "sync/c=2/no-rate-limiter/retry=sdk/payload=100",
+            "async/c=2/no-rate-limiter/retry=sdk/payload=100"
+        ]
+        for scenario in results["scenarios"]:
+            assert scenario["errors"] == {}
+            assert scenario["status_counts"] == {"200": 4}
+            assert scenario["throughput_per_second"] > 0
+            assert 0 < scenario["latency_seconds"]["p50"] <= scenario["latency_seconds"]["p95"] <= \
+                scenario["latency_seconds"]["p99"]
+
+    def test_compares_with_earlier_results(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        run_benchmark("--output", str(baseline), "--apis", "sync")
+
+        result = run_benchmark("--output", str(tmp_path / "results.json"), "--apis", "sync", "--compare", str(baseline))
+
+        assert "sync/c=2/no-rate-limiter/retry=sdk/payload=100" in result.stdout.split("Compared with")[1]
@@ -72,6 +72,13 @@ class TestConfigValidator:
             ConfigValidator.validate(valid_config)
         assert "max_tokens must be positive" in str(exc_info.value)
 
+    def test_invalid_base_url(self, valid_config):
+        """Test validation with a base_url that is not an HTTP URL"""
+        valid_config.base_url = "localhost:8080"
+        with pytest.raises(LLMConfigurationError) as exc_info:
+            ConfigValidator.validate(valid_config)
+        assert "Invalid base_url value" in str(exc_info.value)
+
     def test_case_insensitive_provider(self, valid_config):
         """Test that provider validation is case-insensitive"""
         valid_config.provider = "OPENAI"
@@ -99,3 +99,10 @@ class TestLLMFactory:
             rate_limiter=None
         )
         assert llm == mock_instance
+
+    def test_create_llm_with_base_url(self, openai_config, anthropic_config):
+        """Test that base_url points the chat model at a custom endpoint"""
+        openai_config.base_url = anthropic_config.base_url = "http://127.0.0.1:8080"
+
+        assert LLMFactory.create_llm(openai_config).openai_api_base == "http://127.0.0.1:8080"
+        assert LLMFactory.create_llm(anthropic_config).anthropic_api_url == "http://127.0.0.1:8080"
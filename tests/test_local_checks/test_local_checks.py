@@ -0,0 +1,145 @@
+import asyncio
+import re
+
+import pytest
+
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, InvalidPromptError, LocalCheckError
+from llm_app_test.local_checks.contains_check import Contains, NotContains
+from llm_app_test.local_checks.json_schema_check import JsonSchema
+from llm_app_test.local_checks.length_check import Length
+from llm_app_test.local_checks.markdown_structure_check import MarkdownStructure
+from llm_app_test.local_checks.regex_check import MatchesRegex
+from tests.fake_judge import asserter_with
+
+REPORT = """# Summary
+
+Revenue grew.
+
+## Risks
+
+- Churn
+- Pricing
+
+```python
+# Not a heading
+- not a list item
+```
+
+| Quarter | Revenue |
+| ------- | ------: |
+| Q1      | 10      |
+"""
+
+
+class TestChecks:
+
+    def test_contains(self):
+        assert Contains("refund").check("Your refund is on its way") is None
+        assert Contains("Refund").check("your refund") == "Output does not contain 'Refund'"
+        assert Contains("Refund", case_sensitive=False).check("your REFUND") is None
+
+    def test_not_contains(self):
+        assert NotContains("As an AI").check("Hello!") is None
+        assert NotContains("as an ai", case_sensitive=False).check("As an AI, I cannot") is not None
+
+    def test_regex(self):
+        assert MatchesRegex(r"\border #\d{5}\b").check("Your order #12345 shipped") is None
+        assert MatchesRegex(r"^hello", flags=re.IGNORECASE).check("HELLO there") is None
+        assert MatchesRegex(r"\d+").check("no digits") == r"Output does not match /\d+/"
+
+    def test_invalid_regex(self):
+        with pytest.raises(InvalidPromptError):
+            MatchesRegex("(unclosed")
+
+    @pytest.mark.parametrize("check, actual, passes", [
+        (Length(min_length=5), "Hello", True),
+        (Length(min_length=6), "Hello", False),
+        (Length(max_length=4), "Hello", False),
+        (Length(min_length=2, max_length=3, words=True), "one two three", True),
+        (Length(max_length=2, words=True), "one two three", False),
+    ])
+    def test_length(self, check, actual, passes):
+        assert (check.check(actual) is None) is passes
+
+    @pytest.mark.parametrize("kwargs", [{}, {"min_length": 5, "max_length": 1}])
+    def test_invalid_length(self, kwargs):
+        with pytest.raises(InvalidPromptError):
+            Length(**kwargs)
+
+    def test_json_schema(self):
+        check = JsonSchema({
+            "type": "object",
+            "required": ["name", "tags"],
+            "additionalProperties": False,
+            "properties": {
+                "name": {"type": "string", "minLength": 1},
+                "age": {"type": "integer", "minimum": 0},
+                "tags": {"type": "array", "items": {"enum": ["a", "b"]}, "maxItems": 2}
+            }
+        })
+
+        assert check.check('{"name": "Ada", "age": 36, "tags": ["a"]}') is None
+        assert check.check('```json\n{"name": "Ada", "tags": []}\n```') is None
+        assert check.check('{"name": "Ada"}') == "$ is missing required property 'tags'"
+        assert check.check('{"name": "Ada", "age": 3.5, "tags": []}') == "$.age should be integer, got number"
+        assert check.check('{"name": "Ada", "age": true, "tags": []}') == "$.age should be integer, got boolean"
+        assert check.check('{"name": "Ada", "tags": ["c"]}') == "$.tags[0] should be one of ['a', 'b'], got 'c'"
+        assert check.check('{"name": "Ada", "tags": [], "x": 1}') == "$ has unexpected properties ['x']"
+        assert check.check('{"name": "Ada", "tags": []').startswith("Output is not valid JSON")
+
+    def test_json_without_schema(self):
+        assert JsonSchema().check("[1, 2]") is None
+        assert JsonSchema().check("Sure! Here is the JSON") is not None
+
+    def test_markdown_structure(self):
+        check = MarkdownStructure(required_headings=["summary", "Risks"], min_list_items=2,
+                                  require_code_block=True, require_table=True)
+
+        assert check.check(REPORT) is None
+        assert MarkdownStructure(required_headings=["Not a heading"]).check(REPORT) is not None
+        assert MarkdownStructure(min_list_items=3).check(REPORT) == \
+            "Output has 2 list items, fewer than the minimum of 3"
+        assert MarkdownStructure(require_table=True).check("just text") == "Output has no table"
+        assert MarkdownStructure(require_code_block=True).check("# Title") == "Output has no fenced code block"
+
+
+class TestLocalChecksInAssertions:
+
+    @pytest.fixture
+    def asserter(self):
+        return asserter_with()
+
+    def test_failing_check_skips_llm(self, asserter):
+        with pytest.raises(LocalCheckError) as exc_info:
+            asserter.assert_behavioral_match(
+                "Hi", "A friendly greeting mentioning the refund",
+                local_checks=[Contains("refund"), Length(min_length=10), Length(max_length=100)]
+            )
+
+        assert isinstance(exc_info.value, BehavioralAssertionError)
+        assert exc_info.value.details["local_check_failures"] == [
+            "Output does not contain 'refund'",
+            "Output is 2 characters long, shorter than the minimum of 10"
+        ]
+        assert asserter.llm.calls == 0
+
+    def test_passing_checks_call_llm(self, asserter):
+        asserter.assert_behavioral_match("Your refund is on its way", "Mentions a refund",
+                                         local_checks=[Contains("refund")])
+
+        assert asserter.llm.calls == 1
+
+    def test_async_failing_check_skips_llm(self, asserter):
+        with pytest.raises(LocalCheckError):
+            asyncio.run(asserter.aassert_behavioral_match("not json", "A JSON object", local_checks=[JsonSchema()]))
+
+        assert asserter.llm.calls == 0
+
+    def test_single_check_accepted(self, asserter):
+        with pytest.raises(LocalCheckError):
+            asserter.assert_behavioral_match("Hi", "A greeting", local_checks=Length(min_length=10))
+
+    @pytest.mark.parametrize("local_checks", ["refund", [lambda actual: None], 42])
+    def test_invalid_local_checks(self, asserter, local_checks):
+        with pytest.raises(InvalidPromptError):
+            asserter.assert_behavioral_match("Hi", "A greeting", local_checks=local_checks)
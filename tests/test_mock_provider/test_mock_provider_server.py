@@ -0,0 +1,149 @@
+import asyncio
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, LLMConfigurationError
+from llm_app_test.mock_provider.latency_distribution_enum import LatencyDistribution
+from llm_app_test.mock_provider.mock_provider_config import MockProviderConfig
+from llm_app_test.mock_provider.mock_provider_server import MockProviderServer
+
+
+def greeting_verdict(prompt):
+    return "PASS" if "Hello" in prompt else "FAIL: Output is not a greeting"
+
+
+def post(url, body):
+    request = urllib.request.Request(url, data=json.dumps(body).encode(), headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, dict(response.headers), json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), json.loads(e.read())
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    monkeypatch.delenv('LLM_BASE_URL', raising=False)
+
+
+@pytest.fixture
+def server():
+    with MockProviderServer(MockProviderConfig(verdicts=greeting_verdict)) as mock_provider:
+        yield mock_provider
+
+
+class TestMockProviderServer:
+
+    @pytest.mark.parametrize("provider", ["openai", "anthropic"])
+    def test_scripted_verdicts(self, server, provider):
+        asserter = BehavioralAssertion(api_key="test-key", provider=provider, base_url=server.base_url)
+
+        assert asserter.assert_behavioral_match("Hello there", "A greeting").passed
+        with pytest.raises(BehavioralAssertionError) as exc_info:
+            asserter.assert_behavioral_match("Goodbye", "A greeting")
+
+        assert exc_info.value.reason == "Output is not a greeting"
+        assert server.status_counts == {200: 2}
+
+    @pytest.mark.parametrize("provider", ["openai", "anthropic"])
+    def test_streaming_and_async(self, server, provider):
+        asserter = BehavioralAssertion(api_key="test-key", provider=provider, base_url=server.base_url,
+                                       verdict_mode="streaming")
+
+        assert asserter.assert_behavioral_match("Hello there", "A greeting").passed
+        assert asyncio.run(asserter.aassert_behavioral_match("Hello there", "A greeting")).passed
+
+    def test_verdict_sequence_cycles(self):
+        with MockProviderServer(MockProviderConfig(verdicts=("PASS", "FAIL: second"))) as server:
+            url = f"{server.base_url}/v1/chat/completions"
+            contents = [post(url, {"messages": []})[2]["choices"][0]["message"]["content"] for _ in range(3)]
+
+        assert contents == ["PASS", "FAIL: second", "PASS"]
+
+    @pytest.mark.parametrize("path, error_type", [
+        ("/v1/chat/completions", lambda body: body["error"]["type"]),
+        ("/v1/messages", lambda body: body["error"]["type"])
+    ])
+    def test_rate_limit_injection(self, path, error_type):
+        config = MockProviderConfig(rate_limit_rate=1.0, retry_after_seconds=2)
+        with MockProviderServer(config) as server:
+            status, headers, body = post(server.base_url + path, {"messages": []})
+
+        assert status == 429
+        assert headers["Retry-After"] == "2"
+        assert error_type(body) == "rate_limit_error"
+
+    def test_sdk_retries_honour_retry_after(self):
+        config = MockProviderConfig(status_script=(429, 500), retry_after_seconds=0.2)
+        with MockProviderServer(config) as server:
+            asserter = BehavioralAssertion(api_key="test-key", base_url=server.base_url, max_retries=2)
+
+            assert asserter.assert_behavioral_match("Hello", "A greeting").passed
+            assert server.status_counts == {429: 1, 500: 1, 200: 1}
+
+    def test_latency(self):
+        config = MockProviderConfig(latency_distribution="uniform", latency_seconds=0.1, latency_jitter_seconds=0.05)
+        with MockProviderServer(config) as server:
+            start = time.perf_counter()
+            post(f"{server.base_url}/v1/messages", {"messages": []})
+
+            assert time.perf_counter() - start >= server.total_latency_seconds >= 0.05
+
+    def test_anthropic_prompt_caching(self, server):
+        asserter = BehavioralAssertion(api_key="test-key", provider="anthropic", base_url=server.base_url,
+                                       use_prompt_caching=True)
+
+        spec = "A greeting that names the recipient and mentions the weather. " * 80
+
+        asserter.assert_behavioral_match("Hello there", spec)
+        asserter.assert_behavioral_match("Hello again", spec)
+
+        stats = asserter.prompt_cache_usage.stats
+        assert stats.cache_creation_input_tokens == stats.cache_read_input_tokens > 0
+
+    def test_anthropic_short_prefix_not_cached(self, server):
+        asserter = BehavioralAssertion(api_key="test-key", provider="anthropic", base_url=server.base_url,
+                                       use_prompt_caching=True)
+
+        asserter.assert_behavioral_match("Hello there", "A greeting")
+        asserter.assert_behavioral_match("Hello again", "A greeting")
+
+        stats = asserter.prompt_cache_usage.stats
+        assert stats.cache_creation_input_tokens == stats.cache_read_input_tokens == 0
+        assert stats.input_tokens > 0
+
+    def test_base_url_from_env(self, server, monkeypatch):
+        monkeypatch.setenv('LLM_BASE_URL', server.base_url)
+
+        assert BehavioralAssertion(api_key="test-key").assert_behavioral_match("Hello", "A greeting").passed
+
+    def test_reset(self, server):
+        post(f"{server.base_url}/v1/messages", {"messages": []})
+        server.reset()
+
+        assert server.request_count == 0
+        assert server.status_counts == {}
+
+
+class TestMockProviderConfig:
+
+    def test_distribution_from_string(self):
+        assert MockProviderConfig(latency_distribution="LOGNORMAL").latency_distribution == \
+            LatencyDistribution.LOGNORMAL
+
+    @pytest.mark.parametrize("kwargs", [
+        {"latency_distribution": "pareto"},
+        {"verdicts": ()},
+        {"latency_seconds": -1},
+        {"rate_limit_rate": 0.6, "error_rate": 0.6},
+        {"status_script": (700,)},
+        {"retry_after_seconds": -1}
+    ])
+    def test_invalid_config(self, kwargs):
+        with pytest.raises(LLMConfigurationError):
+            MockProviderConfig(**kwargs)
@@ -0,0 +1,172 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.exceptions.test_exceptions import RateLimiterConfigurationError
+from llm_app_test.rate_limiter.adaptive_rate_limiter import AdaptiveRateLimiter, parse_reset
+from llm_app_test.rate_limiter.adaptive_rate_limiter_callback_handler import AdaptiveRateLimiterCallbackHandler
+from llm_app_test.rate_limiter.rate_limiter_handler import LLMAdaptiveRateLimiter
+from tests.fake_judge import FakeJudge
+
+
+class RateLimitedError(Exception):
+    def __init__(self, status_code: int, headers: dict):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers)
+
+
+class TestAdaptiveRateLimiter:
+
+    @pytest.fixture
+    def limiter(self):
+        return AdaptiveRateLimiter(
+            requests_per_second=1.0,
+            min_requests_per_second=0.25,
+            max_requests_per_second=1.2,
+            additive_increase=0.1,
+            multiplicative_decrease=0.5
+        )
+
+    def test_success_increases_rate_additively(self, limiter):
+        limiter.record_success()
+        limiter.record_success()
+
+        assert limiter.requests_per_second == pytest.approx(1.2)
+
+        limiter.record_success()
+
+        assert limiter.requests_per_second == pytest.approx(1.2)
+
+    def test_rate_limited_decreases_rate_multiplicatively(self, limiter):
+        limiter.record_rate_limited()
+        assert limiter.requests_per_second == pytest.approx(0.5)
+
+        limiter.record_rate_limited()
+        limiter.record_rate_limited()
+        assert limiter.requests_per_second == pytest.approx(0.25)
+
+    def test_retry_after_pauses_bucket(self, limiter):
+        limiter.record_rate_limited(retry_after=30)
+
+        assert limiter.paused_until > time.monotonic() + 29
+        assert limiter.acquire(blocking=False) is False
+
+    def test_exhausted_quota_header_pauses_without_increase(self, limiter):
+        limiter.record_success({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "6m0s"})
+
+        assert limiter.requests_per_second == pytest.approx(1.0)
+        assert limiter.paused_until > time.monotonic() + 359
+
+    def test_remaining_quota_header_allows_increase(self, limiter):
+        limiter.record_success({"anthropic-ratelimit-requests-remaining": "49"})
+
+        assert limiter.requests_per_second == pytest.approx(1.1)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("1s", 1.0), ("6m0s", 360.0), ("250ms", 0.25), ("1h2m", 3720.0), ("2.5", 2.5),
+        ("2025-01-01T00:00:00Z", None), (None, None)
+    ])
+    def test_parse_reset(self, value, expected):
+        assert parse_reset(value) == expected
+
+
+class TestAdaptiveRateLimiterFeedback:
+
+    @pytest.fixture
+    def limiter(self):
+        return AdaptiveRateLimiter(requests_per_second=100, max_bucket_size=100, max_requests_per_second=200)
+
+    def test_callback_feeds_successes_and_429s(self, limiter):
+        model = FakeJudge(
+            answers=["PASS", RateLimitedError(429, {"retry-after": "0"}), "PASS"],
+            rate_limiter=limiter,
+            callbacks=[AdaptiveRateLimiterCallbackHandler(limiter)]
+        )
+
+        model.invoke("hello")
+        assert limiter.requests_per_second == pytest.approx(100.1)
+
+        with pytest.raises(RateLimitedError):
+            model.invoke("hello")
+        assert limiter.requests_per_second == pytest.approx(50.05)
+
+    def test_overloaded_counts_as_rate_limited(self, limiter):
+        handler = AdaptiveRateLimiterCallbackHandler(limiter)
+
+        handler.on_llm_error(RateLimitedError(529, {}))
+
+        assert limiter.requests_per_second == pytest.approx(50)
+
+    def test_other_errors_leave_rate_unchanged(self, limiter):
+        handler = AdaptiveRateLimiterCallbackHandler(limiter)
+
+        handler.on_llm_error(RateLimitedError(500, {"retry-after": "10"}))
+        handler.on_llm_error(ValueError("boom"))
+
+        assert limiter.requests_per_second == 100
+        assert limiter.paused_until == 0.0
+
+
+class TestAdaptiveRateLimiterSelection:
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        for name in ('RATE_LIMITER_BACKEND', 'USE_RATE_LIMITER', 'RATE_LIMITER_MIN_REQUESTS_PER_SECOND',
+                     'RATE_LIMITER_MAX_REQUESTS_PER_SECOND', 'RATE_LIMITER_REQUESTS_PER_SECOND'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+
+    def test_adaptive_backend_openai(self, monkeypatch):
+        monkeypatch.setenv('USE_RATE_LIMITER', 'true')
+        monkeypatch.setenv('RATE_LIMITER_BACKEND', 'adaptive')
+        monkeypatch.setenv('RATE_LIMITER_MAX_REQUESTS_PER_SECOND', '5')
+
+        asserter = BehavioralAssertion()
+
+        assert isinstance(asserter.llm.rate_limiter, AdaptiveRateLimiter)
+        assert asserter.llm.rate_limiter.max_requests_per_second == 5.0
+        assert asserter.llm.include_response_headers is True
+        assert isinstance(asserter.llm.callbacks[0], AdaptiveRateLimiterCallbackHandler)
+        assert asserter.llm.callbacks[0].rate_limiter is asserter.llm.rate_limiter
+
+    def test_adaptive_backend_anthropic(self):
+        asserter = BehavioralAssertion(provider="anthropic", use_rate_limiter=True, rate_limiter_backend="adaptive")
+
+        assert isinstance(asserter.llm.rate_limiter, AdaptiveRateLimiter)
+        assert asserter.llm.callbacks[0].rate_limiter is asserter.llm.rate_limiter
+
+    def test_every_judge_reports_to_the_limiter(self):
+        asserter = BehavioralAssertion(use_rate_limiter=True, rate_limiter_backend="adaptive",
+                                       ensemble_providers=["anthropic"], use_model_cascade=True)
+        limiter = asserter.llm.rate_limiter
+
+        for judge in [asserter.llm, *asserter.ensemble_llms, asserter.model_cascade.llm]:
+            assert judge.rate_limiter is limiter
+            assert [handler.rate_limiter for handler in judge.callbacks] == [limiter]
+        assert asserter.model_cascade.llm.include_response_headers is True
+
+    def test_existing_callbacks_are_kept(self):
+        existing = BaseCallbackHandler()
+        judge = FakeJudge(callbacks=[existing])
+        feedback = AdaptiveRateLimiterCallbackHandler(AdaptiveRateLimiter())
+
+        BehavioralAssertion._add_rate_limiter_feedback(judge, feedback)
+
+        assert judge.callbacks == [existing, feedback]
+
+    def test_starting_rate_clamped_to_bounds(self):
+        limiter = LLMAdaptiveRateLimiter(requests_per_second=50, max_requests_per_second=10).get_rate_limiter
+
+        assert limiter.requests_per_second == 10
+
+    def test_invalid_bounds(self):
+        with pytest.raises(RateLimiterConfigurationError):
+            LLMAdaptiveRateLimiter(min_requests_per_second=5, max_requests_per_second=1)
+
+        with pytest.raises(RateLimiterConfigurationError):
+            LLMAdaptiveRateLimiter(min_requests_per_second=0)
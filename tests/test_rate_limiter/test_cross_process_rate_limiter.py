@@ -0,0 +1,139 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from langchain_core.rate_limiters import InMemoryRateLimiter
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.exceptions.test_exceptions import RateLimiterConfigurationError
+from llm_app_test.rate_limiter.cross_process_rate_limiter import CrossProcessRateLimiter
+from llm_app_test.rate_limiter.rate_limiter_backend_enum import RateLimiterBackend
+from llm_app_test.rate_limiter.rate_limiter_handler import LLMCrossProcessRateLimiter
+
+
+def _acquire_tokens(state_file, count, requests_per_second):
+    limiter = CrossProcessRateLimiter(
+        state_file=state_file,
+        requests_per_second=requests_per_second,
+        check_every_n_seconds=0.01,
+        max_bucket_size=1
+    )
+    for _ in range(count):
+        limiter.acquire()
+
+
+class TestCrossProcessRateLimiter:
+
+    @pytest.fixture
+    def state_file(self, tmp_path):
+        return str(tmp_path / "bucket.state")
+
+    def test_bucket_is_shared_between_instances(self, state_file):
+        first = CrossProcessRateLimiter(state_file=state_file, requests_per_second=0.5, max_bucket_size=1)
+        second = CrossProcessRateLimiter(state_file=state_file, requests_per_second=0.5, max_bucket_size=1)
+
+        # the first call only initialises the bucket, like InMemoryRateLimiter
+        assert first.acquire(blocking=False) is False
+
+        with patch('llm_app_test.rate_limiter.cross_process_rate_limiter.time.time',
+                   return_value=time.time() + 2):
+            assert first.acquire(blocking=False) is True
+            assert second.acquire(blocking=False) is False
+
+    def test_bucket_size_caps_burst(self, state_file):
+        limiter = CrossProcessRateLimiter(state_file=state_file, requests_per_second=1, max_bucket_size=2)
+        limiter.acquire(blocking=False)
+
+        with patch('llm_app_test.rate_limiter.cross_process_rate_limiter.time.time',
+                   return_value=time.time() + 60):
+            assert limiter.acquire(blocking=False) is True
+            assert limiter.acquire(blocking=False) is True
+            assert limiter.acquire(blocking=False) is False
+
+    def test_aacquire_blocks_until_token_available(self, state_file):
+        limiter = CrossProcessRateLimiter(state_file=state_file, requests_per_second=20, check_every_n_seconds=0.01)
+
+        start = time.monotonic()
+        asyncio.run(limiter.aacquire())
+        asyncio.run(limiter.aacquire())
+
+        assert time.monotonic() - start >= 0.05
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_workers_share_one_rate(self, state_file):
+        requests_per_second = 40
+        workers = 3
+        per_worker = 4
+        context = multiprocessing.get_context("fork")
+
+        start = time.monotonic()
+        processes = [
+            context.Process(target=_acquire_tokens, args=(state_file, per_worker, requests_per_second))
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=30)
+        elapsed = time.monotonic() - start
+
+        assert all(process.exitcode == 0 for process in processes)
+        # twelve tokens from one bucket at 40/s cannot take less than ~0.3s;
+        # three independent buckets would finish in ~0.1s
+        assert elapsed >= (workers * per_worker - 1) / requests_per_second * 0.9
+
+
+class TestCrossProcessRateLimiterSelection:
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        for name in ('RATE_LIMITER_BACKEND', 'RATE_LIMITER_STATE_FILE', 'USE_RATE_LIMITER'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+
+    def test_state_file_from_env(self, monkeypatch, tmp_path):
+        state_file = str(tmp_path / "env.state")
+        monkeypatch.setenv('RATE_LIMITER_STATE_FILE', state_file)
+
+        assert LLMCrossProcessRateLimiter().get_rate_limiter.state_file == state_file
+
+    def test_default_backend_is_in_memory(self):
+        asserter = BehavioralAssertion(use_rate_limiter=True)
+
+        assert isinstance(asserter.llm.rate_limiter, InMemoryRateLimiter)
+
+    def test_cross_process_backend_direct(self, tmp_path):
+        state_file = str(tmp_path / "direct.state")
+        asserter = BehavioralAssertion(
+            use_rate_limiter=True,
+            rate_limiter_requests_per_second=3,
+            rate_limiter_backend=RateLimiterBackend.CROSS_PROCESS,
+            rate_limiter_state_file=state_file
+        )
+
+        assert isinstance(asserter.llm.rate_limiter, CrossProcessRateLimiter)
+        assert asserter.llm.rate_limiter.requests_per_second == 3.0
+        assert asserter.llm.rate_limiter.state_file == state_file
+        assert os.path.exists(state_file)
+
+    def test_cross_process_backend_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('USE_RATE_LIMITER', 'true')
+        monkeypatch.setenv('RATE_LIMITER_BACKEND', 'CROSS_PROCESS')
+        monkeypatch.setenv('RATE_LIMITER_STATE_FILE', str(tmp_path / "env.state"))
+
+        asserter = BehavioralAssertion()
+
+        assert isinstance(asserter.llm.rate_limiter, CrossProcessRateLimiter)
+
+    def test_invalid_backend(self):
+        with pytest.raises(RateLimiterConfigurationError) as exc_info:
+            BehavioralAssertion(use_rate_limiter=True, rate_limiter_backend="redis")
+
+        assert "Invalid rate limiter backend" in str(exc_info.value)
+
+    def test_empty_state_file(self):
+        with pytest.raises(RateLimiterConfigurationError):
+            LLMCrossProcessRateLimiter(state_file="  ")
@@ -57,7 +57,7 @@ class TestRateLimiter:
 
     def test_get_rate_limiter_with_limiter_enabled(self, mock_env_variables):
         rate_limiter = LLMInMemoryRateLimiter()
-        with patch('llm_app_test.rate_limiter.rate_limiter_handler.InMemoryRateLimiter', return_value=MagicMock()) as mock_rate_limiter:
+        with patch('llm_app_test.rate_limiter.rate_limiter_handler.MeteredInMemoryRateLimiter', return_value=MagicMock()) as mock_rate_limiter:
             limiter = rate_limiter.get_rate_limiter
             mock_rate_limiter.assert_called_once_with(
                 requests_per_second=rate_limiter.requests_per_second,
@@ -0,0 +1,130 @@
+import asyncio
+from unittest.mock import patch, Mock
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.exceptions.test_exceptions import RateLimiterConfigurationError
+from llm_app_test.rate_limiter.rate_limiter_handler import LLMTokensPerMinuteRateLimiter
+from llm_app_test.rate_limiter.token_estimator import estimate_prompt_tokens
+from llm_app_test.rate_limiter.tokens_per_minute_rate_limiter import TokensPerMinuteRateLimiter
+
+
+class TestTokensPerMinuteRateLimiter:
+
+    def test_bucket_starts_full(self):
+        limiter = TokensPerMinuteRateLimiter(tokens_per_minute=1000)
+
+        assert limiter.acquire(600, blocking=False) is True
+        assert limiter.acquire(600, blocking=False) is False
+        assert limiter.available_tokens == pytest.approx(400, abs=1)
+
+    def test_bucket_refills_per_minute(self):
+        limiter = TokensPerMinuteRateLimiter(tokens_per_minute=600)
+        with patch('llm_app_test.rate_limiter.tokens_per_minute_rate_limiter.time.monotonic', return_value=100.0):
+            limiter.acquire(600)
+
+        # 600 tokens per minute refills 10 tokens per second
+        with patch('llm_app_test.rate_limiter.tokens_per_minute_rate_limiter.time.monotonic', return_value=103.0):
+            assert limiter.acquire(40, blocking=False) is False
+            assert limiter.acquire(30, blocking=False) is True
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        limiter = TokensPerMinuteRateLimiter(tokens_per_minute=100)
+
+        assert limiter.acquire(5000, blocking=False) is True
+        assert limiter.available_tokens == pytest.approx(0, abs=1)
+
+    def test_aacquire_blocks_until_budget_available(self):
+        limiter = TokensPerMinuteRateLimiter(tokens_per_minute=6000, check_every_n_seconds=0.01)
+        limiter.acquire(6000)
+
+        # 100 tokens per second, so 10 tokens take about 0.1s
+        assert asyncio.run(limiter.aacquire(10)) is True
+        assert limiter.available_tokens < 5
+
+
+class TestTokenEstimator:
+
+    def test_estimate_counts_characters_and_messages(self):
+        messages = [SystemMessage(content="a" * 40), HumanMessage(content="b" * 41)]
+
+        assert estimate_prompt_tokens(messages) == 10 + 11 + 2 * 4
+
+    def test_estimate_content_blocks(self):
+        messages = [HumanMessage(content=[{"type": "text", "text": "c" * 8}, {"type": "image_url", "image_url": {}}])]
+
+        assert estimate_prompt_tokens(messages) == 2 + 4
+
+
+class TestTokensPerMinuteConfiguration:
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        for name in ('RATE_LIMITER_TOKENS_PER_MINUTE', 'USE_RATE_LIMITER', 'RATE_LIMITER_BACKEND'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+
+    def test_disabled_by_default(self):
+        assert LLMTokensPerMinuteRateLimiter().get_rate_limiter is None
+        assert BehavioralAssertion(use_rate_limiter=True).token_rate_limiter is None
+
+    def test_tokens_per_minute_from_env(self, monkeypatch):
+        monkeypatch.setenv('USE_RATE_LIMITER', 'true')
+        monkeypatch.setenv('RATE_LIMITER_TOKENS_PER_MINUTE', '30000')
+
+        asserter = BehavioralAssertion()
+
+        assert asserter.token_rate_limiter.tokens_per_minute == 30000.0
+
+    def test_direct_override(self, monkeypatch):
+        monkeypatch.setenv('RATE_LIMITER_TOKENS_PER_MINUTE', '30000')
+
+        asserter = BehavioralAssertion(use_rate_limiter=True, rate_limiter_tokens_per_minute=500)
+
+        assert asserter.token_rate_limiter.tokens_per_minute == 500.0
+
+    def test_not_used_without_rate_limiter(self, monkeypatch):
+        monkeypatch.setenv('RATE_LIMITER_TOKENS_PER_MINUTE', '30000')
+
+        assert BehavioralAssertion().token_rate_limiter is None
+
+    def test_invalid_tokens_per_minute(self):
+        with pytest.raises(RateLimiterConfigurationError):
+            BehavioralAssertion(use_rate_limiter=True, rate_limiter_tokens_per_minute=-1)
+
+
+class TestTokensPerMinuteCharging:
+
+    @pytest.fixture
+    def asserter(self, monkeypatch):
+        monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+        asserter = BehavioralAssertion(use_rate_limiter=True, rate_limiter_tokens_per_minute=100000)
+        asserter.llm = RunnableLambda(lambda messages: AIMessage(content="PASS"))
+        asserter.token_rate_limiter = Mock(wraps=asserter.token_rate_limiter)
+        return asserter
+
+    def test_single_assertion_charged_before_invoke(self, asserter):
+        asserter.assert_behavioral_match("actual output", "expected behavior")
+
+        charged = asserter.token_rate_limiter.acquire.call_args.args[0]
+        assert charged == estimate_prompt_tokens(asserter._build_messages("actual output", "expected behavior"))
+
+    def test_long_actual_charged_more(self, asserter):
+        asserter.assert_behavioral_match("short", "expected behavior")
+        asserter.assert_behavioral_match("long " * 2000, "expected behavior")
+
+        short_charge, long_charge = [call.args[0] for call in asserter.token_rate_limiter.acquire.call_args_list]
+        assert long_charge - short_charge >= 2000
+
+    def test_batch_charges_each_request(self, asserter):
+        asserter.assert_behavioral_matches([("a", "b"), ("c", "d"), ("e", "f")])
+
+        assert asserter.token_rate_limiter.acquire.call_count == 3
+
+    def test_async_assertion_charged(self, asserter):
+        asyncio.run(asserter.aassert_behavioral_match("actual output", "expected behavior"))
+
+        assert asserter.token_rate_limiter.aacquire.call_count == 1
@@ -0,0 +1,151 @@
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.language_models import BaseLanguageModel
+
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError, VerdictCacheConfigurationError
+from llm_app_test.verdict_cache import in_memory_verdict_cache
+from llm_app_test.verdict_cache.in_memory_verdict_cache import (
+    InMemoryVerdictCache,
+    get_shared_verdict_cache,
+    reset_shared_verdict_cache
+)
+
+
+class TestInMemoryVerdictCache:
+    """Test suite for the process-wide in-memory verdict cache"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_shared_cache(self):
+        reset_shared_verdict_cache()
+        yield
+        reset_shared_verdict_cache()
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock_llm = Mock(spec=BaseLanguageModel)
+        mock_llm.invoke.return_value = Mock(content="PASS")
+        return mock_llm
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted as hits or misses"""
+        cache = InMemoryVerdictCache(max_size=10, ttl_seconds=0)
+        cache.set("key", Verdict(passed=True))
+
+        assert cache.get("key") == Verdict(passed=True)
+        assert cache.get("other") is None
+
+        stats = cache.stats
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.size == 1
+        assert stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = InMemoryVerdictCache(max_size=2, ttl_seconds=0)
+        cache.set("a", Verdict(passed=True))
+        cache.set("b", Verdict(passed=True))
+        cache.get("a")
+        cache.set("c", Verdict(passed=True))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are dropped"""
+        cache = InMemoryVerdictCache(max_size=10, ttl_seconds=5)
+
+        with patch.object(in_memory_verdict_cache.time, 'monotonic', return_value=100.0):
+            cache.set("key", Verdict(passed=True))
+        with patch.object(in_memory_verdict_cache.time, 'monotonic', return_value=104.0):
+            assert cache.get("key") is not None
+        with patch.object(in_memory_verdict_cache.time, 'monotonic', return_value=106.0):
+            assert cache.get("key") is None
+
+        assert cache.stats.expirations == 1
+        assert cache.stats.size == 0
+
+    def test_shared_cache_is_process_wide(self):
+        """Test that every caller receives the same cache instance"""
+        assert get_shared_verdict_cache() is get_shared_verdict_cache()
+
+    def test_shared_across_asserter_instances(self, mock_llm):
+        """Test that a verdict judged by one instance is reused by another"""
+        BehavioralAssertion(llm=mock_llm, use_in_memory_verdict_cache=True).assert_behavioral_match(
+            "Hello Alice", "A greeting")
+        second = BehavioralAssertion(llm=mock_llm, use_in_memory_verdict_cache=True)
+        second.assert_behavioral_match("Hello Alice", "A greeting")
+
+        assert mock_llm.invoke.call_count == 1
+        assert second.in_memory_verdict_cache.stats.hits == 1
+
+    def test_cached_fail_raises_with_original_reason(self, mock_llm):
+        """Test that cached failures raise with the reason from the original judgement"""
+        mock_llm.invoke.return_value = Mock(content="FAIL: Not a greeting")
+        asserter = BehavioralAssertion(llm=mock_llm, use_in_memory_verdict_cache=True)
+
+        for _ in range(2):
+            with pytest.raises(BehavioralAssertionError) as excinfo:
+                asserter.assert_behavioral_match("Goodbye", "A greeting")
+            assert excinfo.value.reason == "Not a greeting"
+
+        assert mock_llm.invoke.call_count == 1
+
+    def test_disabled_by_default(self, mock_llm):
+        """Test that the in-memory cache is not used unless requested"""
+        with patch.dict(os.environ, {}, clear=True):
+            asserter = BehavioralAssertion(llm=mock_llm)
+            asserter.assert_behavioral_match("Hello", "A greeting")
+            asserter.assert_behavioral_match("Hello", "A greeting")
+
+        assert asserter.in_memory_verdict_cache is None
+        assert mock_llm.invoke.call_count == 2
+
+    def test_env_configuration(self, mock_llm):
+        """Test that the in-memory cache can be configured through environment variables"""
+        env_vars = {
+            'USE_IN_MEMORY_VERDICT_CACHE': 'true',
+            'IN_MEMORY_VERDICT_CACHE_MAX_SIZE': '16',
+            'IN_MEMORY_VERDICT_CACHE_TTL_SECONDS': '30'
+        }
+        with patch.dict(os.environ, env_vars, clear=True):
+            asserter = BehavioralAssertion(llm=mock_llm)
+
+        assert asserter.in_memory_verdict_cache.max_size == 16
+        assert asserter.in_memory_verdict_cache.ttl_seconds == 30.0
+
+    def test_sits_in_front_of_persistent_cache(self, mock_llm, tmp_path):
+        """Test that persistent cache hits are promoted into the in-memory cache"""
+        cache_path = str(tmp_path / "verdicts.sqlite3")
+        BehavioralAssertion(llm=mock_llm, use_verdict_cache=True, verdict_cache_path=cache_path) \
+            .assert_behavioral_match("Hello", "A greeting")
+
+        asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True, verdict_cache_path=cache_path,
+                                       use_in_memory_verdict_cache=True)
+        asserter.assert_behavioral_match("Hello", "A greeting")
+        asserter.assert_behavioral_match("Hello", "A greeting")
+
+        stats = asserter.in_memory_verdict_cache.stats
+        assert mock_llm.invoke.call_count == 1
+        assert stats.misses == 1
+        assert stats.hits == 1
+
+    @pytest.mark.parametrize("max_size", ["abc", 0, -1])
+    def test_invalid_max_size(self, mock_llm, max_size):
+        """Test that invalid cache sizes are rejected"""
+        with pytest.raises(VerdictCacheConfigurationError):
+            BehavioralAssertion(llm=mock_llm, use_in_memory_verdict_cache=True,
+                                in_memory_verdict_cache_max_size=max_size)
+
+    @pytest.mark.parametrize("ttl_seconds", ["abc", -1])
+    def test_invalid_ttl(self, mock_llm, ttl_seconds):
+        """Test that invalid TTL values are rejected"""
+        with pytest.raises(VerdictCacheConfigurationError):
+            BehavioralAssertion(llm=mock_llm, use_in_memory_verdict_cache=True,
+                                in_memory_verdict_cache_ttl_seconds=ttl_seconds)
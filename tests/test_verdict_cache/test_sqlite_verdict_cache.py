@@ -0,0 +1,173 @@
+import os
+import sqlite3
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.language_models import BaseLanguageModel
+
+from llm_app_test.behavioral_assert.asserter_prompts.asserter_prompt_configurator import AsserterPromptConfigurator
+from llm_app_test.behavioral_assert.behavioral_assert import BehavioralAssertion
+from llm_app_test.behavioral_assert.verdict.verdict import Verdict
+from llm_app_test.exceptions.test_exceptions import BehavioralAssertionError
+from llm_app_test.verdict_cache.sqlite_verdict_cache import SQLiteVerdictCache
+from llm_app_test.verdict_cache.verdict_cache_key import VerdictCacheKey
+
+
+class TestSQLiteVerdictCache:
+    """Test suite for the persistent SQLite verdict cache"""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        return str(tmp_path / "cache" / "verdicts.sqlite3")
+
+    @pytest.fixture
+    def mock_llm(self):
+        mock_llm = Mock(spec=BaseLanguageModel)
+        mock_llm.invoke.return_value = Mock(content="PASS")
+        return mock_llm
+
+    def test_round_trip(self, cache_path):
+        """Test that stored verdicts are returned unchanged"""
+        cache = SQLiteVerdictCache(cache_path)
+
+        cache.set("pass-key", Verdict(passed=True))
+        cache.set("fail-key", Verdict(passed=False, reason="Not a greeting"))
+
+        assert cache.get("pass-key") == Verdict(passed=True)
+        assert cache.get("fail-key") == Verdict(passed=False, reason="Not a greeting")
+        assert cache.get("missing-key") is None
+
+    def test_round_trip_confidence(self, cache_path):
+        """Test that the confidence of a verdict is stored with it"""
+        cache = SQLiteVerdictCache(cache_path)
+
+        cache.set("key", Verdict(passed=True, confidence=0.875))
+
+        assert cache.get("key") == Verdict(passed=True, confidence=0.875)
+
+    def test_round_trip_votes(self, cache_path):
+        """Test that the vote tally of a voted verdict is stored with it"""
+        cache = SQLiteVerdictCache(cache_path)
+
+        cache.set("key", Verdict(passed=False, reason="Not a greeting", confidence=0.6, votes=(1, 3)))
+
+        assert cache.get("key") == Verdict(passed=False, reason="Not a greeting", confidence=0.6, votes=(1, 3))
+        assert SQLiteVerdictCache(cache_path).get("key").votes == (1, 3)
+
+    def test_upgrades_earlier_schema(self, cache_path):
+        """Test that a cache file written before the confidence column existed is upgraded in place"""
+        os.makedirs(os.path.dirname(cache_path))
+        connection = sqlite3.connect(cache_path)
+        connection.execute("CREATE TABLE verdicts (key TEXT PRIMARY KEY, passed INTEGER NOT NULL, reason TEXT, "
+                           "created_at REAL NOT NULL)")
+        connection.execute("INSERT INTO verdicts VALUES ('old-key', 0, 'Not a greeting', 0)")
+        connection.commit()
+        connection.close()
+
+        cache = SQLiteVerdictCache(cache_path)
+        cache.set("new-key", Verdict(passed=True, confidence=0.5))
+
+        assert cache.get("old-key") == Verdict(passed=False, reason="Not a greeting")
+        assert cache.get("new-key") == Verdict(passed=True, confidence=0.5)
+        assert SQLiteVerdictCache(cache_path).get("new-key").confidence == 0.5
+        cache.set("voted-key", Verdict(passed=True, votes=(2, 0)))
+        assert cache.get("voted-key").votes == (2, 0)
+
+    def test_persists_across_instances(self, cache_path):
+        """Test that a second cache instance sees verdicts written by the first"""
+        SQLiteVerdictCache(cache_path).set("key", Verdict(passed=False, reason="reason"))
+
+        assert SQLiteVerdictCache(cache_path).get("key") == Verdict(passed=False, reason="reason")
+
+    def test_uses_wal_journal_mode(self, cache_path):
+        """Test that the database is opened in WAL mode for multi-process access"""
+        cache = SQLiteVerdictCache(cache_path)
+
+        journal_mode = cache._connection().execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert journal_mode == "wal"
+
+    def test_clear(self, cache_path):
+        """Test that clear removes all verdicts"""
+        cache = SQLiteVerdictCache(cache_path)
+        cache.set("key", Verdict(passed=True))
+
+        cache.clear()
+
+        assert cache.get("key") is None
+
+    def test_cache_disabled_by_default(self, mock_llm):
+        """Test that no verdict cache is created unless requested"""
+        with patch.dict(os.environ, {}, clear=True):
+            asserter = BehavioralAssertion(llm=mock_llm)
+
+        assert asserter.verdict_cache is None
+
+    def test_cache_enabled_from_env(self, mock_llm, cache_path):
+        """Test that the verdict cache can be enabled through environment variables"""
+        with patch.dict(os.environ, {'USE_VERDICT_CACHE': 'true', 'VERDICT_CACHE_PATH': cache_path}, clear=True):
+            asserter = BehavioralAssertion(llm=mock_llm)
+
+        assert isinstance(asserter.verdict_cache, SQLiteVerdictCache)
+        assert asserter.verdict_cache.path == cache_path
+
+    def test_cached_pass_skips_llm(self, mock_llm, cache_path):
+        """Test that a repeated judgement is served from the cache"""
+        asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True, verdict_cache_path=cache_path)
+
+        asserter.assert_behavioral_match("Hello Alice", "A greeting")
+        asserter.assert_behavioral_match("Hello Alice", "A greeting")
+
+        assert mock_llm.invoke.call_count == 1
+
+    def test_cached_fail_raises_with_original_reason(self, mock_llm, cache_path):
+        """Test that a cached failure still raises BehavioralAssertionError with the stored reason"""
+        mock_llm.invoke.return_value = Mock(content="FAIL: The output is not a greeting")
+        asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True, verdict_cache_path=cache_path)
+
+        with pytest.raises(BehavioralAssertionError):
+            asserter.assert_behavioral_match("Goodbye", "A greeting")
+
+        fresh_asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True, verdict_cache_path=cache_path)
+
+        with pytest.raises(BehavioralAssertionError) as excinfo:
+            fresh_asserter.assert_behavioral_match("Goodbye", "A greeting")
+
+        assert excinfo.value.reason == "The output is not a greeting"
+        assert mock_llm.invoke.call_count == 1
+
+    def test_different_inputs_miss_cache(self, mock_llm, cache_path):
+        """Test that changing either input results in a new judgement"""
+        asserter = BehavioralAssertion(llm=mock_llm, use_verdict_cache=True, verdict_cache_path=cache_path)
+
+        asserter.assert_behavioral_match("Hello Alice", "A greeting")
+        asserter.assert_behavioral_match("Hello Bob", "A greeting")
+        asserter.assert_behavioral_match("Hello Bob", "A greeting to Bob")
+
+        assert mock_llm.invoke.call_count == 3
+
+    def test_custom_prompts_miss_cache(self, mock_llm, cache_path):
+        """Test that different asserter prompts do not share cached verdicts"""
+        BehavioralAssertion(
+            llm=mock_llm, use_verdict_cache=True, verdict_cache_path=cache_path
+        ).assert_behavioral_match("Hello", "A greeting")
+
+        BehavioralAssertion(
+            llm=mock_llm,
+            use_verdict_cache=True,
+            verdict_cache_path=cache_path,
+            custom_prompts=AsserterPromptConfigurator(system_prompt="Respond with PASS or FAIL: <reason>")
+        ).assert_behavioral_match("Hello", "A greeting")
+
+        assert mock_llm.invoke.call_count == 2
+
+    def test_key_covers_model_configuration(self):
+        """Test that provider, model and temperature all feed the cache key"""
+        base = {"provider": "openai", "model": "gpt-4o", "temperature": 0.0}
+        key = VerdictCacheKey.build(base, "system", "human", "actual", "expected")
+
+        for field, value in (("provider", "anthropic"), ("model", "gpt-4-turbo"), ("temperature", 0.5)):
+            changed = dict(base, **{field: value})
+            assert VerdictCacheKey.build(changed, "system", "human", "actual", "expected") != key
+
+        assert VerdictCacheKey.build(dict(base), "system", "human", "actual", "expected") == key